@@ -40,6 +40,9 @@ import sys
 from ._version import __version_info__, __version__
 
 from . import generators
+from .cache import DiskCache, CacheAdapter, default_directory
+from .mirror import default_mirror
+from .store import default_store
 from .base import *
 from .client import *
 from .sequence import *
@@ -67,16 +70,24 @@ def _module_getattr_(a_, oeis_, file):
     return inner
 
 
-def get_custom_session():
-    """"""
+def get_custom_session(cache_directory=None):
+    """
+    Make Session, with a Persistent HTTP Cache if a Cache Directory is Given.
+
+    Without `cache_directory`, the directory named by `OEIS_CACHE_DIR` is used and
+    if it is unset, nothing is written to disk. Plain client calls made without this
+    session are never cached.
+
+    """
     if REQUESTS_SUPPORT:
         import requests
 
         session = requests.Session()
-        if CACHE_CONTROL_SUPPORT:
-            from cachecontrol import CacheControl
-
-            return CacheControl(session)
+        cache_directory = value_or(cache_directory, default_directory())
+        if cache_directory:
+            adapter = CacheAdapter(DiskCache(cache_directory))
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
         return session
     return None
 
@@ -91,7 +102,15 @@ def build_generators(generator_list, oeis_):
 
 def setup_module(generator_list, file, *, a_=None, oeis_=None):
     """"""
-    a_ = value_or(a_, SequenceFactory(always_cache=True, session=get_custom_session()))
+    a_ = value_or(
+        a_,
+        SequenceFactory(
+            always_cache=True,
+            session=get_custom_session(),
+            mirror=default_mirror(),
+            store=default_store(),
+        ),
+    )
     oeis_ = value_or(oeis_, Registry.from_factory(a_))
 
     build_generators(generator_list, oeis_)
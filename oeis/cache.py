@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*- #
+#
+# oeis/cache.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""
+Persistent HTTP Cache.
+
+"""
+
+# -------------- Standard Library -------------- #
+
+import io
+import os
+import json
+import time
+import hashlib
+import tempfile
+from shutil import rmtree
+
+# ---------------- oeis Library ---------------- #
+
+from .util import import_package
+
+
+__all__ = ("CACHE_DIRECTORY_VARIABLE", "default_directory", "DiskCache", "CacheAdapter")
+
+
+requests, REQUESTS_SUPPORT = import_package("requests")
+
+
+if REQUESTS_SUPPORT:
+    from requests.adapters import HTTPAdapter
+    from requests.utils import get_encoding_from_headers
+else:
+    HTTPAdapter = object
+
+
+CACHE_DIRECTORY_VARIABLE = "OEIS_CACHE_DIR"
+
+
+_STORED_KEY = "x-oeis-stored"
+
+
+_UNSTORED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+def default_directory():
+    """Get Cache Directory named by the Environment, or None if Caching is Off."""
+    return os.environ.get(CACHE_DIRECTORY_VARIABLE) or None
+
+
+def _atomic_write(path, data):
+    """Write Bytes to Path Atomically."""
+    descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path))
+    try:
+        with os.fdopen(descriptor, "wb") as f:
+            f.write(data)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+class DiskCache:
+    """
+    On-Disk Store of HTTP Responses with their Validators.
+
+    """
+
+    def __init__(self, directory, *, max_age=0):
+        """
+        Initialize Disk Cache.
+
+        :param directory:
+        :param max_age:
+        """
+        self.directory = os.path.expanduser(str(directory))
+        self.max_age = max_age
+
+    def _path(self, url):
+        """
+        Get Storage Path Prefix for URL.
+
+        :param url:
+        :return:
+        """
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest)
+
+    def get(self, url):
+        """
+        Get Stored Headers and Body for URL.
+
+        :param url:
+        :return:
+        """
+        path = self._path(url)
+        try:
+            with open(path + ".json") as f:
+                headers = json.load(f)
+            with open(path + ".body", "rb") as f:
+                return headers, f.read()
+        except (OSError, ValueError):
+            return None
+
+    def set(self, url, headers, body):
+        """
+        Store Headers and Body for URL.
+
+        :param url:
+        :param headers:
+        :param body:
+        :return:
+        """
+        path = self._path(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        _atomic_write(path + ".body", body)
+        self._write_headers(path, headers)
+
+    def _write_headers(self, path, headers):
+        """
+        Write Normalized Headers with the Current Storage Time.
+
+        :param path:
+        :param headers:
+        :return:
+        """
+        headers = {
+            k.lower(): v
+            for k, v in headers.items()
+            if k.lower() not in _UNSTORED_HEADERS
+        }
+        headers[_STORED_KEY] = str(time.time())
+        _atomic_write(path + ".json", json.dumps(headers).encode("utf-8"))
+
+    def touch(self, url, headers):
+        """
+        Mark Stored Response as Freshly Revalidated.
+
+        :param url:
+        :param headers:
+        :return:
+        """
+        self._write_headers(self._path(url), headers)
+
+    def is_fresh(self, headers):
+        """
+        Check if Stored Response can be Served without Revalidation.
+
+        :param headers:
+        :return:
+        """
+        stored = float(headers.get(_STORED_KEY, 0))
+        return time.time() - stored < self.max_age
+
+    def delete(self, url):
+        """
+        Delete Stored Response for URL.
+
+        :param url:
+        :return:
+        """
+        path = self._path(url)
+        for suffix in (".json", ".body"):
+            try:
+                os.unlink(path + suffix)
+            except FileNotFoundError:
+                pass
+
+    def clear(self):
+        """
+        Clear Cache Directory.
+
+        :return:
+        """
+        rmtree(self.directory, ignore_errors=True)
+
+
+class CacheAdapter(HTTPAdapter):
+    """
+    Transport Adapter Revalidating Cached Responses with Conditional Requests.
+
+    Only sessions the adapter is mounted on are cached, like the session made by
+    `oeis.get_custom_session`. Fetches without a session go straight to the network.
+
+    """
+
+    def __init__(self, cache, *args, **kwargs):
+        """
+        Initialize Cache Adapter.
+
+        :param cache:
+        :param args:
+        :param kwargs:
+        """
+        super().__init__(*args, **kwargs)
+        self.cache = cache
+
+    def build_cached_response(self, request, headers, body):
+        """
+        Build Response from Stored Headers and Body.
+
+        :param request:
+        :param headers:
+        :param body:
+        :return:
+        """
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers.update((k, v) for k, v in headers.items() if k != _STORED_KEY)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.raw = io.BytesIO(body)
+        response._content = body
+        response._content_consumed = True
+        return response
+
+    def send(self, request, stream=False, **kwargs):
+        """
+        Send Request, Serving or Revalidating Cached Responses.
+
+        Streamed responses are revalidated and served from the cache but never
+        stored, so streaming consumers can still close the connection early.
+
+        :param request:
+        :param stream:
+        :param kwargs:
+        :return:
+        """
+        if request.method != "GET":
+            return super().send(request, stream=stream, **kwargs)
+        stored = self.cache.get(request.url)
+        if stored:
+            headers, body = stored
+            if self.cache.is_fresh(headers):
+                return self.build_cached_response(request, headers, body)
+            if "etag" in headers:
+                request.headers["If-None-Match"] = headers["etag"]
+            if "last-modified" in headers:
+                request.headers["If-Modified-Since"] = headers["last-modified"]
+        response = super().send(request, stream=stream, **kwargs)
+        if stored and response.status_code == 304:
+            response.close()
+            headers.update((k.lower(), v) for k, v in response.headers.items())
+            self.cache.touch(request.url, headers)
+            return self.build_cached_response(request, headers, body)
+        if response.status_code == 200 and not stream:
+            validators = ("ETag", "Last-Modified")
+            if self.cache.max_age or any(v in response.headers for v in validators):
+                self.cache.set(request.url, response.headers, response.content)
+        return response
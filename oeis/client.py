@@ -31,12 +31,29 @@ Client Interface to OEIS.
 
 """
 
+# -------------- Standard Library -------------- #
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import sys
+import json
+import time
+import asyncio
+from functools import partial
+from itertools import chain, islice
+
+# -------------- External Library -------------- #
+
 from wrapt import ObjectProxy
 
 # ---------------- oeis Library ---------------- #
 
 from .base import name as oeis_name
-from .util import import_package, getattrmethod, BoxObject, subset_box
+from .search import parse_terms
+from .terms import TermArray, load_terms, parse_int
+from .limiter import RETRY_STATUS, RateLimiter, backoff, parse_retry_after
+from .util import import_package, getattrmethod, grouped, value_or
+from .util import SingleFlight, AsyncSingleFlight
+from .util import Box, BoxObject, subset_box
 
 
 __all__ = (
@@ -45,8 +62,16 @@ __all__ = (
     "CACHE_CONTROL_SUPPORT",
     "AIOHTTP_SUPPORT",
     "QUERY_FORMAT",
+    "QUERY_PAGE_FORMAT",
+    "QUERY_PAGE_SIZE",
     "ENTRY_FORMAT",
+    "ENTRY_BATCH_SIZE",
     "BFILE_FORMAT",
+    "BFILE_WORKERS",
+    "BFILE_CHUNK_SIZE",
+    "BFILE_PROBE_SIZE",
+    "RATE_LIMITER",
+    "MAX_RETRIES",
     "fetch",
     "afetch",
     "MISSING_PAGE_TEXT",
@@ -54,11 +79,22 @@ __all__ = (
     "FAILED_SEARCH_TEXT",
     "is_no_match",
     "query",
+    "query_iter",
     "entry",
+    "entries",
     "exists",
     "bfile",
+    "bfiles",
+    "bfile_stream",
     "bfile_exists",
+    "aquery",
+    "aquery_iter",
+    "aentry",
+    "aexists",
+    "abfile",
+    "abfile_exists",
     "Session",
+    "AsyncSession",
 )
 
 
@@ -77,12 +113,51 @@ aiohttp, AIOHTTP_SUPPORT = import_package("aiohttp")
 QUERY_FORMAT = "https://oeis.org/search?q={0}&fmt=json"
 
 
+QUERY_PAGE_FORMAT = "https://oeis.org/search?q={0}&fmt=json&start={1}"
+
+
+QUERY_PAGE_SIZE = 10
+
+
 ENTRY_FORMAT = "https://oeis.org/search?q=id:{0}&fmt=json"
 
 
+ENTRY_BATCH_SIZE = 50
+
+
 BFILE_FORMAT = "https://oeis.org/A{0}/b{0}.txt"
 
 
+BFILE_WORKERS = 8
+
+
+BFILE_CHUNK_SIZE = 16 * 1024
+
+
+BFILE_PROBE_SIZE = 4 * 1024
+
+
+RATE_LIMITER = RateLimiter()
+
+
+MAX_RETRIES = 5
+
+
+_IN_FLIGHT = SingleFlight(copy=True)
+
+
+_ASYNC_IN_FLIGHT = AsyncSingleFlight(copy=True)
+
+
+_LOOP_SESSIONS = {}
+
+
+if sys.version_info >= (3, 7):
+    _running_loop = asyncio.get_running_loop
+else:
+    _running_loop = asyncio.get_event_loop
+
+
 def get_text(response):
     """
     Get Text from Response.
@@ -103,71 +178,170 @@ def get_json(response):
     return getattrmethod(response, "json", "")
 
 
-def _fetch(url, session, *, as_json=False):
+def _retry_delay(response, limiter, attempt, retries):
+    """
+    Get Delay before Retrying Response, or None if it should not be Retried.
+
+    Once retries are exhausted, the error status of the last response is raised.
+
+    :param response:
+    :param limiter:
+    :param attempt:
+    :param retries:
+    :return:
+    """
+    status = getattr(response, "status_code", getattr(response, "status", None))
+    if status not in RETRY_STATUS:
+        limiter.success()
+        return None
+    headers = getattr(response, "headers", {})
+    retry_after = limiter.throttled(parse_retry_after(headers.get("Retry-After")))
+    if attempt >= retries:
+        response.raise_for_status()
+        return None
+    return max(backoff(attempt), retry_after)
+
+
+def _fetch(url, session, *, as_json=False, limiter=None, retries=MAX_RETRIES):
     """
     Fetch URL Content via Session.
 
+    Requests are paced by the rate limiter and retried with jittered exponential
+    backoff when the server throttles or fails. A server still failing after the
+    last retry raises an HTTP error instead of returning the error page.
+
     :param url:
     :param session:
     :param as_json:
+    :param limiter:
+    :param retries:
     :return:
     """
-    with session.get(url) as response:
-        return get_json(response) if as_json else get_text(response)
+    limiter = value_or(limiter, RATE_LIMITER)
+    for attempt in range(retries + 1):
+        limiter.acquire()
+        with session.get(url) as response:
+            delay = _retry_delay(response, limiter, attempt, retries)
+            if delay is None:
+                return get_json(response) if as_json else get_text(response)
+        time.sleep(delay)
 
 
-async def _afetch(url, session, *, as_json=False):
+async def _afetch(url, session, *, as_json=False, limiter=None, retries=MAX_RETRIES):
     """
     Asynchronously Fetch URL Content via Session.
 
     :param url:
     :param session:
     :param as_json:
+    :param limiter:
+    :param retries:
+    :return:
+    """
+    limiter = value_or(limiter, RATE_LIMITER)
+    for attempt in range(retries + 1):
+        await limiter.aacquire()
+        async with session.get(url) as response:
+            delay = _retry_delay(response, limiter, attempt, retries)
+            if delay is None:
+                return await (get_json(response) if as_json else get_text(response))
+        await asyncio.sleep(delay)
+
+
+def _flight_key(url, session, kwargs):
+    """
+    Get Key Identifying Fetches that can Share a Single Request.
+
+    :param url:
+    :param session:
+    :param kwargs:
     :return:
     """
-    async with session.get(url) as response:
-        return await get_json(response) if as_json else get_text(response)
+    return (
+        url,
+        id(session),
+        kwargs.get("as_json", False),
+        id(kwargs.get("limiter")),
+        kwargs.get("retries"),
+    )
 
 
-def _requests_fetch(url, session=requests, *args, **kwargs):
+def _requests_fetch(url, session=None, *args, **kwargs):
     """
     Default _requests_ Fetch.
 
+    Concurrent fetches of the same URL with the same session and settings share a
+    single request.
+
     :param url:
     :param session:
     :param args:
     :param kwargs:
     :return:
     """
-    return _fetch(url, session, *args, **kwargs)
+    session = value_or(session, requests)
+    key = _flight_key(url, session, kwargs)
+    return _IN_FLIGHT.do(key, _fetch, url, session, *args, **kwargs)
 
 
-class _aiohttp_mock_client_session:
-    """Imitated _requests_ Get API."""
+async def _close_on_shutdown(key, session):
+    """
+    Close Loop Session once the Event Loop Shuts Down its Asynchronous Generators.
 
-    async def get(*args, **kwargs):
-        """
-        Asynchronous Get.
+    :param key:
+    :param session:
+    :return:
+    """
+    try:
+        yield
+    finally:
+        if _LOOP_SESSIONS.get(key, (None,))[0] is session:
+            del _LOOP_SESSIONS[key]
+        await session.close()
 
-        :param args:
-        :param kwargs:
-        :return:
-        """
-        async with aiohttp.ClientSession() as session:
-            return await session.get(*args, **kwargs)
 
+async def _loop_session():
+    """
+    Get Pooled Session Shared by Fetches on the Running Event Loop.
+
+    The session is opened on first use and closed when the loop shuts down its
+    asynchronous generators, as `asyncio.run` does on exit.
 
-async def _aiohttp_afetch(url, session=_aiohttp_mock_client_session(), *args, **kwargs):
+    :return:
+    """
+    key = id(_running_loop())
+    session, _ = _LOOP_SESSIONS.get(key, (None, None))
+    if session is None or session.closed:
+        session = AsyncSession.pooled()
+        closer = _close_on_shutdown(key, session)
+        _LOOP_SESSIONS[key] = session, closer
+        await closer.asend(None)
+    return session
+
+
+async def _aiohttp_afetch(url, session=None, *args, **kwargs):
     """
     Default _aiohttp_ Asynchronous Fetch.
 
+    Without a session, the pooled session of the running event loop is used, so
+    connections are reused across requests on the same loop. Concurrent fetches of
+    the same URL with the same session and settings on the same event loop share a
+    single request.
+
     :param url:
     :param session:
     :param args:
     :param kwargs:
     :return:
     """
-    return await _afetch(url, session, *args, **kwargs)
+
+    async def fetch_with(session):
+        if session is None:
+            session = await _loop_session()
+        return await _afetch(url, session, *args, **kwargs)
+
+    key = (id(_running_loop()),) + _flight_key(url, session, kwargs)
+    return await _ASYNC_IN_FLIGHT.do(key, fetch_with, session)
 
 
 fetch = _requests_fetch if REQUESTS_SUPPORT else _fetch
@@ -176,6 +350,20 @@ fetch = _requests_fetch if REQUESTS_SUPPORT else _fetch
 afetch = _aiohttp_afetch if AIOHTTP_SUPPORT else _afetch
 
 
+def _pooled_session(pool_size):
+    """
+    Make _requests_ Session with a Connection Pool of the Given Size.
+
+    :param pool_size:
+    :return:
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def _fetch_formatted(url, value, *args, as_json=False, **kwargs):
     """
     Fetch Content from Formatted URL.
@@ -240,51 +428,272 @@ def is_no_match(html):
     return any(FAILED_SEARCH_TEXT[0] in line for line in html.strip().split("\n"))
 
 
-def query(term, *args, **kwargs):
+def query(term, *args, index=None, **kwargs):
     """
     Search OEIS for Given Term.
 
+    With a local search index, searches for runs of terms are answered locally with
+    the first page of results in the shape of the OEIS JSON search.
+
     :param term:
     :param args:
+    :param index:
     :param kwargs:
     :return:
     """
     if term:
+        if index is not None:
+            result = index.search(term, limit=QUERY_PAGE_SIZE)
+            if result is not None:
+                return json.dumps(result)
         return _fetch_formatted(QUERY_FORMAT, term, *args, **kwargs)
     raise TypeError("Search Term must be non-empty.")
 
 
-def entry(number, *args, check_name=True, **kwargs):
+async def aquery(term, *args, **kwargs):
+    """
+    Asynchronously Search OEIS for Given Term.
+
+    :param term:
+    :param args:
+    :param kwargs:
+    :return:
+    """
+    if term:
+        return await _afetch_formatted(QUERY_FORMAT, term, *args, **kwargs)
+    raise TypeError("Search Term must be non-empty.")
+
+
+def _search_pages(term, *args, **kwargs):
+    """
+    Fetch Consecutive Pages of Search Results.
+
+    :param term:
+    :param args:
+    :param kwargs:
+    :return:
+    """
+    start = 0
+    while True:
+        page = fetch(
+            QUERY_PAGE_FORMAT.format(term, start), *args, as_json=True, **kwargs
+        )
+        yield page
+        start += len(page["results"] or ())
+        if not page["results"] or start >= page["count"]:
+            return
+
+
+async def _asearch_pages(term, *args, **kwargs):
+    """
+    Asynchronously Fetch Consecutive Pages of Search Results.
+
+    :param term:
+    :param args:
+    :param kwargs:
+    :return:
+    """
+    start = 0
+    while True:
+        page = await afetch(
+            QUERY_PAGE_FORMAT.format(term, start), *args, as_json=True, **kwargs
+        )
+        yield page
+        start += len(page["results"] or ())
+        if not page["results"] or start >= page["count"]:
+            return
+
+
+def query_iter(term, *args, limit=None, index=None, **kwargs):
+    """
+    Lazily Iterate over Search Results for Given Term.
+
+    Result pages are decoded one at a time and the next page is only requested once
+    the consumer has exhausted the current one.
+
+    :param term:
+    :param args:
+    :param limit:
+    :param index:
+    :param kwargs:
+    :return:
+    """
+    if not term:
+        raise TypeError("Search Term must be non-empty.")
+    if index is not None and parse_terms(term) is not None:
+        yield from index.iter_results(term, limit=limit)
+        return
+    results = (
+        Box(result)
+        for page in _search_pages(term, *args, **kwargs)
+        for result in page["results"] or ()
+    )
+    yield from islice(results, limit)
+
+
+async def aquery_iter(term, *args, limit=None, **kwargs):
+    """
+    Lazily and Asynchronously Iterate over Search Results for Given Term.
+
+    :param term:
+    :param args:
+    :param limit:
+    :param kwargs:
+    :return:
+    """
+    if not term:
+        raise TypeError("Search Term must be non-empty.")
+    if limit is not None and limit <= 0:
+        return
+    count = 0
+    async for page in _asearch_pages(term, *args, **kwargs):
+        for result in page["results"] or ():
+            yield Box(result)
+            count += 1
+            if count == limit:
+                return
+
+
+def _entry_from_json(result):
+    """
+    Build Entry Metadata from Search Result.
+
+    :param result:
+    :return:
+    """
+    if not result["count"]:
+        return BoxObject(None, raw=result)
+    return subset_box(result, key=lambda d: d["results"][0], origin_name="raw")
+
+
+def _entry_from_mirror(mirror, number, *args, **kwargs):
+    """
+    Get Entry Metadata from Mirror, Loading Missing Fields over HTTP.
+
+    :param mirror:
+    :param number:
+    :param args:
+    :param kwargs:
+    :return:
+    """
+    fallback = partial(entry, number, *args, check_name=False, **kwargs)
+    meta = mirror.entry(number, fallback=fallback)
+    return BoxObject(None) if meta is None else meta
+
+
+def entry(number, *args, check_name=True, mirror=None, **kwargs):
     """
     Get OEIS Entry Metadata.
 
+    With a mirror, the entry is resolved locally and only fields missing from the
+    mirror are loaded over HTTP, on first access. Responses are cached on disk only
+    through a session with a `CacheAdapter` mounted.
+
     :param number:
     :param args:
     :param check_name:
+    :param mirror:
     :param kwargs:
     :return:
     """
     if check_name:
         number = oeis_name(number)
-    result = _fetch_formatted(ENTRY_FORMAT, number, *args, as_json=True, **kwargs)
-    if not result["count"]:
-        return BoxObject(None, raw=result)
-    return subset_box(result, key=lambda d: d["results"][0], origin_name="raw")
+    if mirror is not None:
+        return _entry_from_mirror(mirror, number, *args, **kwargs)
+    return _entry_from_json(
+        _fetch_formatted(ENTRY_FORMAT, number, *args, as_json=True, **kwargs)
+    )
 
 
-def exists(number, *args, **kwargs):
+def entries(
+    numbers, *args, check_name=True, batch_size=ENTRY_BATCH_SIZE, mirror=None, **kwargs
+):
+    """
+    Get OEIS Entry Metadata for Many Entries with Batched Searches.
+
+    Each batch of ids is sent as a single OR-ed `id:` search and all of its result
+    pages are followed. Each entry keeps only its own result as raw data, like the
+    entries returned by `entry`. Missing entries are returned as None.
+
+    :param numbers:
+    :param args:
+    :param check_name:
+    :param batch_size:
+    :param mirror:
+    :param kwargs:
+    :return:
+    """
+    names = [oeis_name(number) if check_name else number for number in numbers]
+    if mirror is not None:
+        metas = (_entry_from_mirror(mirror, name, *args, **kwargs) for name in names)
+        return [meta if meta else None for meta in metas]
+    found = {}
+    for batch in grouped(dict.fromkeys(names), batch_size):
+        term = "|".join("id:{}".format(name) for name in batch if name is not None)
+        for page in _search_pages(term, *args, **kwargs):
+            for result in page["results"] or ():
+                raw = dict(page, count=1, start=0, results=[result])
+                found[oeis_name(result["number"])] = Box(result, raw=raw)
+    return [found.get(name) for name in names]
+
+
+async def aentry(number, *args, check_name=True, **kwargs):
+    """
+    Asynchronously Get OEIS Entry Metadata.
+
+    :param number:
+    :param args:
+    :param check_name:
+    :param kwargs:
+    :return:
+    """
+    if check_name:
+        number = oeis_name(number)
+    return _entry_from_json(
+        await _afetch_formatted(ENTRY_FORMAT, number, *args, as_json=True, **kwargs)
+    )
+
+
+def exists(number, *args, mirror=None, index=None, **kwargs):
     """
     Check if Entry is Not None.
 
+    With an existence index or a mirror, the check is answered offline.
+
     :param number:
     :param args:
+    :param mirror:
+    :param index:
     :param kwargs:
     :return:
     """
-    # TODO: can be improved
+    if index is not None:
+        return number in index
+    if mirror is not None:
+        return number in mirror
     return bool(entry(number, *args, **kwargs))
 
 
+async def aexists(number, *args, mirror=None, index=None, **kwargs):
+    """
+    Asynchronously Check if Entry is Not None.
+
+    With an existence index or a mirror, the check is answered offline.
+
+    :param number:
+    :param args:
+    :param mirror:
+    :param index:
+    :param kwargs:
+    :return:
+    """
+    if index is not None:
+        return number in index
+    if mirror is not None:
+        return number in mirror
+    return bool(await aentry(number, *args, **kwargs))
+
+
 def _get_bfile_line_content(line):
     """
     Get B-File Content without Comments.
@@ -306,28 +715,23 @@ def _parsed_bfile_lines(lines):
     for line in lines:
         start = _get_bfile_line_content(line)
         if start:
-            yield from map(int, start.split())
+            yield from map(parse_int, start.split())
             break
     for line in lines:
         start = _get_bfile_line_content(line)
         if start:
-            yield int(start.split()[1])
+            yield parse_int(start.split()[1])
 
 
-def bfile(number, *args, check_name=True, starting_index=0, **kwargs):
+def _bfile_from_text(html, starting_index=0):
     """
-    Get B-File associated to OEIS Entry.
+    Build B-File Sequence from Response Text.
 
-    :param number:
-    :param args:
-    :param check_name:
+    :param html:
     :param starting_index:
-    :param kwargs:
     :return:
     """
-    if check_name:
-        number = oeis_name(number)
-    html = _fetch_formatted(BFILE_FORMAT, number[1:], *args, **kwargs).strip()
+    html = html.strip()
     sequence = _parsed_bfile_lines(html.split("\n"))
     offset = 0
     try:
@@ -342,17 +746,554 @@ def bfile(number, *args, check_name=True, starting_index=0, **kwargs):
     return BoxObject(tuple(sequence), offset=offset)
 
 
-def bfile_exists(number, *args, **kwargs):
+def _bfile_array_from_text(html, starting_index=0):
+    """
+    Build B-File Term Array from Response Text.
+
+    :param html:
+    :param starting_index:
+    :return:
+    """
+    lines = html.strip().split("\n")
+    try:
+        offset = next(_parsed_bfile_lines(lines), 0)
+        terms = load_terms(lines)
+    except Exception as error:
+        if not is_404(html):
+            raise error
+        offset, terms = 0, TermArray()
+    return TermArray(terms[starting_index:], offset)
+
+
+def bfile(
+    number,
+    *args,
+    check_name=True,
+    starting_index=0,
+    start=None,
+    stop=None,
+    as_array=False,
+    **kwargs
+):
+    """
+    Get B-File associated to OEIS Entry.
+
+    With `start` or `stop`, only the terms at those positions, counted from the
+    first term of the b-file, are downloaded using range requests. With `as_array`,
+    the terms are parsed straight into a `TermArray` carrying the offset. The HTTP
+    cache applies only to a session passed in with a `CacheAdapter` mounted.
+
+    :param number:
+    :param args:
+    :param check_name:
+    :param starting_index:
+    :param start:
+    :param stop:
+    :param as_array:
+    :param kwargs:
+    :return:
+    """
+    if check_name:
+        number = oeis_name(number)
+    if start is not None or stop is not None:
+        offset, terms = _bfile_slice(
+            BFILE_FORMAT.format(number[1:]),
+            *args,
+            start=value_or(start, starting_index),
+            stop=stop,
+            **kwargs
+        )
+        if as_array:
+            return TermArray.from_tokens(terms, offset)
+        return BoxObject(tuple(map(parse_int, terms)), offset=offset)
+    text = _fetch_formatted(BFILE_FORMAT, number[1:], *args, **kwargs)
+    if as_array:
+        return _bfile_array_from_text(text, starting_index)
+    return _bfile_from_text(text, starting_index)
+
+
+async def abfile(
+    number, *args, check_name=True, starting_index=0, as_array=False, **kwargs
+):
+    """
+    Asynchronously Get B-File associated to OEIS Entry.
+
+    :param number:
+    :param args:
+    :param check_name:
+    :param starting_index:
+    :param as_array:
+    :param kwargs:
+    :return:
+    """
+    if check_name:
+        number = oeis_name(number)
+    text = await _afetch_formatted(BFILE_FORMAT, number[1:], *args, **kwargs)
+    if as_array:
+        return _bfile_array_from_text(text, starting_index)
+    return _bfile_from_text(text, starting_index)
+
+
+def _get(url, session=None, *, headers=None, stream=False, limiter=None, retries=None):
+    """
+    Send GET Request via _requests_ Session, Retrying Throttled Responses.
+
+    :param url:
+    :param session:
+    :param headers:
+    :param stream:
+    :param limiter:
+    :param retries:
+    :return:
+    """
+    session = value_or(session, requests)
+    limiter = value_or(limiter, RATE_LIMITER)
+    retries = value_or(retries, MAX_RETRIES)
+    for attempt in range(retries + 1):
+        limiter.acquire()
+        response = session.get(url, headers=headers, stream=stream)
+        try:
+            delay = _retry_delay(response, limiter, attempt, retries)
+        except Exception:
+            response.close()
+            raise
+        if delay is None:
+            return response
+        response.close()
+        time.sleep(delay)
+
+
+def _is_missing(response):
+    """
+    Check if _requests_ or _aiohttp_ Response is a Missing Page.
+
+    :param response:
+    :return:
+    """
+    if getattr(response, "status_code", getattr(response, "status", None)) == 404:
+        return True
+    response.raise_for_status()
+    return "html" in response.headers.get("Content-Type", "")
+
+
+def _stream_lines(
+    url,
+    session=None,
+    *,
+    headers=None,
+    chunk_size=BFILE_CHUNK_SIZE,
+    limiter=None,
+    retries=MAX_RETRIES
+):
+    """
+    Stream Lines of URL Content via _requests_ Session.
+
+    Missing pages produce no lines and the connection is released as soon as the
+    generator is exhausted or closed.
+
+    :param url:
+    :param session:
+    :param headers:
+    :param chunk_size:
+    :param limiter:
+    :param retries:
+    :return:
+    """
+    response = _get(
+        url, session, headers=headers, stream=True, limiter=limiter, retries=retries
+    )
+    with response:
+        if _is_missing(response):
+            return
+        for line in response.iter_lines(chunk_size=chunk_size):
+            yield line.decode("utf-8", "replace")
+
+
+def _streamed_terms(lines, sequence, start, stop):
+    """
+    Yield Streamed B-File Terms and Close the Stream when Done.
+
+    :param lines:
+    :param sequence:
+    :param start:
+    :param stop:
+    :return:
+    """
+    try:
+        yield from islice(sequence, start, stop)
+    finally:
+        lines.close()
+
+
+def bfile_stream(
+    number,
+    *args,
+    check_name=True,
+    starting_index=0,
+    max_terms=None,
+    chunk_size=BFILE_CHUNK_SIZE,
+    **kwargs
+):
+    """
+    Stream B-File associated to OEIS Entry.
+
+    Terms are parsed straight from the response byte stream and yielded as they
+    arrive, so memory is bounded by `chunk_size` instead of the size of the b-file.
+    The connection is closed once `max_terms` terms have been read.
+
+    :param number:
+    :param args:
+    :param check_name:
+    :param starting_index:
+    :param max_terms:
+    :param chunk_size:
+    :param kwargs:
+    :return:
+    """
+    if check_name:
+        number = oeis_name(number)
+    lines = _stream_lines(
+        BFILE_FORMAT.format(number[1:]), *args, chunk_size=chunk_size, **kwargs
+    )
+    sequence = _parsed_bfile_lines(lines)
+    offset = next(sequence, 0)
+    stop = None if max_terms is None else starting_index + max_terms
+    terms = _streamed_terms(lines, sequence, starting_index, stop)
+    return BoxObject(terms, offset=offset)
+
+
+def _bfile_chunk_lines(chunk, position, *, partial_head=False, partial_tail=True):
+    """
+    Parse Complete Data Lines of a B-File Chunk.
+
+    Yields the byte position, index and term text of each line. The first line is
+    skipped when the chunk may start mid-line and the last when it may end mid-line.
+
+    :param chunk:
+    :param position:
+    :param partial_head:
+    :param partial_tail:
+    :return:
+    """
+    lines = chunk.split(b"\n")
+    if partial_tail:
+        lines.pop()
+    for i, line in enumerate(lines):
+        content = _get_bfile_line_content(line.decode("utf-8", "replace")).split()
+        if len(content) > 1 and not (partial_head and i == 0):
+            yield position, int(content[0]), content[1]
+        position += len(line) + 1
+
+
+def _range_header(first, last=None):
+    """
+    Make HTTP Range Header for Bytes from `first` to `last` Inclusive.
+
+    :param first:
+    :param last:
+    :return:
+    """
+    return {"Range": "bytes={}-{}".format(first, "" if last is None else last)}
+
+
+def _content_total(response):
+    """
+    Get Total Content Length from Partial Content Response.
+
+    :param response:
+    :return:
+    """
+    total = response.headers.get("Content-Range", "").rpartition("/")[2]
+    return int(total) if total.isdigit() else None
+
+
+def _probe_line(url, session, position, *, probe_size, total, **kwargs):
+    """
+    Find First Data Line of a B-File Starting after Byte Position.
+
+    :param url:
+    :param session:
+    :param position:
+    :param probe_size:
+    :param total:
+    :param kwargs:
+    :return:
+    """
+    last = position + probe_size - 1
+    with _get(url, session, headers=_range_header(position, last), **kwargs) as r:
+        if r.status_code != 206:
+            return None
+        lines = _bfile_chunk_lines(
+            r.content, position, partial_head=True, partial_tail=last < total - 1
+        )
+        return next(((p, n) for p, n, _ in lines), None)
+
+
+def _bfile_seek(probe, target, known, total, slack):
+    """
+    Search for Byte Position of a Line at or before the Line with Index `target`.
+
+    Starting from a known line, the position is estimated by interpolating between
+    the nearest known lines on either side, falling back to bisection whenever the
+    same side moves twice in a row. The search stops once the window is within
+    `slack` bytes, which are cheaper to stream than another round trip.
+
+    :param probe:
+    :param target:
+    :param known:
+    :param total:
+    :param slack:
+    :return:
+    """
+    lo, n_lo, _ = known
+    hi, n_hi = total, None
+    tail = probe(max(total - slack, lo))
+    if tail is not None:
+        hi, n_hi = tail
+        if n_hi <= target:
+            return hi
+    side, streak = None, 0
+    while hi - lo > slack and n_lo < target:
+        guess = (lo + hi) // 2
+        if n_hi is not None and streak < 2:
+            margin = (hi - lo) // 16
+            guess = lo + (target - n_lo) * (hi - lo) // (n_hi - n_lo)
+            guess = min(max(guess, lo + margin), hi - margin)
+        found = probe(guess)
+        if found is not None and found[0] < hi and found[1] <= target:
+            moved, (lo, n_lo) = "lo", found
+        elif found is not None and found[0] < hi:
+            moved, (hi, n_hi) = "hi", found
+        else:
+            moved, hi = "hi", guess
+        streak = streak + 1 if moved == side else 1
+        side = moved
+    return lo
+
+
+def _bfile_terms(pairs, target, end):
+    """
+    Collect Term Text with Index from `target` up to `end` from Sorted B-File Pairs.
+
+    :param pairs:
+    :param target:
+    :param end:
+    :return:
+    """
+    terms = []
+    for n, term in pairs:
+        if end is not None and n >= end:
+            break
+        if n >= target:
+            terms.append(term)
+    return tuple(terms)
+
+
+def _bfile_slice(
+    url,
+    session=None,
+    *,
+    start=0,
+    stop=None,
+    probe_size=BFILE_PROBE_SIZE,
+    chunk_size=BFILE_CHUNK_SIZE,
+    **kwargs
+):
+    """
+    Get Offset and Term Text of B-File between Positions `start` and `stop`.
+
+    The head of the b-file is read with a range request. If the slice lies beyond
+    it, the line where the slice begins is located with ranged probes, and the slice
+    is streamed from there with the connection closed as soon as `stop` is reached.
+    Servers without range support answer the first request with the whole b-file.
+
+    :param url:
+    :param session:
+    :param start:
+    :param stop:
+    :param probe_size:
+    :param chunk_size:
+    :param kwargs:
+    :return:
+    """
+    with _get(url, session, headers=_range_header(0, probe_size - 1), **kwargs) as r:
+        if _is_missing(r):
+            return 0, ()
+        total = _content_total(r) if r.status_code == 206 else len(r.content)
+        complete = total is not None and len(r.content) >= total
+        head = list(_bfile_chunk_lines(r.content, 0, partial_tail=not complete))
+    offset, position = None, 0
+    if head:
+        offset, last_index = head[0][1], head[-1][1]
+        target, end = offset + start, None if stop is None else offset + stop
+        if complete or (end is not None and end <= last_index + 1):
+            return offset, _bfile_terms(((n, t) for _, n, t in head), target, end)
+        if target <= last_index or total is None:
+            position = max(p for p, n, _ in head if n <= max(target, offset))
+        else:
+            probe = partial(
+                _probe_line, url, session, probe_size=probe_size, total=total, **kwargs
+            )
+            slack = max(probe_size, 4 * chunk_size)
+            position = _bfile_seek(probe, target, head[-1], total, slack)
+    lines = _stream_lines(
+        url,
+        session,
+        headers=_range_header(position) if position else None,
+        chunk_size=chunk_size,
+        **kwargs
+    )
+    try:
+        pairs = (line.split() for line in map(_get_bfile_line_content, lines))
+        pairs = ((int(pair[0]), pair[1]) for pair in pairs if len(pair) > 1)
+        if offset is None:
+            first = next(pairs, None)
+            if first is None:
+                return 0, ()
+            offset, pairs = first[0], chain((first,), pairs)
+        end = None if stop is None else offset + stop
+        return offset, _bfile_terms(pairs, offset + start, end)
+    finally:
+        lines.close()
+
+
+def bfiles(numbers, *args, max_workers=BFILE_WORKERS, **kwargs):
+    """
+    Download B-Files for Many OEIS Entries Concurrently.
+
+    Yields `(number, bfile)` pairs in order of completion. A failed download yields
+    the raised exception in place of the b-file instead of aborting the batch. At
+    most `2 * max_workers` downloads are queued at any time and, without a session,
+    all workers share one pooled session.
+
+    :param numbers:
+    :param args:
+    :param max_workers:
+    :param kwargs:
+    :return:
+    """
+    session = kwargs.pop("session", None)
+    if args:
+        session, args = value_or(args[0], session), args[1:]
+    owned_session = None
+    if REQUESTS_SUPPORT and session is None:
+        session = owned_session = _pooled_session(max_workers)
+    args = (session,) + args
+    numbers = iter(numbers)
+    pending = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def submit(count):
+            for number in islice(numbers, count):
+                pending[executor.submit(bfile, number, *args, **kwargs)] = number
+
+        try:
+            submit(2 * max_workers)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    number = pending.pop(future)
+                    submit(1)
+                    try:
+                        result = future.result()
+                    except Exception as error:
+                        result = error
+                    yield number, result
+        finally:
+            for future in pending:
+                future.cancel()
+            if owned_session is not None:
+                owned_session.close()
+
+
+def _head_exists(url, session=None, *, limiter=None, retries=MAX_RETRIES):
+    """
+    Check if URL Exists with a HEAD Request via _requests_ Session.
+
+    The OEIS website serves missing files as an HTML page, so only non-HTML
+    responses count as existing.
+
+    :param url:
+    :param session:
+    :param limiter:
+    :param retries:
+    :return:
+    """
+    session = value_or(session, requests)
+    limiter = value_or(limiter, RATE_LIMITER)
+    for attempt in range(retries + 1):
+        limiter.acquire()
+        with session.head(url, allow_redirects=True) as response:
+            delay = _retry_delay(response, limiter, attempt, retries)
+            if delay is None:
+                return not _is_missing(response)
+        time.sleep(delay)
+
+
+def bfile_exists(number, *args, check_name=True, index=None, **kwargs):
     """
     Check if B-File Exists for an OEIS Entry.
 
+    With an existence index of b-files, the check is answered offline. Otherwise a
+    HEAD request is sent instead of downloading the b-file.
+
     :param number:
     :param args:
+    :param check_name:
+    :param index:
     :param kwargs:
     :return:
     """
-    # TODO: can be improved
-    return bool(bfile(number, *args, **kwargs))
+    if index is not None:
+        return number in index
+    if check_name:
+        number = oeis_name(number)
+    return _head_exists(BFILE_FORMAT.format(number[1:]), *args, **kwargs)
+
+
+async def _ahead_exists(url, session=None, *, limiter=None, retries=MAX_RETRIES):
+    """
+    Asynchronously Check if URL Exists with a HEAD Request via _aiohttp_ Session.
+
+    Without a session, the pooled session of the running event loop is used.
+
+    :param url:
+    :param session:
+    :param limiter:
+    :param retries:
+    :return:
+    """
+    if session is None:
+        session = await _loop_session()
+    limiter = value_or(limiter, RATE_LIMITER)
+    for attempt in range(retries + 1):
+        await limiter.aacquire()
+        async with session.head(url, allow_redirects=True) as response:
+            delay = _retry_delay(response, limiter, attempt, retries)
+            if delay is None:
+                return not _is_missing(response)
+        await asyncio.sleep(delay)
+
+
+async def abfile_exists(number, *args, check_name=True, index=None, **kwargs):
+    """
+    Asynchronously Check if B-File Exists for an OEIS Entry.
+
+    With an existence index of b-files, the check is answered offline. Otherwise a
+    HEAD request is sent instead of downloading the b-file.
+
+    :param number:
+    :param args:
+    :param check_name:
+    :param index:
+    :param kwargs:
+    :return:
+    """
+    if index is not None:
+        return number in index
+    if check_name:
+        number = oeis_name(number)
+    return await _ahead_exists(BFILE_FORMAT.format(number[1:]), *args, **kwargs)
 
 
 class Session(ObjectProxy):
@@ -388,6 +1329,17 @@ class Session(ObjectProxy):
         """
         return query(term, self.__wrapped__, *args, **kwargs)
 
+    def query_iter(self, term, *args, **kwargs):
+        """
+        Session query_iter Wrapper.
+
+        :param term:
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        return query_iter(term, self.__wrapped__, *args, **kwargs)
+
     def entry(self, number, *args, **kwargs):
         """
         Session entry Wrapper.
@@ -399,6 +1351,17 @@ class Session(ObjectProxy):
         """
         return entry(number, self.__wrapped__, *args, **kwargs)
 
+    def entries(self, numbers, *args, **kwargs):
+        """
+        Session entries Wrapper.
+
+        :param numbers:
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        return entries(numbers, self.__wrapped__, *args, **kwargs)
+
     def exists(self, number, *args, **kwargs):
         """
         Session exists Wrapper.
@@ -421,6 +1384,28 @@ class Session(ObjectProxy):
         """
         return bfile(number, self.__wrapped__, *args, **kwargs)
 
+    def bfile_stream(self, number, *args, **kwargs):
+        """
+        Session bfile_stream Wrapper.
+
+        :param number:
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        return bfile_stream(number, self.__wrapped__, *args, **kwargs)
+
+    def bfiles(self, numbers, *args, **kwargs):
+        """
+        Session bfiles Wrapper.
+
+        :param numbers:
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        return bfiles(numbers, self.__wrapped__, *args, **kwargs)
+
     def bfile_exists(self, number, *args, **kwargs):
         """
         Session bfile_exists Wrapper.
@@ -431,3 +1416,131 @@ class Session(ObjectProxy):
         :return:
         """
         return bfile_exists(number, self.__wrapped__, *args, **kwargs)
+
+
+class AsyncSession(ObjectProxy):
+    """Asynchronous Session Wrapper."""
+
+    def __init__(self, session):
+        """
+        Initialize Asynchronous Session.
+
+        :param session:
+        """
+        super().__init__(session)
+
+    @classmethod
+    def pooled(cls, *, limit=100, limit_per_host=10, keepalive_timeout=30, **kwargs):
+        """
+        Make Asynchronous Session with a Long-Lived Connection Pool.
+
+        The pool keeps at most `limit` open connections, at most `limit_per_host` of
+        them to the same host, and keeps idle connections alive for reuse.
+
+        :param limit:
+        :param limit_per_host:
+        :param keepalive_timeout:
+        :param kwargs:
+        :return:
+        """
+        connector = aiohttp.TCPConnector(
+            limit=limit,
+            limit_per_host=limit_per_host,
+            keepalive_timeout=keepalive_timeout,
+        )
+        return cls(aiohttp.ClientSession(connector=connector, **kwargs))
+
+    async def __aenter__(self):
+        """
+        Enter Asynchronous Session Context.
+
+        :return:
+        """
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """
+        Exit Asynchronous Session Context and Close Pool.
+
+        :param exc_info:
+        :return:
+        """
+        await self.__wrapped__.close()
+
+    async def afetch(self, url, *args, **kwargs):
+        """
+        Session afetch Wrapper.
+
+        :param url:
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        return await afetch(url, self.__wrapped__, *args, **kwargs)
+
+    async def aquery(self, term, *args, **kwargs):
+        """
+        Session aquery Wrapper.
+
+        :param term:
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        return await aquery(term, self.__wrapped__, *args, **kwargs)
+
+    async def aquery_iter(self, term, *args, **kwargs):
+        """
+        Session aquery_iter Wrapper.
+
+        :param term:
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        async for result in aquery_iter(term, self.__wrapped__, *args, **kwargs):
+            yield result
+
+    async def aentry(self, number, *args, **kwargs):
+        """
+        Session aentry Wrapper.
+
+        :param number:
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        return await aentry(number, self.__wrapped__, *args, **kwargs)
+
+    async def aexists(self, number, *args, **kwargs):
+        """
+        Session aexists Wrapper.
+
+        :param number:
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        return await aexists(number, self.__wrapped__, *args, **kwargs)
+
+    async def abfile(self, number, *args, **kwargs):
+        """
+        Session abfile Wrapper.
+
+        :param number:
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        return await abfile(number, self.__wrapped__, *args, **kwargs)
+
+    async def abfile_exists(self, number, *args, **kwargs):
+        """
+        Session abfile_exists Wrapper.
+
+        :param number:
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        return await abfile_exists(number, self.__wrapped__, *args, **kwargs)
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*- #
+#
+# oeis/existence.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Existence Index of OEIS Sequence Numbers.
+
+"""
+
+# -------------- Standard Library -------------- #
+
+import os
+
+# ---------------- oeis Library ---------------- #
+
+from .base import number as oeis_number
+from .cache import _atomic_write
+from .mirror import _dump_records
+
+
+__all__ = ("ExistenceIndex",)
+
+
+class ExistenceIndex:
+    """
+    Bitmap over the A-Number Space for Offline Existence Checks.
+
+    Bit `n` is set when `A{n}` exists, so the full OEIS fits in about 50 KB and
+    every lookup is a single bit test.
+
+    """
+
+    def __init__(self, bits=b""):
+        """
+        Initialize Existence Index.
+
+        :param bits:
+        """
+        self._bits = bytearray(bits)
+
+    @staticmethod
+    def _bitmap(numbers):
+        """
+        Build Bitmap with the Given Bits Set.
+
+        :param numbers:
+        :return:
+        """
+        bits = bytearray()
+        for number in numbers:
+            index = number >> 3
+            if index >= len(bits):
+                bits.extend(bytes(max(index + 1 - len(bits), len(bits))))
+            bits[index] |= 1 << (number & 7)
+        return bits.rstrip(b"\0")
+
+    @classmethod
+    def from_ids(cls, keys):
+        """
+        Build Existence Index from Sequence Numbers or IDs.
+
+        :param keys:
+        :return:
+        """
+        return cls(cls._bitmap(map(oeis_number, keys)))
+
+    @classmethod
+    def from_listing(cls, path):
+        """
+        Build Existence Index from an ID Listing or Dump File.
+
+        Any file with one `A`-number at the start of each line, such as the `names`
+        or `stripped` dumps, can be used.
+
+        :param path:
+        :return:
+        """
+        return cls(cls._bitmap(number for number, _ in _dump_records(path)))
+
+    @classmethod
+    def from_mirror(cls, mirror):
+        """
+        Build Existence Index from Mirror.
+
+        :param mirror:
+        :return:
+        """
+        return cls(cls._bitmap(mirror.numbers()))
+
+    def refresh(self, source):
+        """
+        Replace Index Contents with the Numbers of a Mirror or ID Listing.
+
+        :param source:
+        :return:
+        """
+        if hasattr(source, "numbers"):
+            fresh = self.from_mirror(source)
+        else:
+            fresh = self.from_listing(source)
+        self._bits = fresh._bits
+
+    def add(self, *keys):
+        """
+        Mark Sequences as Existing.
+
+        :param keys:
+        :return:
+        """
+        added = self._bitmap(map(oeis_number, keys))
+        bits = bytearray(max(len(self._bits), len(added)))
+        bits[: len(self._bits)] = self._bits
+        for index, byte in enumerate(added):
+            bits[index] |= byte
+        self._bits = bits
+
+    def save(self, path):
+        """
+        Save Existence Index as Raw Bitmap.
+
+        :param path:
+        :return:
+        """
+        _atomic_write(os.path.abspath(os.path.expanduser(str(path))), bytes(self._bits))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load Existence Index from Raw Bitmap.
+
+        :param path:
+        :return:
+        """
+        with open(os.path.expanduser(str(path)), "rb") as f:
+            return cls(f.read())
+
+    def __contains__(self, key):
+        """
+        Check if Sequence Exists.
+
+        :param key:
+        :return:
+        """
+        try:
+            number = oeis_number(key)
+        except KeyError:
+            return False
+        bits = self._bits
+        index = number >> 3
+        return 0 <= index < len(bits) and bool(bits[index] >> (number & 7) & 1)
+
+    def __len__(self):
+        """
+        Count Existing Sequences.
+
+        :return:
+        """
+        return bin(int.from_bytes(self._bits, "little")).count("1")
+
+    def numbers(self):
+        """
+        Get Sorted Numbers of Existing Sequences.
+
+        :return:
+        """
+        return [
+            8 * index + bit
+            for index, byte in enumerate(self._bits)
+            if byte
+            for bit in range(8)
+            if byte >> bit & 1
+        ]
@@ -37,6 +37,8 @@ import itertools
 
 # ---------------- oeis Library ---------------- #
 
+from .primes import nth_prime, prime_slice
+
 
 __all__ = ("g27", "i27", "g40", "i40")
 
@@ -51,11 +53,11 @@ def i27(index):
     return index
 
 
-def g40():
+def g40(start=0, stop=None, step=None):
     """A000040: The Prime Numbers."""
-    yield 0
+    return prime_slice(start, stop, step)
 
 
 def i40(index):
     """A000040: The Prime Numbers."""
-    return 0
+    return nth_prime(index)
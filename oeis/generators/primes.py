@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*- #
+#
+# oeis/generators/primes.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Prime Sieve and Prime Counting.
+
+"""
+
+# -------------- Standard Library -------------- #
+
+import math
+from functools import lru_cache
+from itertools import count, islice
+
+# -------------- External Library -------------- #
+
+import numpy
+
+
+__all__ = (
+    "SEGMENT_SIZE",
+    "sieve",
+    "primes_between",
+    "primes",
+    "prime_pi",
+    "nth_prime",
+    "prime_slice",
+)
+
+
+SEGMENT_SIZE = 30 * 30030
+
+
+_WHEEL_PRIMES = (3, 5, 7, 11, 13)
+
+
+_WHEEL_PERIOD = 3 * 5 * 7 * 11 * 13
+
+
+def _isqrt(n):
+    """
+    Get Integer Square Root.
+
+    :param n:
+    :return:
+    """
+    if n < 0:
+        raise ValueError("Square root of negative number.")
+    root = int(math.sqrt(n))
+    while root * root > n:
+        root -= 1
+    while (root + 1) * (root + 1) <= n:
+        root += 1
+    return root
+
+
+@lru_cache(maxsize=1)
+def _wheel():
+    """
+    Get Odd-Only Sieve Pattern with the Multiples of the Wheel Primes Removed.
+
+    Entry `i` stands for the odd number `2 i + 1`, and the pattern repeats every
+    `_WHEEL_PERIOD` entries.
+
+    :return:
+    """
+    pattern = numpy.ones(_WHEEL_PERIOD, dtype=bool)
+    for p in _WHEEL_PRIMES:
+        pattern[p // 2 :: p] = False
+    return pattern
+
+
+@lru_cache(maxsize=8)
+def sieve(limit):
+    """
+    Get Primes up to Limit with a Sieve of Eratosthenes over Odd Numbers.
+
+    :param limit:
+    :return:
+    """
+    if limit < 2:
+        return numpy.zeros(0, dtype=numpy.int64)
+    odd = numpy.ones((limit - 1) // 2 + 1, dtype=bool)
+    odd[0] = False
+    for i in range(1, (_isqrt(limit) - 1) // 2 + 1):
+        if odd[i]:
+            p = 2 * i + 1
+            odd[p * p // 2 :: p] = False
+    found = 2 * numpy.flatnonzero(odd).astype(numpy.int64) + 1
+    found = numpy.concatenate(([2], found))
+    found.flags.writeable = False
+    return found
+
+
+def primes_between(low, high):
+    """
+    Get Primes in the Range [low, high) with one Segment of a Wheel Sieve.
+
+    Odd numbers of the segment start from the pre-sieved wheel pattern, so only the
+    primes above the wheel primes have to be crossed off.
+
+    :param low:
+    :param high:
+    :return:
+    """
+    low, high = max(low, 0), max(high, 0)
+    if high <= low:
+        return numpy.zeros(0, dtype=numpy.int64)
+    first, last = low // 2, high // 2
+    phase = first % _WHEEL_PERIOD
+    repeats = -(-(last - first + phase) // _WHEEL_PERIOD)
+    odd = numpy.tile(_wheel(), repeats)[phase : phase + last - first]
+    for p in sieve(_isqrt(high - 1))[1:].tolist():
+        if p in _WHEEL_PRIMES:
+            continue
+        start = max(p * p, low + (-low) % p)
+        if start % 2 == 0:
+            start += p
+        odd[start // 2 - first :: p] = False
+    found = 2 * (numpy.flatnonzero(odd).astype(numpy.int64) + first) + 1
+    found = found[found > 1]
+    small = [p for p in (2,) + _WHEEL_PRIMES if low <= p < high]
+    if small:
+        found = numpy.concatenate((numpy.array(small, dtype=numpy.int64), found))
+    return found
+
+
+def primes(start=2, *, segment_size=SEGMENT_SIZE):
+    """
+    Generate Primes from Start on, One Sieve Segment at a Time.
+
+    :param start:
+    :param segment_size:
+    :return:
+    """
+    for low in count(start, segment_size):
+        yield from primes_between(low, low + segment_size).tolist()
+
+
+def prime_pi(x):
+    """
+    Count Primes up to x with the Lucy Hedgehog Method in O(x^(3/4)) Operations.
+
+    Counts are kept for the values `v <= sqrt(x)` and `x // i`, the only values the
+    recursion needs, and updated one prime at a time with vector operations.
+
+    :param x:
+    :return:
+    """
+    x = int(x)
+    if x < 2:
+        return 0
+    r = _isqrt(x)
+    small = numpy.arange(-1, r, dtype=numpy.int64)
+    large = numpy.zeros(r + 1, dtype=numpy.int64)
+    large[1:] = x // numpy.arange(1, r + 1, dtype=numpy.int64) - 1
+    for p in sieve(r).tolist():
+        below = small[p - 1]
+        square = p * p
+        limit = min(r, x // square)
+        i = numpy.arange(1, limit + 1, dtype=numpy.int64)
+        ip = i * p
+        inside = ip <= r
+        counts = numpy.where(inside, large[numpy.where(inside, ip, 0)], 0)
+        outside = ~inside
+        counts[outside] = small[x // ip[outside]]
+        large[1 : limit + 1] -= counts - below
+        if square <= r:
+            v = numpy.arange(square, r + 1, dtype=numpy.int64)
+            small[square:] -= small[v // p] - below
+    return int(large[1])
+
+
+def _estimate(n):
+    """
+    Estimate the n-th Prime.
+
+    :param n:
+    :return:
+    """
+    if n < 6:
+        return 13
+    log = math.log(n)
+    loglog = math.log(log)
+    return int(n * (log + loglog - 1 + (loglog - 2) / log))
+
+
+def nth_prime(n):
+    """
+    Get the n-th Prime, Counting from 1.
+
+    The prime is located by counting the primes up to an estimate of it and sieving
+    the short range between the estimate and the prime.
+
+    :param n:
+    :return:
+    """
+    if n < 1:
+        raise ValueError("Primes are counted from 1.")
+    estimate = _estimate(n)
+    if estimate <= SEGMENT_SIZE:
+        return int(sieve(2 * SEGMENT_SIZE)[n - 1])
+    counted = prime_pi(estimate)
+    if counted >= n:
+        high = estimate + 1
+        while True:
+            found = primes_between(max(high - SEGMENT_SIZE, 0), high)
+            if counted - len(found) < n:
+                return int(found[n - counted + len(found) - 1])
+            counted -= len(found)
+            high -= SEGMENT_SIZE
+    low = estimate + 1
+    while True:
+        found = primes_between(low, low + SEGMENT_SIZE)
+        if counted + len(found) >= n:
+            return int(found[n - counted - 1])
+        counted += len(found)
+        low += SEGMENT_SIZE
+
+
+def prime_slice(start=0, stop=None, step=None):
+    """
+    Generate Primes between Positions, Jumping to the First by Prime Counting.
+
+    :param start:
+    :param stop:
+    :param step:
+    :return:
+    """
+    first = nth_prime(start + 1)
+    length = None if stop is None else max(stop - start, 0)
+    return islice(primes(first), 0, length, step)
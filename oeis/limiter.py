@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*- #
+#
+# oeis/limiter.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+"""
+Adaptive Rate Limiting and Retry Scheduling.
+
+"""
+
+# -------------- Standard Library -------------- #
+
+import time
+import random
+import asyncio
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# ---------------- oeis Library ---------------- #
+
+from .util import value_or
+
+
+__all__ = ("RETRY_STATUS", "RateLimiter", "backoff", "parse_retry_after")
+
+
+RETRY_STATUS = frozenset((429, 500, 502, 503, 504))
+
+
+def backoff(attempt, *, base=0.5, cap=60.0):
+    """Get Jittered Exponential Backoff Delay for Attempt."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def parse_retry_after(value):
+    """Parse Retry-After Header into Seconds."""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimiter:
+    """
+    Adaptive Token Bucket shared by Threads and Event Loops.
+
+    The refill rate grows additively with every successful response and shrinks
+    multiplicatively whenever the server throttles or fails, converging on the
+    highest sustained rate the server accepts.
+
+    """
+
+    def __init__(
+        self,
+        rate=10.0,
+        *,
+        burst=None,
+        min_rate=0.2,
+        max_rate=100.0,
+        increase=0.1,
+        decrease=0.5
+    ):
+        """
+        Initialize Rate Limiter.
+
+        :param rate:
+        :param burst:
+        :param min_rate:
+        :param max_rate:
+        :param increase:
+        :param decrease:
+        """
+        self.rate = rate
+        self.burst = value_or(burst, max(1.0, rate))
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Reserve a Token and Get the Seconds to Wait before Using it.
+
+        :return:
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now > self._updated:
+                refill = (now - self._updated) * self.rate
+                self._tokens = min(self.burst, self._tokens + refill)
+                self._updated = now
+            self._tokens -= 1
+            return max(0.0, self._updated - now) + max(0.0, -self._tokens) / self.rate
+
+    def acquire(self):
+        """
+        Block until a Token is Available.
+
+        :return:
+        """
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def aacquire(self):
+        """
+        Asynchronously Wait until a Token is Available.
+
+        :return:
+        """
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+    def success(self):
+        """
+        Record Successful Response.
+
+        :return:
+        """
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def throttled(self, retry_after=None):
+        """
+        Record Throttled or Failed Response.
+
+        When the server asks to retry after some delay, no tokens are handed out
+        until that delay has passed.
+
+        :param retry_after:
+        :return:
+        """
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            if retry_after:
+                self._updated = max(self._updated, time.monotonic() + retry_after)
+                self._tokens = min(self._tokens, 0.0)
+        return value_or(retry_after, 0.0)
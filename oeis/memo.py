@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*- #
+#
+# oeis/memo.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Bounded Memo of Generated Sequence Terms.
+
+"""
+
+# -------------- Standard Library -------------- #
+
+import os
+import sys
+import pickle
+import weakref
+import tempfile
+import threading
+from shutil import rmtree
+from collections import OrderedDict
+
+# -------------- External Library -------------- #
+
+import numpy
+
+# ---------------- oeis Library ---------------- #
+
+from .cache import _atomic_write
+
+
+__all__ = ("MEMO_BUDGET", "MEMO_CHUNK_SIZE", "TermMemo")
+
+
+MEMO_BUDGET = 64 * 1024 * 1024
+
+
+MEMO_CHUNK_SIZE = 1024
+
+
+class _Chunk:
+    """
+    Fixed-Size Block of Memoized Terms.
+
+    """
+
+    __slots__ = ("values", "filled", "extra")
+
+    def __init__(self, size):
+        """
+        Initialize Empty Chunk.
+
+        :param size:
+        """
+        self.values = numpy.zeros(size, dtype=numpy.int64)
+        self.filled = numpy.zeros(size, dtype=bool)
+        self.extra = 0
+
+    @property
+    def nbytes(self):
+        """Get Approximate Memory Footprint of the Chunk."""
+        return self.values.nbytes + self.filled.nbytes + self.extra
+
+    def _widen(self):
+        """Switch Chunk to Python Object Storage."""
+        self.values = self.values.astype(object)
+        self.extra = sum(map(sys.getsizeof, self.values[self.filled]))
+
+    def put(self, index, term):
+        """Store Term, Widening to Python Objects unless it Fits in `int64`."""
+        if self.values.dtype != object:
+            if isinstance(term, (int, numpy.integer)) and not isinstance(term, bool):
+                try:
+                    self.values[index] = int(term)
+                except OverflowError:
+                    self._widen()
+            else:
+                self._widen()
+        if self.values.dtype == object:
+            if self.filled[index]:
+                self.extra -= sys.getsizeof(self.values[index])
+            self.values[index] = term
+            self.extra += sys.getsizeof(term)
+        self.filled[index] = True
+
+
+class TermMemo:
+    """
+    Memory-Bounded Memo of Sequence Terms by Position.
+
+    Terms are kept in fixed-size chunks ordered by recent use. Once the memo grows
+    past its budget, the least recently used chunks are spilled to disk and loaded
+    back when they are needed again. Without a `spill_directory`, spilled chunks go
+    to a temporary directory which is removed on `close` or once the memo is
+    garbage collected.
+
+    """
+
+    def __init__(
+        self, budget=MEMO_BUDGET, *, chunk_size=MEMO_CHUNK_SIZE, spill_directory=None
+    ):
+        """
+        Initialize Term Memo.
+
+        :param budget:
+        :param chunk_size:
+        :param spill_directory:
+        """
+        self.budget = budget
+        self.chunk_size = chunk_size
+        self.spill_directory = spill_directory
+        self._chunks = OrderedDict()
+        self._spilled = set()
+        self._nbytes = 0
+        self._lock = threading.RLock()
+        self._cleanup = None
+
+    @property
+    def nbytes(self):
+        """Get Approximate Memory Footprint of the Memo."""
+        return self._nbytes
+
+    def _spill_path(self, key):
+        """
+        Get Spill File Path for Chunk.
+
+        :param key:
+        :return:
+        """
+        if self.spill_directory is None:
+            self.spill_directory = tempfile.mkdtemp(prefix="oeis-memo-")
+            self._cleanup = weakref.finalize(
+                self, rmtree, self.spill_directory, ignore_errors=True
+            )
+        return os.path.join(self.spill_directory, "{}-{}.chunk".format(*key))
+
+    def _evict(self):
+        """
+        Spill Least Recently Used Chunks until the Memo is within Budget.
+
+        :return:
+        """
+        while self._nbytes > self.budget and len(self._chunks) > 1:
+            key, chunk = self._chunks.popitem(last=False)
+            self._nbytes -= chunk.nbytes
+            state = (chunk.values, chunk.filled, chunk.extra)
+            _atomic_write(self._spill_path(key), pickle.dumps(state, protocol=4))
+            self._spilled.add(key)
+
+    def _chunk(self, key, create=False):
+        """
+        Get Chunk, Loading it from Disk if it was Spilled.
+
+        :param key:
+        :param create:
+        :return:
+        """
+        chunk = self._chunks.get(key)
+        if chunk is not None:
+            self._chunks.move_to_end(key)
+            return chunk
+        if key in self._spilled:
+            self._spilled.discard(key)
+            path = self._spill_path(key)
+            with open(path, "rb") as f:
+                chunk = _Chunk.__new__(_Chunk)
+                chunk.values, chunk.filled, chunk.extra = pickle.load(f)
+            os.unlink(path)
+        elif create:
+            chunk = _Chunk(self.chunk_size)
+        else:
+            return None
+        self._chunks[key] = chunk
+        self._nbytes += chunk.nbytes
+        self._evict()
+        return chunk
+
+    def get(self, number, position, default=None):
+        """
+        Get Memoized Term of a Sequence.
+
+        :param number:
+        :param position:
+        :param default:
+        :return:
+        """
+        index, key = position % self.chunk_size, (number, position // self.chunk_size)
+        with self._lock:
+            chunk = self._chunk(key)
+            if chunk is None or not chunk.filled[index]:
+                return default
+            term = chunk.values[index]
+            return int(term) if chunk.values.dtype != object else term
+
+    def put(self, number, position, term):
+        """
+        Memoize Term of a Sequence.
+
+        :param number:
+        :param position:
+        :param term:
+        :return:
+        """
+        index, key = position % self.chunk_size, (number, position // self.chunk_size)
+        with self._lock:
+            chunk = self._chunk(key, create=True)
+            self._nbytes -= chunk.nbytes
+            chunk.put(index, term)
+            self._nbytes += chunk.nbytes
+            self._evict()
+
+    def discard(self, number):
+        """
+        Forget Memoized Terms of a Sequence.
+
+        :param number:
+        :return:
+        """
+        with self._lock:
+            for key in [key for key in self._chunks if key[0] == number]:
+                self._nbytes -= self._chunks.pop(key).nbytes
+            for key in [key for key in self._spilled if key[0] == number]:
+                self._spilled.discard(key)
+                os.unlink(self._spill_path(key))
+
+    def clear(self):
+        """
+        Forget All Memoized Terms.
+
+        :return:
+        """
+        with self._lock:
+            for key in self._spilled:
+                os.unlink(self._spill_path(key))
+            self._chunks.clear()
+            self._spilled.clear()
+            self._nbytes = 0
+
+    def close(self):
+        """
+        Forget All Memoized Terms and Remove the Temporary Spill Directory.
+
+        :return:
+        """
+        with self._lock:
+            self.clear()
+            if self._cleanup is not None:
+                self._cleanup()
+                self._cleanup = None
+                self.spill_directory = None
@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*- #
+#
+# oeis/meta.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Compact Sequence Metadata Record.
+
+"""
+
+# -------------- Standard Library -------------- #
+
+from collections.abc import Mapping
+from enum import IntFlag, auto
+
+# ---------------- oeis Library ---------------- #
+
+from .mirror import MirrorEntry
+from .util import Box
+
+
+__all__ = ("META_FIELDS", "Keyword", "SequenceMeta")
+
+
+_INTEGER_FIELDS = ("number", "references", "revision")
+
+
+_TEXT_FIELDS = (
+    "id",
+    "data",
+    "name",
+    "keyword",
+    "offset",
+    "author",
+    "time",
+    "created",
+)
+
+
+_LIST_FIELDS = (
+    "comment",
+    "reference",
+    "link",
+    "formula",
+    "example",
+    "maple",
+    "mathematica",
+    "program",
+    "xref",
+    "ext",
+)
+
+
+META_FIELDS = _INTEGER_FIELDS + _TEXT_FIELDS + _LIST_FIELDS
+
+
+class Keyword(IntFlag):
+    """
+    Known OEIS Keywords.
+
+    """
+
+    ALLOCATED = auto()
+    BASE = auto()
+    BREF = auto()
+    CHANGED = auto()
+    COFR = auto()
+    CONS = auto()
+    CORE = auto()
+    DEAD = auto()
+    DUMB = auto()
+    DUPE = auto()
+    EASY = auto()
+    EIGEN = auto()
+    FINI = auto()
+    FRAC = auto()
+    FULL = auto()
+    HARD = auto()
+    HEAR = auto()
+    LESS = auto()
+    LOOK = auto()
+    MORE = auto()
+    MULT = auto()
+    NEW = auto()
+    NICE = auto()
+    NONN = auto()
+    OBSC = auto()
+    PROBATION = auto()
+    RECYCLED = auto()
+    SIGN = auto()
+    TABF = auto()
+    TABL = auto()
+    UNED = auto()
+    UNKN = auto()
+    WALK = auto()
+    WORD = auto()
+
+    @classmethod
+    def parse(cls, keywords):
+        """
+        Get Flags of the Known Keywords in a Keyword List.
+
+        :param keywords:
+        :return:
+        """
+        value = 0
+        for keyword in keywords:
+            value |= _KEYWORD_VALUES.get(keyword, 0)
+        return cls(value)
+
+
+_KEYWORD_VALUES = {keyword.name.lower(): keyword.value for keyword in Keyword}
+
+
+def _convert(name, value):
+    """
+    Convert Field Value to its Record Type.
+
+    :param name:
+    :param value:
+    :return:
+    """
+    if value is None:
+        return None
+    if name in _INTEGER_FIELDS:
+        return int(value)
+    if name in _LIST_FIELDS and not isinstance(value, str):
+        return tuple(value)
+    return value
+
+
+class SequenceMeta(Mapping):
+    """
+    Sequence Metadata Record.
+
+    Known OEIS fields are stored in slots and other fields in a side table. Missing
+    fields read as None, as with the metadata Box. Records built from a mirror entry
+    load fields absent from the mirror once, through its fallback, on first access.
+
+    """
+
+    __slots__ = META_FIELDS + ("_extra", "_fallback", "_box")
+
+    def __init__(self, fields=(), *, fallback=None, **kwargs):
+        """
+        Initialize Record.
+
+        :param fields:
+        :param fallback:
+        :param kwargs:
+        """
+        self._extra = None
+        self._fallback = fallback
+        self._box = None
+        self._update(dict(fields, **kwargs))
+
+    @classmethod
+    def from_mapping(cls, mapping):
+        """
+        Make Record from Metadata Mapping.
+
+        :param mapping:
+        :return:
+        """
+        if isinstance(mapping, cls):
+            return mapping
+        if not mapping:
+            return cls()
+        if isinstance(mapping, MirrorEntry):
+            return cls(dict.items(mapping), fallback=mapping._complete)
+        return cls(mapping.items())
+
+    def _update(self, fields, overwrite=True):
+        """
+        Store Fields, Skipping Missing Values and Keeping Unknown Fields Aside.
+
+        :param fields:
+        :param overwrite:
+        :return:
+        """
+        for name, value in fields.items():
+            if value is None:
+                continue
+            if name in META_FIELDS:
+                if overwrite or self._get(name) is None:
+                    object.__setattr__(self, name, _convert(name, value))
+            elif overwrite or name not in (self._extra or ()):
+                if self._extra is None:
+                    self._extra = {}
+                self._extra[name] = value
+
+    def _get(self, name):
+        """
+        Get Loaded Field without Loading through the Fallback.
+
+        :param name:
+        :return:
+        """
+        if name in META_FIELDS:
+            try:
+                return object.__getattribute__(self, name)
+            except AttributeError:
+                return None
+        return (self._extra or {}).get(name)
+
+    def _complete(self):
+        """
+        Load Missing Fields through the Fallback.
+
+        :return:
+        """
+        complete = self._fallback() if self._fallback else None
+        self._fallback = None
+        if complete:
+            self._update(complete, overwrite=False)
+            self._box = None
+        for name in META_FIELDS:
+            if self._get(name) is None:
+                object.__setattr__(self, name, None)
+
+    def __getattr__(self, name):
+        """Get Missing Field, Loading it through the Fallback if Possible."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if self._fallback is not None:
+            self._complete()
+        elif name in META_FIELDS:
+            object.__setattr__(self, name, None)
+        return self._get(name)
+
+    def __setattr__(self, name, value):
+        """Prevent Changes to Fields."""
+        if not name.startswith("_"):
+            raise AttributeError("SequenceMeta is immutable.")
+        object.__setattr__(self, name, value)
+
+    def __getitem__(self, key):
+        """Get Field as Item."""
+        value = self._get(key) if isinstance(key, str) else None
+        if value is None and self._fallback is not None:
+            self._complete()
+            value = self._get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        """Iterate over Loaded Field Names."""
+        for name in META_FIELDS:
+            if self._get(name) is not None:
+                yield name
+        yield from self._extra or ()
+
+    def __len__(self):
+        """Get Number of Loaded Fields."""
+        return sum(1 for _ in self)
+
+    def __eq__(self, other):
+        """Compare Loaded Fields with another Mapping."""
+        if isinstance(other, Mapping):
+            fields = ((k, _convert(k, v)) for k, v in other.items())
+            return self.to_dict() == {k: v for k, v in fields if v is not None}
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        """Get Record Representation."""
+        return "{cls}({fields})".format(cls=type(self).__name__, fields=self.to_dict())
+
+    def __reduce__(self):
+        """
+        Reduce Record for Pickling.
+
+        :return:
+        """
+        return type(self), (self.to_dict(),)
+
+    def to_dict(self):
+        """
+        Get Loaded Fields as a Dictionary.
+
+        :return:
+        """
+        return {name: self._get(name) for name in self}
+
+    @property
+    def box(self):
+        """Get Metadata Box View, Built on First Access."""
+        if self._box is None:
+            if self._fallback is not None:
+                fields = MirrorEntry.with_fallback(self.to_dict(), self._fallback)
+            else:
+                fields = Box(self.to_dict())
+            self._box = fields
+        return self._box
@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*- #
+#
+# oeis/mirror.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+"""
+Offline Mirror of the OEIS built from the Bulk Dumps.
+
+"""
+
+# -------------- Standard Library -------------- #
+
+import os
+import gzip
+import sqlite3
+import threading
+from itertools import islice
+
+# ---------------- oeis Library ---------------- #
+
+from .base import number as oeis_number
+from .util import Box
+
+
+__all__ = ("MIRROR_VARIABLE", "default_mirror", "MirrorEntry", "Mirror")
+
+
+MIRROR_VARIABLE = "OEIS_MIRROR"
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sequences (
+    number INTEGER PRIMARY KEY,
+    name TEXT,
+    data TEXT
+)
+"""
+
+
+_INGEST_BATCH_SIZE = 10000
+
+
+def default_mirror():
+    """Open Mirror Database named by the Environment, if any."""
+    path = os.environ.get(MIRROR_VARIABLE)
+    return Mirror(path) if path else None
+
+
+def _open_dump(path):
+    """Open Plain or Gzipped Dump File as Text."""
+    if str(path).endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def _dump_records(path):
+    """Parse Dump File into Pairs of Sequence Number and Content."""
+    with _open_dump(path) as dump:
+        for line in dump:
+            if line.startswith("#") or not line.strip():
+                continue
+            key, _, content = line.partition(" ")
+            yield oeis_number(key), content.strip()
+
+
+class MirrorEntry(Box):
+    """
+    Mirrored Entry Metadata.
+
+    Fields missing from the dumps are loaded once from the fallback on first access.
+
+    """
+
+    @classmethod
+    def with_fallback(cls, fields, fallback=None):
+        """Build Entry with Fallback Loader for Missing Fields."""
+        entry = cls(fields)
+        entry.__dict__["_mirror_fallback"] = fallback
+        return entry
+
+    def _complete(self):
+        """Load Complete Entry through the Fallback."""
+        if "_mirror_complete" not in self.__dict__:
+            fallback = self.__dict__.get("_mirror_fallback")
+            self.__dict__["_mirror_complete"] = fallback() if fallback else None
+        return self.__dict__["_mirror_complete"]
+
+    def __getitem__(self, item, _ignore_default=False):
+        """Get Item, Loading it through the Fallback if Missing."""
+        if (
+            isinstance(item, str)
+            and not item.startswith("_")
+            and not dict.__contains__(self, item)
+        ):
+            complete = self._complete()
+            if complete and item in complete:
+                return complete[item]
+        return super().__getitem__(item, _ignore_default)
+
+
+class Mirror:
+    """
+    Indexed Store of Sequence Names and Terms from the OEIS Bulk Dumps.
+
+    """
+
+    def __init__(self, path=":memory:"):
+        """
+        Open Mirror Database.
+
+        :param path:
+        """
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute(_SCHEMA)
+
+    @classmethod
+    def from_dumps(cls, path=":memory:", *, stripped=None, names=None):
+        """
+        Build Mirror from Dump Files.
+
+        :param path:
+        :param stripped:
+        :param names:
+        :return:
+        """
+        mirror = cls(path)
+        mirror.ingest(stripped=stripped, names=names)
+        return mirror
+
+    def _ingest_column(self, column, path):
+        """
+        Ingest Dump File into Column.
+
+        :param column:
+        :param path:
+        :return:
+        """
+        statement = (
+            "INSERT INTO sequences (number, {0}) VALUES (?, ?) "
+            "ON CONFLICT(number) DO UPDATE SET {0} = excluded.{0}"
+        ).format(column)
+        records = _dump_records(path)
+        if column == "data":
+            records = ((number, data.strip(",")) for number, data in records)
+        with self._lock, self._connection:
+            while True:
+                batch = list(islice(records, _INGEST_BATCH_SIZE))
+                if not batch:
+                    break
+                self._connection.executemany(statement, batch)
+
+    def ingest(self, *, stripped=None, names=None):
+        """
+        Ingest `stripped` (terms) and `names` (titles) Dump Files.
+
+        Ingesting again refreshes the mirror in place.
+
+        :param stripped:
+        :param names:
+        :return:
+        """
+        if stripped:
+            self._ingest_column("data", stripped)
+        if names:
+            self._ingest_column("name", names)
+
+    def _query(self, statement, *parameters):
+        """
+        Run Query on Mirror Database.
+
+        :param statement:
+        :param parameters:
+        :return:
+        """
+        with self._lock:
+            return self._connection.execute(statement, parameters).fetchall()
+
+    def __contains__(self, key):
+        """
+        Check if Sequence is in the Mirror.
+
+        :param key:
+        :return:
+        """
+        try:
+            key = oeis_number(key)
+        except KeyError:
+            return False
+        return bool(self._query("SELECT 1 FROM sequences WHERE number = ?", key))
+
+    def __len__(self):
+        """
+        Get Number of Mirrored Sequences.
+
+        :return:
+        """
+        return self._query("SELECT COUNT(*) FROM sequences")[0][0]
+
+    def numbers(self):
+        """
+        Get Sorted Numbers of Mirrored Sequences.
+
+        :return:
+        """
+        rows = self._query("SELECT number FROM sequences ORDER BY number")
+        return [number for number, in rows]
+
+    def records(self):
+        """
+        Iterate over Mirrored Sequence Numbers, Names and Raw Data.
+
+        :return:
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT number, name, data FROM sequences ORDER BY number"
+            ).fetchall()
+        yield from rows
+
+    def items(self):
+        """
+        Iterate over Mirrored Sequence Numbers and Terms.
+
+        :return:
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT number, data FROM sequences WHERE data IS NOT NULL "
+                "ORDER BY number"
+            ).fetchall()
+        for number, data in rows:
+            yield number, list(map(int, data.split(","))) if data else []
+
+    def terms(self, key):
+        """
+        Get Mirrored Terms of Sequence, or None if Missing.
+
+        :param key:
+        :return:
+        """
+        rows = self._query(
+            "SELECT data FROM sequences WHERE number = ?", oeis_number(key)
+        )
+        if not rows or rows[0][0] is None:
+            return None
+        return list(map(int, rows[0][0].split(","))) if rows[0][0] else []
+
+    def entry(self, key, *, fallback=None):
+        """
+        Get Mirrored Entry Metadata, or None if Missing.
+
+        Fields which the dumps lack are loaded through `fallback` on first access.
+
+        :param key:
+        :param fallback:
+        :return:
+        """
+        number = oeis_number(key)
+        rows = self._query("SELECT name, data FROM sequences WHERE number = ?", number)
+        if not rows:
+            return None
+        name, data = rows[0]
+        fields = {"number": number}
+        if name is not None:
+            fields["name"] = name
+        if data is not None:
+            fields["data"] = data
+        return MirrorEntry.with_fallback(fields, fallback)
+
+    def close(self):
+        """
+        Close Mirror Database.
+
+        :return:
+        """
+        self._connection.close()
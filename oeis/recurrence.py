@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*- #
+#
+# oeis/recurrence.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Linear Recurrence Detection and Extension.
+
+"""
+
+# -------------- Standard Library -------------- #
+
+from fractions import Fraction
+from itertools import islice
+
+
+__all__ = (
+    "RECURRENCE_MAX_ORDER",
+    "RECURRENCE_CHECK_TERMS",
+    "berlekamp_massey",
+    "LinearRecurrence",
+    "find_recurrence",
+)
+
+
+RECURRENCE_MAX_ORDER = 64
+
+
+RECURRENCE_CHECK_TERMS = 8
+
+
+def _normalize(value):
+    """Convert Integral Fractions to Integers."""
+    if isinstance(value, Fraction) and value.denominator == 1:
+        return value.numerator
+    return value
+
+
+def berlekamp_massey(terms):
+    """
+    Find Shortest Linear Recurrence Generating Terms, over the Rationals.
+
+    Returns coefficients `c` with a(n) = c[0] a(n-1) + ... + c[k-1] a(n-k) for every
+    n >= k, where k is the number of coefficients.
+
+    :param terms:
+    :return:
+    """
+    terms = [Fraction(term) for term in terms]
+    current, previous = [Fraction(1)], [Fraction(1)]
+    length, shift, last = 0, 1, Fraction(1)
+    for n, term in enumerate(terms):
+        discrepancy = term
+        for i in range(1, length + 1):
+            discrepancy += current[i] * terms[n - i]
+        if not discrepancy:
+            shift += 1
+            continue
+        scale = discrepancy / last
+        updated = current + [Fraction(0)] * (len(previous) + shift - len(current))
+        for i, value in enumerate(previous):
+            updated[i + shift] -= scale * value
+        if 2 * length <= n:
+            previous, length, last, shift = current, n + 1 - length, discrepancy, 1
+        else:
+            shift += 1
+        current = updated
+    current += [Fraction(0)] * (length + 1 - len(current))
+    return [_normalize(-value) for value in current[1 : length + 1]]
+
+
+class LinearRecurrence:
+    """
+    Linear Recurrence with Constant Coefficients.
+
+    Single terms are computed by Kitamasa's method in O(k^2 log n) operations for a
+    recurrence of order k, and runs of terms by iterating the recurrence.
+
+    """
+
+    def __init__(self, coefficients, initial):
+        """
+        Initialize Recurrence.
+
+        :param coefficients: `c` with a(n) = c[0] a(n-1) + ... + c[k-1] a(n-k)
+        :param initial: first k terms
+        """
+        self.coefficients = tuple(map(_normalize, coefficients))
+        self.initial = tuple(map(_normalize, initial))
+        if len(self.initial) != len(self.coefficients):
+            raise ValueError("A recurrence of order k needs k initial terms.")
+
+    def __repr__(self):
+        """Get Recurrence Representation."""
+        return "{cls}({coefficients}, {initial})".format(
+            cls=type(self).__name__,
+            coefficients=list(self.coefficients),
+            initial=list(self.initial),
+        )
+
+    def __eq__(self, other):
+        """Check Equality of Recurrences."""
+        if isinstance(other, type(self)):
+            return (self.coefficients, self.initial) == (
+                other.coefficients,
+                other.initial,
+            )
+        return NotImplemented
+
+    def __hash__(self):
+        """Hash Recurrence."""
+        return hash((self.coefficients, self.initial))
+
+    @property
+    def order(self):
+        """Get Order of the Recurrence."""
+        return len(self.coefficients)
+
+    def _multiply(self, p, q):
+        """
+        Multiply Polynomials Modulo the Characteristic Polynomial.
+
+        :param p:
+        :param q:
+        :return:
+        """
+        k = self.order
+        product = [0] * (2 * k - 1)
+        for i, a in enumerate(p):
+            if a:
+                for j, b in enumerate(q):
+                    product[i + j] += a * b
+        for d in range(2 * k - 2, k - 1, -1):
+            top = product[d]
+            if top:
+                for i, c in enumerate(self.coefficients, 1):
+                    product[d - i] += top * c
+        return product[:k]
+
+    def _power(self, n):
+        """
+        Get x^n Modulo the Characteristic Polynomial.
+
+        :param n:
+        :return:
+        """
+        k = self.order
+        result = [1] + [0] * (k - 1)
+        base = [0, 1] + [0] * (k - 2) if k > 1 else [self.coefficients[0]]
+        while n:
+            if n & 1:
+                result = self._multiply(result, base)
+            n >>= 1
+            if n:
+                base = self._multiply(base, base)
+        return result
+
+    def term(self, n):
+        """
+        Get Term at Position by Kitamasa's Method.
+
+        :param n:
+        :return:
+        """
+        if n < self.order:
+            return self.initial[n]
+        if not self.order:
+            return 0
+        return _normalize(sum(r * a for r, a in zip(self._power(n), self.initial)))
+
+    def between(self, start, stop, step):
+        """
+        Generate Terms between Positions.
+
+        :param start:
+        :param stop:
+        :param step:
+        :return:
+        """
+        step = step or 1
+        terms = islice(self._iterate(start), 0, None, step)
+        if stop is None:
+            return terms
+        return islice(terms, len(range(start, stop, step)))
+
+    def _iterate(self, start):
+        """
+        Generate Terms from Position on, Jumping to it by Kitamasa's Method.
+
+        :param start:
+        :return:
+        """
+        k = self.order
+        if not k:
+            while True:
+                yield 0
+        window = [self.term(n) for n in range(start, start + k)]
+        while True:
+            yield window[0]
+            following = sum(c * a for c, a in zip(self.coefficients, reversed(window)))
+            window = window[1:] + [_normalize(following)]
+
+
+def find_recurrence(terms, *, max_order=RECURRENCE_MAX_ORDER):
+    """
+    Find Linear Recurrence Satisfied by Terms, or None.
+
+    The recurrence is fitted to a prefix of the terms and accepted only if it has at
+    most `max_order` coefficients, leaves `RECURRENCE_CHECK_TERMS` terms of the
+    prefix as confirmation and reproduces every remaining term.
+
+    :param terms:
+    :param max_order:
+    :return:
+    """
+    terms = [int(term) for term in terms]
+    prefix = terms[: 2 * max_order + RECURRENCE_CHECK_TERMS]
+    coefficients = berlekamp_massey(prefix)
+    order = len(coefficients)
+    if 2 * order + RECURRENCE_CHECK_TERMS > len(prefix):
+        return None
+    recurrence = LinearRecurrence(coefficients, terms[:order])
+    if list(islice(recurrence.between(0, None, 1), len(terms))) != terms:
+        return None
+    return recurrence
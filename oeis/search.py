@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*- #
+#
+# oeis/search.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+"""
+Local Subsequence Search Engine.
+
+"""
+
+# -------------- Standard Library -------------- #
+
+import re
+import zlib
+
+# -------------- External Library -------------- #
+
+import numpy
+
+# ---------------- oeis Library ---------------- #
+
+from .util import Box
+
+
+__all__ = ("SEARCH_WIDTH", "parse_terms", "SearchIndex")
+
+
+SEARCH_WIDTH = 3
+
+
+_TERM_REGEX = re.compile(r"-?\d+")
+
+
+_SEPARATOR_REGEX = re.compile(r"^[\s,\-\d]*$")
+
+
+def parse_terms(term):
+    """Parse Search Term into Canonical Term Strings, or None if not a Term List."""
+    if not isinstance(term, str) or not _SEPARATOR_REGEX.match(term):
+        return None
+    terms = [str(int(t)) for t in _TERM_REGEX.findall(term)]
+    return terms or None
+
+
+def _gram_hash(terms):
+    """Hash Run of Canonical Term Strings."""
+    text = ",".join(terms).encode("ascii")
+    return (zlib.crc32(text) << 32) | zlib.adler32(text)
+
+
+class SearchIndex:
+    """
+    Inverted Index of Term N-Grams for Local Subsequence Search.
+
+    Every run of `width` consecutive terms of every sequence is hashed into a sorted
+    posting table. A search intersects the postings of the runs in the query,
+    starting with the rarest, and verifies the few remaining candidates against the
+    stored terms.
+
+    """
+
+    def __init__(self, numbers, names, data, hashes, ids, *, width=SEARCH_WIDTH):
+        """
+        Initialize Search Index from its Tables.
+
+        :param numbers:
+        :param names:
+        :param data:
+        :param hashes:
+        :param ids:
+        :param width:
+        """
+        self.numbers = numpy.asarray(numbers, dtype=numpy.int64)
+        self.names = list(names)
+        self.data = list(data)
+        self.hashes = numpy.asarray(hashes, dtype=numpy.uint64)
+        self.ids = numpy.asarray(ids, dtype=numpy.int32)
+        self.width = width
+
+    @classmethod
+    def build(cls, records, *, width=SEARCH_WIDTH):
+        """
+        Build Search Index from Records of Number, Name and Comma Separated Terms.
+
+        :param records:
+        :param width:
+        :return:
+        """
+        numbers, names, data, hashes, ids = [], [], [], [], []
+        for number, name, terms in records:
+            terms = (terms or "").strip(",")
+            tokens = terms.split(",") if terms else []
+            index = len(numbers)
+            numbers.append(number)
+            names.append(name or "")
+            data.append(",{},".format(terms))
+            grams = {
+                _gram_hash(tokens[i : i + width])
+                for i in range(len(tokens) - width + 1)
+            }
+            hashes.extend(grams)
+            ids.extend([index] * len(grams))
+        hashes = numpy.array(hashes, dtype=numpy.uint64)
+        ids = numpy.array(ids, dtype=numpy.int32)
+        order = numpy.lexsort((ids, hashes))
+        return cls(numbers, names, data, hashes[order], ids[order], width=width)
+
+    @classmethod
+    def from_mirror(cls, mirror, *, width=SEARCH_WIDTH):
+        """
+        Build Search Index over Mirrored Sequences.
+
+        :param mirror:
+        :param width:
+        :return:
+        """
+        return cls.build(mirror.records(), width=width)
+
+    def save(self, path):
+        """
+        Save Search Index to Numpy Archive.
+
+        :param path:
+        :return:
+        """
+        with open(path, "wb") as f:
+            numpy.savez(
+                f,
+                width=self.width,
+                numbers=self.numbers,
+                names=numpy.frombuffer("\n".join(self.names).encode(), numpy.uint8),
+                data=numpy.frombuffer("\n".join(self.data).encode(), numpy.uint8),
+                hashes=self.hashes,
+                ids=self.ids,
+            )
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load Search Index from Numpy Archive.
+
+        :param path:
+        :return:
+        """
+        with numpy.load(path) as archive:
+            return cls(
+                archive["numbers"],
+                archive["names"].tobytes().decode().split("\n"),
+                archive["data"].tobytes().decode().split("\n"),
+                archive["hashes"],
+                archive["ids"],
+                width=int(archive["width"]),
+            )
+
+    def __len__(self):
+        """
+        Get Number of Indexed Sequences.
+
+        :return:
+        """
+        return len(self.numbers)
+
+    def _postings(self, gram):
+        """
+        Get Sorted Positions of Sequences Containing Run of Terms.
+
+        :param gram:
+        :return:
+        """
+        key = numpy.uint64(_gram_hash(gram))
+        left = numpy.searchsorted(self.hashes, key, side="left")
+        right = numpy.searchsorted(self.hashes, key, side="right")
+        return self.ids[left:right]
+
+    def _candidates(self, terms):
+        """
+        Get Positions of Sequences which may Contain Run of Terms.
+
+        :param terms:
+        :return:
+        """
+        width = self.width
+        if len(terms) < width:
+            return range(len(self.numbers))
+        grams = {tuple(terms[i : i + width]) for i in range(len(terms) - width + 1)}
+        postings = sorted(map(self._postings, grams), key=len)
+        candidates = postings[0]
+        for posting in postings[1:]:
+            if not len(candidates):
+                break
+            candidates = numpy.intersect1d(candidates, posting, assume_unique=True)
+        return candidates
+
+    def _matches(self, terms):
+        """
+        Get Positions of Sequences Containing Run of Canonical Term Strings.
+
+        :param terms:
+        :return:
+        """
+        needle = ",{},".format(",".join(terms))
+        return [i for i in self._candidates(terms) if needle in self.data[i]]
+
+    def find(self, terms):
+        """
+        Find Numbers of Sequences Containing Run of Integer Terms.
+
+        :param terms:
+        :return:
+        """
+        return [int(self.numbers[i]) for i in self._matches(list(map(str, terms)))]
+
+    def search(self, term, *, start=0, limit=None):
+        """
+        Search Index with the Result Shape of an OEIS JSON Search.
+
+        Returns None if the term is not a plain list of integers.
+
+        :param term:
+        :param start:
+        :param limit:
+        :return:
+        """
+        terms = parse_terms(term)
+        if terms is None:
+            return None
+        matches = self._matches(terms)
+        stop = None if limit is None else start + limit
+        results = [
+            {
+                "number": int(self.numbers[i]),
+                "name": self.names[i],
+                "data": self.data[i][1:-1],
+            }
+            for i in matches[start:stop]
+        ]
+        return {
+            "query": term,
+            "count": len(matches),
+            "start": start,
+            "results": results or None,
+        }
+
+    def iter_results(self, term, *, limit=None):
+        """
+        Iterate over Search Results as Boxes.
+
+        :param term:
+        :param limit:
+        :return:
+        """
+        result = self.search(term, limit=limit)
+        if result is None:
+            raise ValueError("Local search terms must be a list of integers.")
+        for record in result["results"] or ():
+            yield Box(record)
@@ -35,28 +35,57 @@ OEIS Sequences.
 
 import re
 import inspect
+import threading
 from collections.abc import MutableMapping
 from copy import deepcopy
 from datetime import datetime
-from itertools import chain, groupby, islice
+from itertools import chain, count, groupby, islice
 from functools import partial
 from typing import Union
 
 # -------------- External Library -------------- #
 
+import numpy
 from wrapt import ObjectProxy
 
 # ---------------- oeis Library ---------------- #
 
+from . import transforms
 from .base import name as oeis_name
 from .base import number as oeis_number
 from .base import find_references, MissingID
 from .client import entry as oeis_entry
+from .client import entries as oeis_entries
 from .client import bfile as oeis_bfile
-from .util import is_int, value_or, empty_generator, Box, BoxList
+from .memo import TermMemo
+from .meta import Keyword, SequenceMeta
+from .recurrence import RECURRENCE_MAX_ORDER, find_recurrence
+from .terms import BigIntArray, TermArray
+from .util import (
+    is_int,
+    value_or,
+    empty_generator,
+    Box,
+    BoxList,
+    GeneratorCursor,
+    SingleFlight,
+)
 
 
-__all__ = ("Sequence", "SequenceFactory", "Registry")
+__all__ = ("Sequence", "DerivedSequence", "SequenceFactory", "Registry")
+
+
+_MISSING = object()
+
+
+def _as_list(terms):
+    """
+    Get Terms as a List of Python Integers.
+
+    :param terms:
+    :return:
+    """
+    return terms if isinstance(terms, list) else terms.tolist()
 
 
 def _slice_details(f, *args, **kwargs):
@@ -90,33 +119,40 @@ class Sequence(ObjectProxy):
 
     """
 
-    def __init__(self, number, generator=None, *, meta=None):
+    def __init__(self, number, generator=None, *, meta=None, memo=None):
         """
         Initialize Proxy.
 
         :param number:
         :param generator:
         :param meta:
+        :param memo:
         """
         super().__init__(value_or(generator, empty_generator))
         self._self_number = number
-        self._self_meta = value_or(meta, Box())
+        self._self_meta = SequenceMeta.from_mapping(value_or(meta, {}))
+        self._self_derived = {}
+        self._self_memo = memo
 
     @classmethod
-    def from_dict(cls, meta):
+    def from_dict(cls, meta, *, memo=None):
         """
         Create Sequence from Metadata Dictionary.
 
         :param meta:
+        :param memo:
         :return:
         """
-        return cls(oeis_number(meta["number"]), meta=meta)
+        return cls(oeis_number(meta["number"]), meta=meta, memo=memo)
 
     @classmethod
     def from_sequence(cls, sequence, new_generator=None, *, new_meta=None, copy=False):
         """
         Generate Sequence from Existing Sequence.
 
+        The term memo is shared unless a new generator is given, in which case the
+        new sequence memoizes its own terms.
+
         :param sequence:
         :param new_generator:
         :param new_meta:
@@ -127,7 +163,8 @@ class Sequence(ObjectProxy):
             return deepcopy(sequence) if copy else sequence
         generator = value_or(new_generator, sequence.__wrapped__)
         meta = value_or(new_meta, sequence.meta)
-        return cls(sequence.number, generator, meta=meta)
+        memo = None if new_generator else sequence.memo
+        return cls(sequence.number, generator, meta=meta, memo=memo)
 
     def __call__(self, *args, **kwargs):
         """
@@ -139,6 +176,83 @@ class Sequence(ObjectProxy):
         """
         return self.__wrapped__(*args, **kwargs)
 
+    def _term_source(self, *args, **kwargs):
+        """
+        Get Argument Count and Term Function of the Generator.
+
+        The details are cached unless arguments for the generator are given. Index
+        functions are called with the sequence index and slice functions with
+        positions counted from the first term. Generator functions are read through
+        a resumable cursor, so consecutive calls continue the same iteration.
+
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        if args or kwargs:
+            return _slice_details(self.__wrapped__, *args, **kwargs)[1:]
+        if not hasattr(self, "_self_term_source"):
+            f = self.__wrapped__
+            if f is empty_generator:
+                source = 0, None
+            elif inspect.isgeneratorfunction(f):
+                source = 3, GeneratorCursor(f)
+            else:
+                source = _slice_details(f)[1:]
+            self._self_term_source = source
+        return self._self_term_source
+
+    def _derived(self, name, compute):
+        """
+        Get Property Derived from the Metadata, Computing it Once.
+
+        Derived properties are kept until the metadata is replaced.
+
+        :param name:
+        :param compute:
+        :return:
+        """
+        derived = self._self_derived
+        try:
+            return derived[name]
+        except KeyError:
+            value = derived[name] = compute()
+            return value
+
+    def _layout(self):
+        """
+        Get Cached Offset and Completeness of the Sample for Indexing.
+
+        :return:
+        """
+        try:
+            return self._self_derived["layout"]
+        except KeyError:
+            complete = Keyword.FINI | Keyword.FULL
+            layout = self.offset, self.keyword_flags & complete == complete
+            self._self_derived["layout"] = layout
+            return layout
+
+    @staticmethod
+    def _position(index, offset, length):
+        """
+        Get Position of Index, Counting Negative Indices from the End if Possible.
+
+        :param index:
+        :param offset:
+        :param length:
+        :return:
+        """
+        if index is None or index >= offset:
+            return index if index is None else index - offset
+        if index >= 0:
+            return 0
+        if length is None:
+            raise IndexError(
+                "negative index {} into sequence of unknown length".format(index)
+            )
+        return index
+
     def get(
         self,
         index,
@@ -151,6 +265,14 @@ class Sequence(ObjectProxy):
         """
         Get Index into Sequence.
 
+        Integers return a single term and slices return a generator over the terms.
+        Indices are sequence indices starting at the offset, unless `ignore_offset`
+        is set. Negative indices below the offset count from the end of sequences
+        whose sample holds every term. Terms covered by the sample are read from it
+        and the generator is only used for the remaining range. With `cache_result`,
+        generated terms are kept in the term memo of the sequence and never
+        generated twice.
+
         :param index:
         :param args:
         :param cache_result:
@@ -159,40 +281,156 @@ class Sequence(ObjectProxy):
         :param kwargs:
         :return:
         """
-        if cache_result:
-            return NotImplemented
-
-        if is_int(index):
-            index = slice(index)
+        memo = None
+        if cache_result and not (args or kwargs):
+            memo = self.memo
+            if memo is None:
+                memo = self.memo = TermMemo()
+        offset, complete = self._layout()
+        if ignore_offset:
+            offset = 0
+        length = len(self._sample()) if complete and not ignore_sample else None
         if isinstance(index, slice):
-            start, stop, step = index.start, index.stop, index.step
-            if not ignore_offset:
-                start = start - self.offset
-                if stop:
-                    stop = stop - self.offset
-        else:
+            start = self._position(index.start, offset, length)
+            stop = self._position(index.stop, offset, length)
+            return self._get_slice(
+                start, stop, index.step, length, ignore_sample, memo, *args, **kwargs
+            )
+        if not is_int(index):
             raise TypeError("expected integer or slice")
+        if 0 <= index < offset:
+            raise IndexError("index {} is before the offset".format(index))
+        position = self._position(index, offset, length)
+        if position < 0:
+            position += length
+        return self._get_term(position, length, ignore_sample, memo, *args, **kwargs)
+
+    def _get_term(self, position, length, ignore_sample, memo, *args, **kwargs):
+        """
+        Get Term at Position.
 
-        gen_type, argument_count, gen = _slice_details(self.generator, *args, **kwargs)
-
+        :param position:
+        :param length:
+        :param ignore_sample:
+        :param memo:
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        if position < 0 or (length is not None and position >= length):
+            raise IndexError("sequence index out of range")
         if not ignore_sample:
-            sample_length = len(self.sample)
-            after_sample = stop - sample_length
-            if start < sample_length:
-                yield from self.sample[start : min(stop, sample_length) : step]
-            if after_sample < 0:
-                return
-            start = sample_length
-            stop = stop
+            sample = self._sample()
+            if position < len(sample):
+                return int(sample[position])
+        if memo is None:
+            return self._generate_term(position, *args, **kwargs)
+        term = memo.get(self.number, position, _MISSING)
+        if term is _MISSING:
+            term = self._generate_term(position)
+            memo.put(self.number, position, term)
+        return term
+
+    def _generate_term(self, position, *args, **kwargs):
+        """
+        Generate Term at Position.
 
+        :param position:
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        argument_count, source = self._term_source(*args, **kwargs)
+        if argument_count == 1:
+            return source(position + self._layout()[0])
         if argument_count == 3:
-            yield from gen(start, stop, step)
+            for term in source(position, position + 1, None):
+                return term
+        raise IndexError("sequence index out of range")
+
+    def _get_slice(
+        self, start, stop, step, length, ignore_sample, memo, *args, **kwargs
+    ):
+        """
+        Generate Terms between Positions.
+
+        :param start:
+        :param stop:
+        :param step:
+        :param length:
+        :param ignore_sample:
+        :param memo:
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        step = value_or(step, 1)
+        if step == 0:
+            raise ValueError("slice step cannot be zero")
+        if length is not None:
+            yield from _as_list(self._sample()[start:stop:step])
+            return
+        if step < 0:
+            raise ValueError("negative step into sequence of unknown length")
+        start = value_or(start, 0)
+        if stop is not None and stop <= start:
+            return
+        if not ignore_sample:
+            sample = self._sample()
+            if start < len(sample):
+                yield from _as_list(sample[start:stop:step])
+                if stop is not None and stop <= len(sample):
+                    return
+                start += -(-(len(sample) - start) // step) * step
+        if memo is not None:
+            yield from self._memoized_terms(memo, start, stop, step)
+            return
+        argument_count, source = self._term_source(*args, **kwargs)
+        offset = self._layout()[0]
         if argument_count == 1:
-            if stop is None and step is None:
-                yield gen(start)
-            yield from map(gen, range(start, stop, step))
+            if stop is None:
+                indices = count(start + offset, step)
+            else:
+                indices = range(start + offset, stop + offset, step)
+            yield from map(source, indices)
+        elif argument_count == 3:
+            yield from source(start, stop, step)
+
+    def _memoized_terms(self, memo, start, stop, step):
+        """
+        Generate Terms between Positions through the Term Memo.
 
-        raise TypeError("invalid generator")
+        Memoized terms are read from the memo and missing ones are generated and
+        memoized. A slice generator is only started at the first missing position.
+
+        :param memo:
+        :param start:
+        :param stop:
+        :param step:
+        :return:
+        """
+        argument_count, source = self._term_source()
+        offset = self._layout()[0]
+        positions = count(start, step) if stop is None else range(start, stop, step)
+        terms = None
+        for position in positions:
+            if terms is None:
+                term = memo.get(self.number, position, _MISSING)
+                if term is not _MISSING:
+                    yield term
+                    continue
+                if argument_count == 1:
+                    term = source(position + offset)
+                elif argument_count == 3:
+                    terms = iter(source(position, stop, step))
+                else:
+                    return
+            if terms is not None:
+                term = next(terms, _MISSING)
+                if term is _MISSING:
+                    return
+            memo.put(self.number, position, term)
+            yield term
 
     def __getitem__(self, index, *args):
         """
@@ -209,6 +447,16 @@ class Sequence(ObjectProxy):
         """Get Sequence Number."""
         return self._self_number
 
+    @property
+    def memo(self):
+        """Get Term Memo."""
+        return self._self_memo
+
+    @memo.setter
+    def memo(self, memo):
+        """Set Term Memo."""
+        self._self_memo = memo
+
     @property
     def short_name(self):
         """Get Sequence Short Name."""
@@ -236,13 +484,25 @@ class Sequence(ObjectProxy):
 
     @property
     def meta(self):
-        """Get Full Metadata Box."""
+        """Get Full Metadata Record."""
         return self._self_meta
 
+    @meta.setter
+    def meta(self, meta):
+        """Replace Metadata Record, Dropping Everything Derived from it."""
+        self._self_meta = SequenceMeta.from_mapping(value_or(meta, {}))
+        self._self_derived = {}
+        self.sample_reset()
+
     @property
     def offset(self):
         """Get Sequence Offset."""
-        return int(self.meta.offset.split(",")[0])
+
+        def parse():
+            offset = self.meta.offset
+            return int(offset.split(",")[0]) if offset else 0
+
+        return self._derived("offset", parse)
 
     @property
     def description(self):
@@ -251,25 +511,73 @@ class Sequence(ObjectProxy):
 
     @property
     def sample(self):
-        """Get Cached Sample of the Sequence."""
+        """
+        Get Cached Sample of the Sequence as a List of Integers.
+
+        Attached terms are converted to a list once, on first access. Indexing the
+        sequence reads attached terms directly and never builds this list.
+
+        """
+        sample = self._sample()
+        if isinstance(sample, list):
+            return sample
+        return self._derived("sample", sample.tolist)
+
+    def _sample(self):
+        """Get Cached Sample as Stored, without Copying Attached Terms."""
         if not hasattr(self, "_self_sample"):
-            self._self_sample = list(map(int, self.meta.data.split(",")))
+            data = self.meta.data
+            self._self_sample = list(map(int, data.split(","))) if data else []
             self._self_with_bfile = False
         return self._self_sample
 
+    def _mutable_sample(self):
+        """Get Sample as a List, Copying Stored Terms on First Write."""
+        sample = self._self_sample = self.sample
+        self._forget_sample_views()
+        return sample
+
     def sample_append(self, value):
         """Append to Sequence Sample."""
-        self.sample.append(value)
+        self._mutable_sample().append(value)
 
     def sample_extend(self, values):
         """Extend Sample Sequence."""
-        self.sample.extend(values)
+        self._mutable_sample().extend(values)
+
+    def sample_attach(self, terms, *, with_bfile=True):
+        """Replace Sample with Stored Terms, Read without Copying."""
+        self._self_sample = terms
+        self._self_with_bfile = with_bfile
+        self._forget_sample_views()
 
     def sample_reset(self):
         """Reset Sequence Sample to Metadata Default."""
         if hasattr(self, "_self_sample"):
             del self._self_sample
             self._self_with_bfile = False
+        self._forget_sample_views()
+
+    def _forget_sample_views(self):
+        """Drop List and Array Views Built from the Previous Sample."""
+        self._self_derived.pop("sample", None)
+        self._self_derived.pop("array", None)
+
+    @property
+    def array(self):
+        """Get Known Terms as a Read-Only Term Array, Indexed from the Offset."""
+        return self._derived("array", self._build_array)
+
+    def _build_array(self):
+        """Build Term Array of the Sample, Reusing Stored Arrays without Copies."""
+        sample = self._sample()
+        if isinstance(sample, TermArray) and sample.offset == self.offset:
+            return sample
+        if isinstance(sample, BigIntArray):
+            sample = numpy.asarray(sample)
+        array = TermArray(sample, self.offset)
+        array.flags.writeable = False
+        return array
 
     @property
     def with_bfile(self):
@@ -306,31 +614,59 @@ class Sequence(ObjectProxy):
     @property
     def programs(self):
         """Get OEIS Sample Programs."""
-        return Box(
-            maple=self.meta.maple,
-            mathematica=self.meta.mathematica,
-            **self._parse_programs(self.meta.program)
+        return self._derived(
+            "programs",
+            lambda: Box(
+                maple=self.meta.maple,
+                mathematica=self.meta.mathematica,
+                **self._parse_programs(self.meta.program)
+            ),
         )
 
+    def _keywords(self):
+        """Get Cached OEIS Keywords as a Tuple."""
+
+        def parse():
+            keyword = self.meta.keyword
+            return tuple(keyword.split(",")) if keyword else ()
+
+        return self._derived("keywords", parse)
+
     @property
     def keywords(self):
         """Get OEIS Keywords."""
-        return self.meta.keyword.split(",")
+        return list(self._keywords())
+
+    @property
+    def keyword_flags(self):
+        """Get Known OEIS Keywords as Flags."""
+        return self._derived("keyword_flags", lambda: Keyword.parse(self._keywords()))
+
+    def has_keywords(self, flags):
+        """
+        Check if Sequence has every Keyword in Flags.
+
+        :param flags:
+        :return:
+        """
+        return self.keyword_flags & flags == flags
 
     @property
     def recycled(self):
         """Check if Sequence is Recycled."""
-        return "recycled" in self.keywords
+        return bool(self.keyword_flags & Keyword.RECYCLED)
 
     @property
     def modified(self):
         """Get Last Modified Time."""
-        return datetime.fromisoformat(self.meta.time)
+        return self._derived("modified", lambda: datetime.fromisoformat(self.meta.time))
 
     @property
     def created(self):
         """Get Created Time."""
-        return datetime.fromisoformat(self.meta.created)
+        return self._derived(
+            "created", lambda: datetime.fromisoformat(self.meta.created)
+        )
 
     @classmethod
     def _find_chain_references(cls, text):
@@ -345,13 +681,12 @@ class Sequence(ObjectProxy):
     @property
     def cross_references(self):
         """Get Cross References for Sequence."""
-        if not hasattr(self, "_self_xref"):
+
+        def parse():
             xref = self.meta.xref
-            if xref:
-                self._self_xref = self._find_xref_keys(xref)
-            else:
-                self._self_xref = tuple()
-        return self._self_xref
+            return self._find_xref_keys(xref) if xref else tuple()
+
+        return self._derived("xref", parse)
 
     @classmethod
     def _parse_comments(cls, comments):
@@ -363,18 +698,297 @@ class Sequence(ObjectProxy):
     @property
     def comments(self):
         """Get Comments for Sequence."""
-        if not hasattr(self, "_self_comments"):
+
+        def parse():
             comments = self.meta.comment
             if comments:
-                self._self_comments = BoxList(tuple(self._parse_comments(comments)))
-            else:
-                self._self_comments = BoxList()
-        return self._self_comments
+                return BoxList(tuple(self._parse_comments(comments)))
+            return BoxList()
+
+        return self._derived("comments", parse)
 
     @property
     def finite(self):
         """Get Finiteness of Sequence."""
-        return NotImplemented
+        return bool(self.keyword_flags & Keyword.FINI)
+
+    def terms(self, n):
+        """
+        Get First Terms as a Term Array, Generating the Ones Missing from the Sample.
+
+        Sequences which run out of terms return fewer than `n` of them.
+
+        :param n:
+        :return:
+        """
+        known = self.array[:n]
+        if len(known) >= n:
+            return known
+        missing = slice(len(known), n)
+        extra = self.get(missing, ignore_offset=True, ignore_sample=True)
+        return TermArray(numpy.concatenate((known, TermArray(extra))), self.offset)
+
+    def find_recurrence(self, *, max_order=RECURRENCE_MAX_ORDER):
+        """
+        Find Linear Recurrence Satisfied by the Known Terms, or None.
+
+        :param max_order:
+        :return:
+        """
+        return find_recurrence(self.array.tolist(), max_order=max_order)
+
+    def extend(self, n, *, max_order=RECURRENCE_MAX_ORDER):
+        """
+        Extend Sequence by its Linear Recurrence and Get its First Terms.
+
+        The recurrence found in the known terms replaces the generator, so terms past
+        the sample are computed locally from then on.
+
+        :param n:
+        :param max_order:
+        :return:
+        """
+        recurrence = self.find_recurrence(max_order=max_order)
+        if recurrence is None:
+            raise ValueError("No linear recurrence found for {}.".format(self.name))
+        self.__wrapped__ = recurrence.between
+        if hasattr(self, "_self_term_source"):
+            del self._self_term_source
+        if self.memo is not None:
+            self.memo.discard(self.number)
+        return self.terms(n)
+
+    def _derive(self, label, compute, *operands, offset=None):
+        """
+        Make Lazy Sequence Derived from this Sequence.
+
+        :param label:
+        :param compute:
+        :param operands:
+        :param offset:
+        :return:
+        """
+        names = (getattr(o, "name", o) for o in (self,) + operands)
+        return DerivedSequence(
+            compute,
+            name="{}({})".format(label, ", ".join(map(str, names))),
+            offset=value_or(offset, self.offset),
+        )
+
+    def partial_sums(self):
+        """Get Lazy Sequence of Partial Sums."""
+        compute = lambda n: transforms.partial_sums(self.terms(n))
+        return self._derive("partial_sums", compute)
+
+    def differences(self):
+        """Get Lazy Sequence of First Differences."""
+        compute = lambda n: transforms.differences(self.terms(n + 1))
+        return self._derive("differences", compute)
+
+    def binomial_transform(self):
+        """Get Lazy Binomial Transform."""
+        compute = lambda n: transforms.binomial_transform(self.terms(n))
+        return self._derive("binomial_transform", compute)
+
+    def euler_transform(self):
+        """Get Lazy Euler Transform, Reading Terms as a(1), a(2), ..."""
+        compute = lambda n: transforms.euler_transform(self.terms(n))
+        return self._derive("euler_transform", compute, offset=1)
+
+    def mobius_transform(self):
+        """Get Lazy Möbius Transform, Reading Terms as a(1), a(2), ..."""
+        compute = lambda n: transforms.mobius_transform(self.terms(n))
+        return self._derive("mobius_transform", compute, offset=1)
+
+    def convolve(self, other):
+        """
+        Get Lazy Convolution with another Sequence.
+
+        :param other:
+        :return:
+        """
+        compute = lambda n: transforms.convolve(self.terms(n), other.terms(n))
+        return self._derive("convolve", compute, other)
+
+    def _combine(self, label, f, other):
+        """
+        Get Lazy Elementwise Combination with a Sequence or an Integer.
+
+        :param label:
+        :param f:
+        :param other:
+        :return:
+        """
+        if isinstance(other, Sequence):
+            compute = lambda n: f(self.terms(n), other.terms(n))
+        elif is_int(other):
+            compute = lambda n: f(self.terms(n), int(other))
+        else:
+            return NotImplemented
+        return self._derive(label, compute, other)
+
+    def add(self, other):
+        """
+        Add Sequence or Integer Elementwise.
+
+        :param other:
+        :return:
+        """
+        return self._combine("add", transforms.add, other)
+
+    def subtract(self, other):
+        """
+        Subtract Sequence or Integer Elementwise.
+
+        :param other:
+        :return:
+        """
+        return self._combine("subtract", transforms.subtract, other)
+
+    def multiply(self, other):
+        """
+        Multiply by Sequence or Integer Elementwise.
+
+        :param other:
+        :return:
+        """
+        return self._combine("multiply", transforms.multiply, other)
+
+    def __add__(self, other):
+        """Add Sequence or Integer Elementwise."""
+        return self.add(other)
+
+    def __radd__(self, other):
+        """Add Integer Elementwise."""
+        return self.add(other)
+
+    def __sub__(self, other):
+        """Subtract Sequence or Integer Elementwise."""
+        return self.subtract(other)
+
+    def __rsub__(self, other):
+        """Subtract from Integer Elementwise."""
+        return self.multiply(-1).add(other)
+
+    def __mul__(self, other):
+        """Multiply by Sequence or Integer Elementwise."""
+        return self.multiply(other)
+
+    def __rmul__(self, other):
+        """Multiply by Integer Elementwise."""
+        return self.multiply(other)
+
+    def __neg__(self):
+        """Negate Sequence Elementwise."""
+        return self.multiply(-1)
+
+
+class _Derivation:
+    """
+    Lazily Computed Terms of a Derived Sequence.
+
+    """
+
+    def __init__(self, compute):
+        """
+        Initialize Derivation.
+
+        :param compute:
+        """
+        self.compute = compute
+        self._terms = TermArray(())
+        self._exhausted = False
+        self._lock = threading.Lock()
+
+    def terms(self, n):
+        """
+        Get First Terms, Growing the Computed Prefix Geometrically.
+
+        :param n:
+        :return:
+        """
+        with self._lock:
+            if len(self._terms) < n and not self._exhausted:
+                size = max(n, 2 * len(self._terms), transforms.TRANSFORM_CHUNK_SIZE)
+                terms = self.compute(size)
+                terms.flags.writeable = False
+                self._terms = terms
+                self._exhausted = len(terms) < size
+            return self._terms[:n]
+
+    def between(self, start, stop, step):
+        """
+        Generate Terms between Positions.
+
+        :param start:
+        :param stop:
+        :param step:
+        :return:
+        """
+        step = value_or(step, 1)
+        if stop is not None:
+            return iter(self.terms(stop)[start::step].tolist())
+        return self._iterate(start, step)
+
+    def _iterate(self, position, step):
+        """
+        Generate Terms from Position on, One Computed Chunk at a Time.
+
+        :param position:
+        :param step:
+        :return:
+        """
+        while True:
+            terms = self.terms(position + transforms.TRANSFORM_CHUNK_SIZE * step)
+            chunk = terms[position::step]
+            if not len(chunk):
+                return
+            yield from chunk.tolist()
+            position += len(chunk) * step
+
+
+class DerivedSequence(Sequence):
+    """
+    Sequence Computed Lazily from Other Sequences.
+
+    """
+
+    def __init__(self, compute, *, name, offset=0):
+        """
+        Initialize Derived Sequence.
+
+        :param compute: function from a term count to at most that many terms
+        :param name:
+        :param offset:
+        """
+        derivation = _Derivation(compute)
+        meta = Box(name=name, offset="{},1".format(offset))
+        super().__init__(None, derivation.between, meta=meta)
+        self._self_derivation = derivation
+
+    @property
+    def short_name(self):
+        """Get Derived Sequence Name."""
+        return self.meta.name
+
+    @property
+    def name(self):
+        """Get Derived Sequence Name."""
+        return self.meta.name
+
+    @property
+    def website(self):
+        """Derived Sequences have no Website."""
+        return None
+
+    def terms(self, n):
+        """
+        Get First Terms as a Term Array.
+
+        :param n:
+        :return:
+        """
+        return TermArray(self._self_derivation.terms(n), self.offset)
 
 
 class SequenceFactory:
@@ -383,31 +997,74 @@ class SequenceFactory:
 
     """
 
-    __slots__ = ("session", "cache", "always_cache")
-
-    def __init__(self, *, factory=dict, session=None, always_cache=False):
+    __slots__ = (
+        "session",
+        "cache",
+        "always_cache",
+        "mirror",
+        "store",
+        "memo",
+        "_in_flight",
+    )
+
+    def __init__(
+        self,
+        *,
+        factory=dict,
+        session=None,
+        always_cache=False,
+        mirror=None,
+        store=None,
+        memo=None,
+    ):
         """
         Initialize Sequence Factory.
 
         :param factory:
         :param session:
         :param always_cache:
+        :param mirror:
+        :param store:
+        :param memo:
         """
         self.cache = factory()
         self.session = session
         self.always_cache = always_cache
+        self.mirror = mirror
+        self.store = store
+        self.memo = value_or(memo, TermMemo())
+        self._in_flight = SingleFlight()
 
     @classmethod
-    def from_cache(cls, cache, *, session=None, always_cache=False):
+    def from_cache(
+        cls,
+        cache,
+        *,
+        session=None,
+        always_cache=False,
+        mirror=None,
+        store=None,
+        memo=None,
+    ):
         """
         Make Sequence Factory from Pre-loaded Cache.
 
         :param cache:
         :param session:
         :param always_cache:
+        :param mirror:
+        :param store:
+        :param memo:
         :return:
         """
-        return cls(factory=lambda: cache, session=session, always_cache=always_cache)
+        return cls(
+            factory=lambda: cache,
+            session=session,
+            always_cache=always_cache,
+            mirror=mirror,
+            store=store,
+            memo=memo,
+        )
 
     def __reduce__(self):
         """
@@ -435,6 +1092,7 @@ class SequenceFactory:
         :return:
         """
         self.cache.clear()
+        self.memo.clear()
 
     def __contains__(self, item) -> bool:
         """
@@ -447,27 +1105,62 @@ class SequenceFactory:
 
     def load_meta(self, key, *, check_name=False):
         """Load Metadata Dictionary from Loader."""
-        return oeis_entry(key, self.session, check_name=check_name)
+        return oeis_entry(key, self.session, check_name=check_name, mirror=self.mirror)
 
     def extend_from_bfile(self, key, sequence, *, check_name=False):
         """
         Extend Sample Data for Sequence from B-File if possible.
 
+        With a term store, the extended sample is written to the store once and read
+        back through a shared memory map by every process using the same store.
+        Otherwise samples with terms too large for `int64` are packed into a
+        `BigIntArray`.
+
         :param key:
         :param sequence:
         :param check_name:
         :return:
         """
-        data = oeis_bfile(key, self.session, check_name=check_name)
-        if data:
-            sequence.sample_extend(data[len(sequence.sample) :])
-            sequence._self_with_bfile = True
+        terms = None if self.store is None else self.store.get(key)
+        if terms is None:
+            data = oeis_bfile(key, self.session, check_name=check_name, as_array=True)
+            if not len(data):
+                return sequence
+            sample = TermArray(sequence.sample)
+            terms = numpy.concatenate((sample, data[len(sample) :]))
+            if self.store is not None:
+                self.store.put(key, terms, offset=sequence.offset)
+                terms = self.store.get(key)
+            elif terms.dtype == numpy.int64:
+                terms = terms.tolist()
+            else:
+                terms = BigIntArray(terms, sequence.offset)
+        sequence.sample_attach(terms)
         return sequence
 
+    def _load_uncached(self, key, *, with_bfile=False):
+        """
+        Load Sequence bypassing the Cache.
+
+        :param key:
+        :param with_bfile:
+        :return:
+        """
+        meta = self.load_meta(key, check_name=False)
+        if not meta:
+            raise MissingID.from_key(key)
+        if with_bfile:
+            return self.extend_from_bfile(
+                key, Sequence.from_dict(meta, memo=self.memo), check_name=False
+            )
+        return Sequence.from_dict(meta, memo=self.memo)
+
     def load(self, key, *, cache_result=True, with_bfile=False):
         """
         Load Sequence with Default Caching.
 
+        Concurrent loads of the same key share a single request.
+
         :param key:
         :param cache_result:
         :param with_bfile:
@@ -477,24 +1170,47 @@ class SequenceFactory:
         try:
             previous = self.cache[key]
             if with_bfile and not previous.with_bfile:
-                return self.extend_from_bfile(key, previous, check_name=False)
+                return self._in_flight.do(
+                    ("bfile", key),
+                    self.extend_from_bfile,
+                    key,
+                    previous,
+                    check_name=False,
+                )
             return previous
         except KeyError:
             pass
-        meta = self.load_meta(key, check_name=False)
-        if not meta:
-            raise MissingID.from_key(key)
-        if with_bfile:
-            entry = self.extend_from_bfile(
-                key, Sequence.from_dict(meta), check_name=False
-            )
-        else:
-            entry = Sequence.from_dict(meta)
+        entry = self._in_flight.do(
+            ("load", key, with_bfile), self._load_uncached, key, with_bfile=with_bfile
+        )
         if cache_result or self.always_cache:
             self.cache[key] = entry
             return self.cache[key]
         return entry
 
+    def load_many(self, keys, *, cache_result=True):
+        """
+        Load Many Sequences with Batched Metadata Requests.
+
+        Missing sequences are returned as None.
+
+        :param keys:
+        :param cache_result:
+        :return:
+        """
+        keys = [oeis_name(key) for key in keys]
+        missing = [key for key in dict.fromkeys(keys) if key not in self.cache]
+        metas = oeis_entries(
+            missing, self.session, check_name=False, mirror=self.mirror
+        )
+        loaded = {}
+        for key, meta in zip(missing, metas):
+            if meta:
+                loaded[key] = Sequence.from_dict(meta, memo=self.memo)
+                if cache_result or self.always_cache:
+                    self.cache[key] = loaded[key]
+        return [self.cache.get(key, loaded.get(key)) for key in keys]
+
     def safe_load(self, *args, **kwargs) -> Union[Sequence, None]:
         """"""
         try:
@@ -537,15 +1253,21 @@ class Registry(MutableMapping):
         obj._factory = factory
         return obj
 
-    def __new__(cls, *, cache_factory=dict, session=None):
+    def __new__(cls, *, cache_factory=dict, session=None, mirror=None, store=None):
         """
         Make new Registry.
 
         :param cache_factory:
         :param session:
+        :param mirror:
+        :param store:
         :return:
         """
-        return cls.from_factory(SequenceFactory(factory=cache_factory, session=session))
+        return cls.from_factory(
+            SequenceFactory(
+                factory=cache_factory, session=session, mirror=mirror, store=store
+            )
+        )
 
     def __repr__(self):
         """Get Registry Representation."""
@@ -591,6 +1313,30 @@ class Registry(MutableMapping):
         """Clear Factory."""
         return self._factory.clear()
 
+    def stack(self, keys, n):
+        """
+        Stack First Terms of Registered Sequences into a Two-Dimensional Array.
+
+        Terms are read from the known terms of each sequence and only the missing
+        ones are generated. The array is `int64` when every term fits and holds
+        Python integers otherwise.
+
+        :param keys:
+        :param n:
+        :return:
+        """
+        rows = []
+        for key in keys:
+            terms = self[key].terms(n)
+            if len(terms) < n:
+                raise ValueError(
+                    "{} has only {} terms, {} requested.".format(key, len(terms), n)
+                )
+            rows.append(terms)
+        if not rows:
+            return numpy.empty((0, n), dtype=numpy.int64)
+        return numpy.stack(rows).view(numpy.ndarray)
+
     def register(self, key, generator=None, *, meta=None):
         """
         Register Sequence through Factory.
@@ -600,9 +1346,12 @@ class Registry(MutableMapping):
         :param meta:
         :return:
         """
+        memo = self._factory.memo
         try:
             cached_sequence = self[key]
             if meta and cached_sequence.meta == meta:
+                if generator is not None:
+                    memo.discard(cached_sequence.number)
                 return Sequence.from_sequence(cached_sequence, generator)
             generator = value_or(generator, cached_sequence.__wrapped__)
         except KeyError:
@@ -615,5 +1364,6 @@ class Registry(MutableMapping):
             raise ValueError(
                 "OEIS indices don't match: {} should be {}".format(number, meta.number)
             )
-        self[key] = Sequence(number, generator=generator, meta=meta)
+        memo.discard(number)
+        self[key] = Sequence(number, generator=generator, meta=meta, memo=memo)
         return self[key]
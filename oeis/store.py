@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*- #
+#
+# oeis/store.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Memory-Mapped Store of Sequence Terms.
+
+"""
+
+# -------------- Standard Library -------------- #
+
+import os
+import mmap
+import struct
+import threading
+
+# -------------- External Library -------------- #
+
+import numpy
+
+# ---------------- oeis Library ---------------- #
+
+from .base import name as oeis_name
+from .cache import _atomic_write
+from .terms import BigIntArray, TermArray
+
+
+__all__ = ("STORE_VARIABLE", "default_store", "TermStore")
+
+
+STORE_VARIABLE = "OEIS_STORE"
+
+
+_MAGIC = b"OEIS"
+
+
+_HEADER = struct.Struct("<4sB3xqQ")
+
+
+_FIXED, _VARIABLE = 0, 1
+
+
+def default_store():
+    """Open Term Store in the Directory named by the Environment, if any."""
+    directory = os.environ.get(STORE_VARIABLE)
+    return TermStore(directory) if directory else None
+
+
+class TermStore:
+    """
+    Directory of Binary Term Files Read through Shared Memory Maps.
+
+    Sequences whose terms fit in `int64` are stored as fixed-width arrays and others
+    in the packed variable-width layout of `BigIntArray`. Every process mapping the same
+    file shares its pages through the operating system page cache.
+
+    """
+
+    def __init__(self, directory):
+        """
+        Open Term Store.
+
+        :param directory:
+        """
+        self.directory = os.path.expanduser(str(directory))
+        self._maps = {}
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key):
+        """
+        Get Path of Term File for Sequence.
+
+        :param key:
+        :return:
+        """
+        return os.path.join(self.directory, oeis_name(key) + ".terms")
+
+    def put(self, key, terms, *, offset=0):
+        """
+        Write Terms of a Sequence to the Store.
+
+        :param key:
+        :param terms:
+        :param offset:
+        :return:
+        """
+        if not isinstance(terms, BigIntArray):
+            terms = TermArray(terms)
+            if terms.dtype != numpy.int64:
+                terms = BigIntArray(terms)
+        if isinstance(terms, BigIntArray):
+            offsets, data = terms.parts()
+            header = _HEADER.pack(_MAGIC, _VARIABLE, offset, len(terms))
+            body = offsets.astype("<u8").tobytes() + data
+        else:
+            header = _HEADER.pack(_MAGIC, _FIXED, offset, len(terms))
+            body = terms.astype("<i8").tobytes()
+        path = self._path(key)
+        _atomic_write(path, header + body)
+        with self._lock:
+            self._maps.pop(path, None)
+
+    def _map(self, path):
+        """
+        Get Shared Read-Only Memory Map of Term File.
+
+        :param path:
+        :return:
+        """
+        with self._lock:
+            if path not in self._maps:
+                with open(path, "rb") as f:
+                    self._maps[path] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return self._maps[path]
+
+    def get(self, key):
+        """
+        Get Stored Terms of a Sequence without Copying, or None if Missing.
+
+        :param key:
+        :return:
+        """
+        try:
+            buffer = self._map(self._path(key))
+        except (FileNotFoundError, ValueError):
+            return None
+        magic, kind, offset, count = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC:
+            raise ValueError("not a term file: {}".format(self._path(key)))
+        if kind == _FIXED:
+            terms = numpy.frombuffer(buffer, "<i8", count, _HEADER.size)
+            return TermArray(terms, offset)
+        offsets = numpy.frombuffer(buffer, "<u8", count + 1, _HEADER.size)
+        start = _HEADER.size + offsets.nbytes
+        return BigIntArray.from_buffer(buffer, offsets, start, offset)
+
+    def __contains__(self, key):
+        """
+        Check if Sequence is in the Store.
+
+        :param key:
+        :return:
+        """
+        return os.path.exists(self._path(key))
+
+    def delete(self, key):
+        """
+        Delete Stored Terms of a Sequence.
+
+        :param key:
+        :return:
+        """
+        path = self._path(key)
+        with self._lock:
+            self._maps.pop(path, None)
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
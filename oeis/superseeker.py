@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*- #
+#
+# oeis/superseeker.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Local Superseeker over Transformed Terms.
+
+"""
+
+# -------------- Standard Library -------------- #
+
+import os
+import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import product, repeat
+
+# ---------------- oeis Library ---------------- #
+
+from . import transforms
+from .search import SearchIndex, parse_terms
+from .terms import TermArray
+from .util import value_or, Box
+
+
+__all__ = (
+    "SEEK_DEPTH",
+    "SEEK_MIN_TERMS",
+    "TRANSFORM_BANK",
+    "Superseeker",
+    "superseek",
+)
+
+
+SEEK_DEPTH = 2
+
+
+SEEK_MIN_TERMS = 4
+
+
+def negate(terms):
+    """Negate Terms."""
+    return transforms.multiply(terms, -1)
+
+
+def divide_gcd(terms):
+    """Divide Terms by their Greatest Common Divisor, if it is not One."""
+    divisor = reduce(math.gcd, terms.tolist(), 0)
+    if divisor <= 1:
+        return None
+    return TermArray([term // divisor for term in terms.tolist()])
+
+
+def increment(terms):
+    """Add One to Terms."""
+    return transforms.add(terms, 1)
+
+
+def decrement(terms):
+    """Subtract One from Terms."""
+    return transforms.subtract(terms, 1)
+
+
+def drop_first(terms):
+    """Drop First Term."""
+    return terms[1:]
+
+
+TRANSFORM_BANK = {
+    "negate": negate,
+    "divide_gcd": divide_gcd,
+    "increment": increment,
+    "decrement": decrement,
+    "drop_first": drop_first,
+    "partial_sums": transforms.partial_sums,
+    "differences": transforms.differences,
+    "binomial_transform": transforms.binomial_transform,
+    "euler_transform": transforms.euler_transform,
+    "mobius_transform": transforms.mobius_transform,
+}
+
+
+_WORKER = {}
+
+
+def _initialize(path, bank):
+    """
+    Load Search Index and Transform Bank into a Worker Process.
+
+    :param path:
+    :param bank:
+    :return:
+    """
+    _WORKER["index"] = SearchIndex.load(path)
+    _WORKER["bank"] = bank
+
+
+def _seek_with(index, bank, terms, chains, min_terms):
+    """
+    Look up every Transform Chain Applied to Terms in a Search Index.
+
+    :param index:
+    :param bank:
+    :param terms:
+    :param chains:
+    :param min_terms:
+    :return:
+    """
+    found = []
+    for chain in chains:
+        variant = TermArray(terms)
+        for name in chain:
+            variant = bank[name](variant)
+            if variant is None or len(variant) < min_terms:
+                break
+        else:
+            tokens = list(map(str, variant.tolist()))
+            for i in index._matches(tokens):
+                found.append((chain, int(index.numbers[i]), index.names[i]))
+    return found
+
+
+def _seek(terms, chains, min_terms):
+    """
+    Look up Transform Chains in a Worker Process.
+
+    :param terms:
+    :param chains:
+    :param min_terms:
+    :return:
+    """
+    return _seek_with(_WORKER["index"], _WORKER["bank"], terms, chains, min_terms)
+
+
+class Superseeker:
+    """
+    Identify Terms as OEIS Sequences under Chains of Transforms.
+
+    Every chain of up to `depth` transforms from the bank is applied to the terms
+    and the result is looked up in a saved local search index. Chains are spread
+    over a process pool whose workers load the index once. With `processes=0`
+    the chains are looked up in the calling process. Transforms in the bank must
+    be picklable to be sent to the workers.
+
+    """
+
+    def __init__(
+        self,
+        path,
+        *,
+        bank=None,
+        depth=SEEK_DEPTH,
+        processes=None,
+        min_terms=SEEK_MIN_TERMS,
+    ):
+        """
+        Initialize Superseeker.
+
+        :param path: path of a saved `SearchIndex`
+        :param bank:
+        :param depth:
+        :param processes:
+        :param min_terms:
+        """
+        self.path = path
+        self.bank = dict(value_or(bank, TRANSFORM_BANK))
+        self.depth = depth
+        self.processes = value_or(processes, os.cpu_count() or 1)
+        self.min_terms = min_terms
+        self._executor = None
+        self._index = None
+
+    def __enter__(self):
+        """Enter Superseeker Context."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Exit Superseeker Context, Shutting Down the Pool."""
+        self.close()
+
+    def close(self):
+        """
+        Shut Down Worker Pool.
+
+        :return:
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def chains(self):
+        """
+        Get Transform Chains in Rank Order, Shortest First.
+
+        :return:
+        """
+        names = list(self.bank)
+        chains = [()]
+        for length in range(1, self.depth + 1):
+            chains.extend(product(names, repeat=length))
+        return chains
+
+    def _lookup(self, terms, chains):
+        """
+        Look up Transform Chains, in the Pool if there is one.
+
+        :param terms:
+        :param chains:
+        :return:
+        """
+        if not self.processes:
+            if self._index is None:
+                self._index = SearchIndex.load(self.path)
+            return [_seek_with(self._index, self.bank, terms, chains, self.min_terms)]
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.processes,
+                initializer=_initialize,
+                initargs=(self.path, self.bank),
+            )
+        size = -(-len(chains) // (4 * self.processes))
+        batches = [chains[i : i + size] for i in range(0, len(chains), size)]
+        return self._executor.map(_seek, repeat(terms), batches, repeat(self.min_terms))
+
+    def seek(self, terms, *, limit=None):
+        """
+        Find Sequences Matching Transformed Terms, Ranked by Transform Chain.
+
+        Each sequence is reported once, with the shortest chain producing it.
+
+        :param terms: list of integers or comma separated term string
+        :param limit:
+        :return:
+        """
+        if isinstance(terms, str):
+            terms = value_or(parse_terms(terms), [])
+        terms = [int(term) for term in terms]
+        if len(terms) < self.min_terms:
+            return []
+        chains = self.chains()
+        rank = {chain: i for i, chain in enumerate(chains)}
+        best = {}
+        for found in self._lookup(terms, chains):
+            for chain, number, name in found:
+                if number not in best or rank[chain] < rank[best[number][0]]:
+                    best[number] = chain, name
+        ranked = sorted(best.items(), key=lambda item: (rank[item[1][0]], item[0]))
+        return [
+            Box(number=number, name=name, transforms=chain)
+            for number, (chain, name) in ranked[:limit]
+        ]
+
+
+def superseek(terms, path, *, limit=None, **kwargs):
+    """
+    Find Sequences Matching Transformed Terms with a Temporary Superseeker.
+
+    :param terms:
+    :param path:
+    :param limit:
+    :param kwargs:
+    :return:
+    """
+    with Superseeker(path, **kwargs) as seeker:
+        return seeker.seek(terms, limit=limit)
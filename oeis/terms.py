@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*- #
+#
+# oeis/terms.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Arrays of Sequence Terms.
+
+"""
+
+# -------------- Standard Library -------------- #
+
+import warnings
+from functools import lru_cache
+
+# -------------- External Library -------------- #
+
+import numpy
+
+# ---------------- oeis Library ---------------- #
+
+from .util import import_package, value_or
+
+
+__all__ = (
+    "GMPY2_SUPPORT",
+    "INT64_DIGITS",
+    "parse_int",
+    "encode_int",
+    "TermArray",
+    "BigIntArray",
+    "load_terms",
+)
+
+
+gmpy2, GMPY2_SUPPORT = import_package("gmpy2")
+
+
+INT64_DIGITS = 18
+
+
+_DIGIT_CHUNK_SIZE = 4000
+
+
+@lru_cache(maxsize=None)
+def _power_of_ten(exponent):
+    """Get Cached Power of Ten."""
+    return 10 ** exponent
+
+
+def parse_int(token):
+    """
+    Parse Decimal Integer of Any Length.
+
+    Long tokens are parsed with _gmpy2_ when it is installed and otherwise split in
+    half recursively, which is faster than `int` on thousands of digits and is not
+    subject to the interpreter limit on integer string conversion.
+
+    :param token:
+    :return:
+    """
+    if len(token) <= _DIGIT_CHUNK_SIZE:
+        return int(token)
+    if GMPY2_SUPPORT:
+        return int(gmpy2.mpz(token))
+    token = token.strip()
+    if token[0] in "+-":
+        return -parse_int(token[1:]) if token[0] == "-" else parse_int(token[1:])
+    split = len(token) // 2
+    head, tail = token[:split], token[split:]
+    return parse_int(head) * _power_of_ten(len(tail)) + parse_int(tail)
+
+
+def encode_int(value):
+    """Encode Integer as Little-Endian Two's Complement Bytes."""
+    return value.to_bytes(value.bit_length() // 8 + 1, "little", signed=True)
+
+
+class TermArray(numpy.ndarray):
+    """
+    Array of Sequence Terms with Index Offset.
+
+    Terms are stored as `int64` when they all fit and as Python integers otherwise.
+
+    """
+
+    def __new__(cls, terms=(), offset=0):
+        """
+        Build Term Array from Integers.
+
+        :param terms:
+        :param offset:
+        """
+        if not isinstance(terms, numpy.ndarray):
+            terms = list(terms)
+            try:
+                terms = numpy.array(terms, dtype=numpy.int64)
+            except OverflowError:
+                terms = numpy.array(terms, dtype=object)
+        array = terms.view(cls)
+        array.offset = offset
+        return array
+
+    def __array_finalize__(self, array):
+        """
+        Carry Offset over to Views.
+
+        :param array:
+        :return:
+        """
+        self.offset = getattr(array, "offset", 0)
+
+    def __reduce__(self):
+        """
+        Pickle Term Array with Offset.
+
+        :return:
+        """
+        function, arguments, state = super().__reduce__()
+        return function, arguments, (state, self.offset)
+
+    def __setstate__(self, state):
+        """
+        Unpickle Term Array with Offset.
+
+        :param state:
+        :return:
+        """
+        state, self.offset = state
+        super().__setstate__(state)
+
+    def at(self, index):
+        """
+        Get Terms by Sequence Index, Counting from the Offset.
+
+        :param index:
+        :return:
+        """
+        if isinstance(index, slice):
+            start = None if index.start is None else self._position(index.start)
+            stop = None if index.stop is None else self._position(index.stop)
+            step = index.step
+            return self[start:stop:step]
+        return self[self._position(index)]
+
+    def _position(self, index):
+        """
+        Get Position of Sequence Index.
+
+        :param index:
+        :return:
+        """
+        if index < self.offset:
+            raise IndexError("sequence index {} below offset".format(index))
+        return index - self.offset
+
+    @classmethod
+    def from_tokens(cls, tokens, offset=0):
+        """
+        Build Term Array from Decimal Strings.
+
+        Tokens are converted in one vectorized pass when none of them is longer than
+        `INT64_DIGITS` characters, so every term is known to fit in `int64`.
+
+        :param tokens:
+        :param offset:
+        :return:
+        """
+        tokens = numpy.array(tokens, dtype=bytes, ndmin=1)
+        if tokens.itemsize <= INT64_DIGITS:
+            return cls(tokens.astype(numpy.int64), offset)
+        terms = [parse_int(t.decode("ascii")) for t in tokens]
+        return cls(numpy.array(terms, dtype=object), offset)
+
+
+class BigIntArray:
+    """
+    Compact Array of Arbitrary-Precision Terms.
+
+    Terms are packed as little-endian two's complement bytes into one contiguous
+    buffer indexed by an offsets array and are only decoded when accessed. Slices
+    share the buffer and pickling copies the two buffers in bulk.
+
+    """
+
+    __slots__ = ("_buffer", "_offsets", "_start", "offset")
+
+    def __init__(self, terms=(), offset=0):
+        """
+        Pack Integers into Big Integer Array.
+
+        :param terms:
+        :param offset:
+        """
+        encoded = [encode_int(int(term)) for term in terms]
+        offsets = numpy.zeros(len(encoded) + 1, dtype="<u8")
+        numpy.cumsum([len(e) for e in encoded], out=offsets[1:])
+        self._buffer = b"".join(encoded)
+        self._offsets = offsets
+        self._start = 0
+        self.offset = offset
+
+    @classmethod
+    def from_buffer(cls, buffer, offsets, start=0, offset=0):
+        """
+        View Packed Terms in a Buffer without Copying.
+
+        :param buffer:
+        :param offsets:
+        :param start:
+        :param offset:
+        :return:
+        """
+        array = cls.__new__(cls)
+        array._buffer = buffer
+        array._offsets = offsets
+        array._start = start
+        array.offset = offset
+        return array
+
+    @classmethod
+    def from_tokens(cls, tokens, offset=0):
+        """
+        Pack Decimal Strings into Big Integer Array.
+
+        :param tokens:
+        :param offset:
+        :return:
+        """
+        return cls(map(parse_int, tokens), offset)
+
+    def parts(self):
+        """
+        Get Offsets Array and Packed Bytes of the Terms, Starting from Zero.
+
+        :return:
+        """
+        first, last = int(self._offsets[0]), int(self._offsets[-1])
+        data = self._buffer[self._start + first : self._start + last]
+        return self._offsets - numpy.uint64(first), bytes(data)
+
+    def __reduce__(self):
+        """
+        Pickle Packed Buffers.
+
+        :return:
+        """
+        offsets, data = self.parts()
+        return type(self).from_buffer, (data, offsets, 0, self.offset)
+
+    @property
+    def nbytes(self):
+        """Get Size of the Packed Terms and their Offsets in Bytes."""
+        return int(self._offsets[-1] - self._offsets[0]) + self._offsets.nbytes
+
+    def __len__(self):
+        """Get Number of Terms."""
+        return len(self._offsets) - 1
+
+    def _decode(self, index):
+        """Decode Term at Index."""
+        start = self._start + int(self._offsets[index])
+        stop = self._start + int(self._offsets[index + 1])
+        return int.from_bytes(self._buffer[start:stop], "little", signed=True)
+
+    def __getitem__(self, index):
+        """Get Term or Slice of Terms."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                offsets = self._offsets[start : max(start, stop) + 1]
+                return self.from_buffer(self._buffer, offsets, self._start, self.offset)
+            return [self._decode(i) for i in range(start, stop, step)]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("term index out of range")
+        return self._decode(index)
+
+    def __iter__(self):
+        """Iterate over Terms."""
+        return map(self._decode, range(len(self)))
+
+    def __array__(self, dtype=None, copy=None):
+        """Decode Terms into a NumPy Array."""
+        return numpy.array(self.tolist(), dtype=value_or(dtype, object))
+
+    def __repr__(self):
+        """Get Big Integer Array Representation."""
+        return "{}(<{} terms>, offset={})".format(
+            type(self).__name__, len(self), self.offset
+        )
+
+    def tolist(self):
+        """Decode All Terms into a List."""
+        return list(self)
+
+
+def load_terms(lines, *, column=1, offset=0):
+    """
+    Load Column of Whitespace Separated Text into Term Array.
+
+    The text is parsed directly into `int64` and only parsed again into Python
+    integers if a term overflows. Comments start with `#`.
+
+    :param lines:
+    :param column:
+    :param offset:
+    :return:
+    """
+    lines = list(lines)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            terms = numpy.loadtxt(
+                lines, dtype=numpy.int64, comments="#", usecols=column, ndmin=1
+            )
+    except (OverflowError, ValueError):
+        rows = (line.partition("#")[0].split() for line in lines)
+        terms = [parse_int(row[column]) for row in rows if row]
+        terms = numpy.array(terms, dtype=object)
+    return TermArray(terms, offset)
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*- #
+#
+# oeis/transforms.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Vectorized Sequence Transforms.
+
+"""
+
+# -------------- Standard Library -------------- #
+
+import operator
+
+# -------------- External Library -------------- #
+
+import numpy
+
+# ---------------- oeis Library ---------------- #
+
+from .terms import TermArray
+
+
+__all__ = (
+    "TRANSFORM_CHUNK_SIZE",
+    "partial_sums",
+    "differences",
+    "binomial_transform",
+    "euler_transform",
+    "mobius_transform",
+    "convolve",
+    "add",
+    "subtract",
+    "multiply",
+)
+
+
+TRANSFORM_CHUNK_SIZE = 1024
+
+
+_INT64_LIMIT = 2.0 ** 62
+
+
+def _terms(terms):
+    """
+    Get Terms as an Array, Leaving Arrays and Integers as they are.
+
+    :param terms:
+    :return:
+    """
+    if isinstance(terms, numpy.integer):
+        return int(terms)
+    if isinstance(terms, (int, numpy.ndarray)):
+        return terms
+    return TermArray(terms)
+
+
+def _magnitude(terms):
+    """
+    Get Bound on the Absolute Value of Terms, Infinite for Python Integers.
+
+    :param terms:
+    :return:
+    """
+    if isinstance(terms, int):
+        return float(abs(terms)) if abs(terms) < _INT64_LIMIT else float("inf")
+    if terms.dtype == object:
+        return float("inf")
+    if not len(terms):
+        return 0.0
+    return float(numpy.abs(terms.astype(numpy.float64)).max())
+
+
+def _working(bound, *arrays):
+    """
+    Cast Terms to `int64` if the Result Bound Fits and to Python Integers Otherwise.
+
+    :param bound:
+    :param arrays:
+    :return:
+    """
+    dtype = numpy.int64 if bound < _INT64_LIMIT else object
+    return [numpy.asarray(array, dtype=dtype) for array in arrays]
+
+
+def partial_sums(terms):
+    """
+    Get Partial Sums of Terms.
+
+    :param terms:
+    :return:
+    """
+    terms = _terms(terms)
+    bound = _magnitude(terms) * len(terms)
+    (terms,) = _working(bound, terms)
+    return TermArray(numpy.cumsum(terms))
+
+
+def differences(terms):
+    """
+    Get First Differences of Terms.
+
+    :param terms:
+    :return:
+    """
+    terms = _terms(terms)
+    (terms,) = _working(2 * _magnitude(terms), terms)
+    return TermArray(numpy.diff(terms))
+
+
+def binomial_transform(terms):
+    """
+    Get Binomial Transform b(n) = Sum C(n, k) a(k) of Terms.
+
+    Each step adds neighbouring entries of the previous row of the difference table,
+    so the transform costs one vector operation per term.
+
+    :param terms:
+    :return:
+    """
+    terms = _terms(terms)
+    bound = _magnitude(terms) * 2.0 ** min(len(terms), 64)
+    (row,) = _working(bound, terms)
+    result = numpy.empty_like(row)
+    for n in range(len(row)):
+        result[n] = row[0]
+        row = row[:-1] + row[1:]
+    return TermArray(result)
+
+
+def euler_transform(terms):
+    """
+    Get Euler Transform of Terms a(1), a(2), ... as b(1), b(2), ...
+
+    Uses c(n) = Sum_{d|n} d a(d) and n b(n) = c(n) + Sum_{k<n} c(k) b(n-k).
+
+    :param terms:
+    :return:
+    """
+    n = len(terms)
+    terms = numpy.asarray(terms, dtype=object)
+    c = numpy.zeros(n, dtype=object)
+    for d in range(1, n + 1):
+        c[d - 1 :: d] += d * terms[d - 1]
+    b = numpy.zeros(n + 1, dtype=object)
+    b[0] = 1
+    for m in range(1, n + 1):
+        b[m] = (c[m - 1] + numpy.dot(c[: m - 1], b[m - 1 : 0 : -1])) // m
+    return TermArray(b[1:].tolist())
+
+
+def _mobius(n):
+    """
+    Sieve Möbius Function mu(0), ..., mu(n).
+
+    :param n:
+    :return:
+    """
+    mu = numpy.ones(n + 1, dtype=numpy.int64)
+    mu[0] = 0
+    composite = numpy.zeros(n + 1, dtype=bool)
+    for p in range(2, n + 1):
+        if not composite[p]:
+            composite[p * p :: p] = True
+            mu[p::p] *= -1
+            mu[p * p :: p * p] = 0
+    return mu
+
+
+def mobius_transform(terms):
+    """
+    Get Möbius Transform b(n) = Sum_{d|n} mu(n/d) a(d) of Terms a(1), a(2), ...
+
+    :param terms:
+    :return:
+    """
+    terms = _terms(terms)
+    n = len(terms)
+    (terms,) = _working(_magnitude(terms) * n, terms)
+    mu = _mobius(n)
+    result = numpy.zeros_like(terms)
+    for k in numpy.flatnonzero(mu).tolist():
+        result[k - 1 :: k] += int(mu[k]) * terms[: n // k]
+    return TermArray(result)
+
+
+def convolve(terms, other):
+    """
+    Get Convolution c(n) = Sum a(k) b(n-k) of Terms, as Long as the Shorter Input.
+
+    :param terms:
+    :param other:
+    :return:
+    """
+    terms, other = _terms(terms), _terms(other)
+    n = min(len(terms), len(other))
+    if not n:
+        return TermArray()
+    bound = _magnitude(terms) * _magnitude(other) * n
+    terms, other = _working(bound, terms[:n], other[:n])
+    return TermArray(numpy.convolve(terms, other)[:n])
+
+
+def _elementwise(op, bound, terms, other):
+    """
+    Combine Terms Elementwise with Terms or an Integer.
+
+    :param op:
+    :param bound:
+    :param terms:
+    :param other:
+    :return:
+    """
+    if isinstance(other, int):
+        (terms,) = _working(bound, terms)
+        return TermArray(op(terms, other))
+    n = min(len(terms), len(other))
+    terms, other = _working(bound, terms[:n], other[:n])
+    return TermArray(op(terms, other))
+
+
+def add(terms, other):
+    """
+    Add Terms Elementwise.
+
+    :param terms:
+    :param other:
+    :return:
+    """
+    terms, other = _terms(terms), _terms(other)
+    bound = _magnitude(terms) + _magnitude(other)
+    return _elementwise(operator.add, bound, terms, other)
+
+
+def subtract(terms, other):
+    """
+    Subtract Terms Elementwise.
+
+    :param terms:
+    :param other:
+    :return:
+    """
+    terms, other = _terms(terms), _terms(other)
+    bound = _magnitude(terms) + _magnitude(other)
+    return _elementwise(operator.sub, bound, terms, other)
+
+
+def multiply(terms, other):
+    """
+    Multiply Terms Elementwise.
+
+    :param terms:
+    :param other:
+    :return:
+    """
+    terms, other = _terms(terms), _terms(other)
+    bound = _magnitude(terms) * _magnitude(other)
+    return _elementwise(operator.mul, bound, terms, other)
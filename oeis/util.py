@@ -34,9 +34,14 @@ OEIS Interface Utilities.
 # -------------- Standard Library -------------- #
 
 import re
+import asyncio
 import inspect
+import threading
+from copy import deepcopy
+from collections import deque
 from collections.abc import Mapping
-from itertools import zip_longest
+from concurrent.futures import Future
+from itertools import count, islice, zip_longest
 
 # -------------- External Library -------------- #
 
@@ -283,3 +288,138 @@ def import_package(name):
         return __import__(name), True
     except ImportError:
         return BoxObject(name), False
+
+
+class SingleFlight:
+    """
+    Coalesce Concurrent Calls with the Same Key.
+
+    The first caller for a key runs the call and every caller arriving while it is
+    in flight waits for its result. With `copy`, waiting callers get a deep copy of
+    the result instead of the shared object.
+
+    """
+
+    def __init__(self, copy=False):
+        """
+        Initialize Empty Flight Table.
+
+        :param copy:
+        """
+        self.copy = copy
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, f, *args, **kwargs):
+        """Run Call for Key unless one is Already in Flight."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+        if not leader:
+            return deepcopy(call.result()) if self.copy else call.result()
+        try:
+            result = f(*args, **kwargs)
+        except BaseException as error:
+            call.set_exception(error)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """
+    Coalesce Concurrent Coroutine Calls with the Same Key.
+
+    """
+
+    def __init__(self, copy=False):
+        """
+        Initialize Empty Flight Table.
+
+        :param copy:
+        """
+        self.copy = copy
+        self._calls = {}
+
+    async def do(self, key, f, *args, **kwargs):
+        """Await Call for Key unless one is Already in Flight."""
+        task = self._calls.get(key)
+        leader = task is None
+        if leader:
+            task = self._calls[key] = asyncio.ensure_future(f(*args, **kwargs))
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        result = await asyncio.shield(task)
+        return deepcopy(result) if self.copy and not leader else result
+
+
+class GeneratorCursor:
+    """
+    Resumable Cursor over the Terms of a Generator Function.
+
+    The cursor keeps one live generator and a window of the terms it produced last,
+    so forward scans resume where they stopped and nearby lookups are served from
+    the window. Positions before the window restart the generator.
+
+    """
+
+    def __init__(self, f, window=1024):
+        """
+        Initialize Cursor.
+
+        :param f:
+        :param window:
+        """
+        self.f = f
+        self.window = window
+        self._lock = threading.Lock()
+        self._restart()
+
+    def _restart(self):
+        """Start a Fresh Generator."""
+        self._generator = self.f()
+        self._position = 0
+        self._terms = deque(maxlen=self.window)
+
+    def term(self, position):
+        """
+        Get Term at Position, Advancing the Generator as Needed.
+
+        :param position:
+        :return:
+        """
+        with self._lock:
+            if position < self._position - len(self._terms):
+                self._restart()
+            ahead = max(position - self._position + 1, 0)
+            for term in islice(self._generator, ahead):
+                self._terms.append(term)
+                self._position += 1
+            if position >= self._position:
+                raise IndexError(
+                    "generator exhausted before position {}".format(position)
+                )
+            return self._terms[position - self._position]
+
+    def __call__(self, start=0, stop=None, step=None):
+        """
+        Generate Terms between Positions.
+
+        :param start:
+        :param stop:
+        :param step:
+        :return:
+        """
+        positions = count(start, value_or(step, 1))
+        if stop is not None:
+            positions = range(start, stop, value_or(step, 1))
+        for position in positions:
+            try:
+                yield self.term(position)
+            except IndexError:
+                return
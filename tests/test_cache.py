@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*- #
+#
+# tests/test_cache.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+"""
+Test Persistent HTTP Cache.
+
+"""
+
+# -------------- Standard Library -------------- #
+
+import io
+
+# -------------- External Library -------------- #
+
+import pytest
+import requests
+from hypothesis import given
+from requests.adapters import HTTPAdapter
+
+# ---------------- oeis Library ---------------- #
+
+import oeis
+from oeis.cache import CACHE_DIRECTORY_VARIABLE, default_directory
+from oeis.cache import DiskCache, CacheAdapter
+from .core import random_ids
+
+
+@pytest.fixture()
+def disk_cache(tmp_path):
+    return DiskCache(tmp_path)
+
+
+def test_cache_opt_in(monkeypatch, tmp_path):
+    monkeypatch.delenv(CACHE_DIRECTORY_VARIABLE, raising=False)
+    assert default_directory() is None
+    adapter = oeis.get_custom_session().get_adapter("https://")
+    assert not isinstance(adapter, CacheAdapter)
+    monkeypatch.setenv(CACHE_DIRECTORY_VARIABLE, str(tmp_path))
+    assert default_directory() == str(tmp_path)
+    adapter = oeis.get_custom_session().get_adapter("https://")
+    assert isinstance(adapter, CacheAdapter)
+
+
+def test_disk_cache_roundtrip(disk_cache):
+    url = "https://oeis.org/A000045/b000045.txt"
+    assert disk_cache.get(url) is None
+    disk_cache.set(url, {"ETag": '"abc"', "Content-Length": "3"}, b"0 0")
+    headers, body = disk_cache.get(url)
+    assert headers["etag"] == '"abc"'
+    assert "content-length" not in headers
+    assert body == b"0 0"
+    assert not disk_cache.is_fresh(headers)
+    disk_cache.delete(url)
+    assert disk_cache.get(url) is None
+
+
+def test_disk_cache_max_age(tmp_path):
+    cache = DiskCache(tmp_path, max_age=60)
+    cache.set("https://oeis.org", {}, b"")
+    assert cache.is_fresh(cache.get("https://oeis.org")[0])
+
+
+class FakeTransport(HTTPAdapter):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sent = []
+
+    def send(self, request, stream=False, **kwargs):
+        self.sent.append(dict(request.headers))
+        response = requests.Response()
+        response.request, response.url = request, request.url
+        if request.headers.get("If-None-Match") == '"v1"':
+            response.status_code, response._content = 304, b""
+        else:
+            response.status_code, response._content = 200, b"1 1\n2 2\n"
+            response.headers["ETag"] = '"v1"'
+            response.headers["Last-Modified"] = "Mon, 01 Jan 2024 00:00:00 GMT"
+        response.raw = io.BytesIO(response.content)
+        return response
+
+
+class RevalidatingAdapter(CacheAdapter, FakeTransport):
+    pass
+
+
+def test_conditional_revalidation(disk_cache):
+    url = "https://oeis.org/A000045/b000045.txt"
+    adapter = RevalidatingAdapter(disk_cache)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    first = session.get(url)
+    assert first.content == b"1 1\n2 2\n"
+    assert "If-None-Match" not in adapter.sent[0]
+    second = session.get(url)
+    assert adapter.sent[1]["If-None-Match"] == '"v1"'
+    assert adapter.sent[1]["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert second.status_code == 200
+    assert second.content == b"1 1\n2 2\n"
+    assert second.text == first.text
+
+
+@given(random_ids())
+def test_cached_session(tmp_path_factory, index):
+    session = requests.Session()
+    session.mount("https://", CacheAdapter(DiskCache(tmp_path_factory.mktemp("c"))))
+    assert oeis.bfile(index, session) == oeis.bfile(index, session)
+    assert oeis.bfile(index, session) == oeis.bfile(index)
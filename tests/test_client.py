@@ -31,21 +31,28 @@ Test OEIS Client.
 
 """
 
+# -------------- Standard Library -------------- #
+
+import time
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
 # -------------- External Library -------------- #
 
 import pytest
+import requests
 from hypothesis import given
 from hypothesis import strategies as st
 
 # ---------------- oeis Library ---------------- #
 
 import oeis
+from oeis.limiter import RateLimiter
 from oeis.util import is_int, BoxObject, Box
 from .core import random_ids, PYTHON_OBJECTS, SESSION
 
 
-# TODO: figure out how to test async functions
-
 # TODO: get sample queries for OEIS searches
 SAMPLE_QUERIES = (("1, 2, 3, 4, 5", None), ("1  2  3  4  5", None))
 
@@ -58,6 +65,13 @@ def test_oeis_query(term, expected):
         assert content == expected
 
 
+@pytest.mark.parametrize("term, expected", SAMPLE_QUERIES)
+def test_oeis_query_iter(term, expected):
+    first_page = json.loads(oeis.query(term))["results"] or ()
+    results = list(oeis.query_iter(term, limit=len(first_page)))
+    assert [r.number for r in results] == [r["number"] for r in first_page]
+
+
 @given(random_ids())
 def test_oeis_entry(index):
     content = oeis.entry(index, check_name=True)
@@ -88,6 +102,11 @@ def test_oeis_does_not_exist(number):
     assert not oeis.exists(number)
 
 
+@given(random_ids())
+def test_oeis_bfile_exists(index):
+    assert oeis.bfile_exists(index) == bool(oeis.bfile(index))
+
+
 @given(random_ids())
 def test_oeis_b_file(index):
     if oeis.exists(index):
@@ -98,6 +117,34 @@ def test_oeis_b_file(index):
         pytest.skip("Missing OEIS Index: {}.".format(index))
 
 
+@given(random_ids(), st.integers(min_value=0, max_value=20))
+def test_oeis_b_file_stream(index, max_terms):
+    content = oeis.bfile(index)
+    stream = oeis.bfile_stream(index, max_terms=max_terms)
+    assert stream.offset == content.offset
+    assert tuple(stream) == content[:max_terms]
+
+
+@given(random_ids())
+def test_oeis_b_file_array(index):
+    content = oeis.bfile(index)
+    array = oeis.bfile(index, as_array=True)
+    assert array.offset == content.offset
+    assert tuple(array.tolist()) == content
+
+
+@given(
+    random_ids(),
+    st.integers(min_value=0, max_value=200),
+    st.integers(min_value=0, max_value=20),
+)
+def test_oeis_b_file_slice(index, start, length):
+    content = oeis.bfile(index)
+    part = oeis.bfile(index, start=start, stop=start + length, probe_size=64)
+    assert part.offset == content.offset
+    assert tuple(part) == content[start : start + length]
+
+
 @pytest.fixture()
 def session():
     return oeis.Session(SESSION)
@@ -114,3 +161,137 @@ def test_session_entry(index, session):
     assert oeis.exists(name, check_name=False) == session.exists(name, check_name=False)
     assert oeis.entry(name, check_name=False) == session.entry(name, check_name=False)
     assert oeis.bfile(name, check_name=False) == session.bfile(name, check_name=False)
+
+
+@pytest.mark.skipif(not oeis.AIOHTTP_SUPPORT, reason="aiohttp is not installed")
+@given(st.lists(random_ids(), min_size=1, max_size=5))
+def test_async_session_entry(indices):
+    async def load():
+        async with oeis.AsyncSession.pooled(limit_per_host=2) as session:
+            return await asyncio.gather(*(session.aentry(i) for i in indices))
+
+    assert list(asyncio.run(load())) == [oeis.entry(i) for i in indices]
+
+
+@pytest.mark.skipif(not oeis.AIOHTTP_SUPPORT, reason="aiohttp is not installed")
+def test_afetch_reuses_loop_session(monkeypatch):
+    sessions = []
+
+    async def record(url, session, **kwargs):
+        sessions.append(session)
+        return url
+
+    async def load():
+        return [await oeis.afetch(url) for url in ("first", "second")]
+
+    monkeypatch.setattr(oeis.client, "_afetch", record)
+    assert asyncio.run(load()) == ["first", "second"]
+    assert sessions[0] is sessions[1]
+    assert sessions[0].closed
+    asyncio.run(load())
+    assert sessions[2] is not sessions[0]
+
+
+@given(st.lists(random_ids(), max_size=15))
+def test_oeis_entries(indices):
+    batched = oeis.entries(indices, batch_size=4)
+    assert len(batched) == len(indices)
+    for index, content in zip(indices, batched):
+        if oeis.exists(index):
+            assert isinstance(content, Box)
+            assert content.number == index
+            assert content.raw.count == 1
+            assert [r.number for r in content.raw.results] == [index]
+        else:
+            assert content is None
+
+
+@given(st.lists(random_ids(), max_size=10))
+def test_oeis_bfiles(indices):
+    results = dict(oeis.bfiles(indices, max_workers=4))
+    assert set(results) == set(indices)
+    for index, content in results.items():
+        assert content == oeis.bfile(index)
+
+
+def test_oeis_bfiles_session_keyword():
+    with requests.Session() as session:
+        results = dict(oeis.bfiles([45, 27], session=session, max_workers=2))
+    assert results == {45: oeis.bfile(45), 27: oeis.bfile(27)}
+
+
+class SlowResponse:
+    """JSON Response Naming the Session it came from."""
+
+    status_code = 200
+
+    def __init__(self, name):
+        self.name = name
+
+    def json(self):
+        return {"name": self.name}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class SlowSession:
+    """Session Answering every Request Slowly."""
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+
+    def get(self, url):
+        self.calls += 1
+        time.sleep(0.1)
+        return SlowResponse(self.name)
+
+
+class UnavailableResponse:
+    """Response for a Server that is Down."""
+
+    status_code = 503
+    headers = {}
+
+    def raise_for_status(self):
+        raise requests.HTTPError("503 Server Error")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class UnavailableSession:
+    """Session whose Server always Fails."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url):
+        self.calls += 1
+        return UnavailableResponse()
+
+
+def test_fetch_raises_after_retries():
+    session = UnavailableSession()
+    limiter = RateLimiter(rate=100.0, min_rate=100.0)
+    with pytest.raises(requests.HTTPError):
+        oeis.fetch("url", session, as_json=True, limiter=limiter, retries=1)
+    assert session.calls == 2
+
+
+def test_fetch_single_flight_per_session():
+    sessions = [SlowSession("first"), SlowSession("second")] * 4
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(lambda s: oeis.fetch("url", s, as_json=True), sessions)
+        )
+    assert [r["name"] for r in results] == [s.name for s in sessions]
+    assert sessions[0].calls == sessions[1].calls == 1
+    assert len({id(r) for r in results}) == len(results)
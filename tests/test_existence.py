@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*- #
+#
+# tests/test_existence.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Test Existence Index.
+
+"""
+
+# -------------- Standard Library -------------- #
+
+import asyncio
+
+# ---------------- oeis Library ---------------- #
+
+import oeis
+from oeis.mirror import Mirror
+from oeis.existence import ExistenceIndex
+
+
+def test_existence_index():
+    index = ExistenceIndex.from_ids(["A000045", 27, 79, 400000])
+    assert len(index) == 4
+    assert "A000045" in index
+    assert 400000 in index
+    assert 28 not in index
+    assert 400001 not in index
+    assert 10 ** 9 not in index
+    assert "not an id" not in index
+    assert index.numbers() == [27, 45, 79, 400000]
+    index.add(1, "A000002")
+    assert index.numbers() == [1, 2, 27, 45, 79, 400000]
+
+
+def test_existence_index_sources(tmp_path):
+    listing = tmp_path / "names"
+    listing.write_text("# OEIS Sequence Names\nA000040 The primes.\nA000045 Fibs.\n")
+    index = ExistenceIndex.from_listing(listing)
+    assert index.numbers() == [40, 45]
+    index.save(tmp_path / "index.bin")
+    assert ExistenceIndex.load(tmp_path / "index.bin").numbers() == [40, 45]
+    mirror = Mirror()
+    mirror.ingest(names=listing)
+    assert ExistenceIndex.from_mirror(mirror).numbers() == [40, 45]
+    listing.write_text("A000027 The positive integers.\n")
+    index.refresh(listing)
+    assert index.numbers() == [27]
+    index.refresh(mirror)
+    assert index.numbers() == [40, 45]
+
+
+def test_existence_index_client():
+    index = ExistenceIndex.from_ids([27, 45])
+    assert oeis.exists(27, index=index)
+    assert not oeis.exists("A000040", index=index)
+    assert oeis.bfile_exists("A000045", index=index)
+    assert not oeis.bfile_exists(40, index=index)
+
+
+def test_existence_index_async_client(tmp_path):
+    index = ExistenceIndex.from_ids([27, 45])
+    listing = tmp_path / "names"
+    listing.write_text("A000040 The primes.\n")
+    mirror = Mirror()
+    mirror.ingest(names=listing)
+
+    async def check():
+        return (
+            await oeis.aexists(27, index=index),
+            await oeis.aexists("A000040", index=index),
+            await oeis.aexists(40, mirror=mirror),
+            await oeis.abfile_exists("A000045", index=index),
+            await oeis.abfile_exists(40, index=index),
+        )
+
+    assert asyncio.run(check()) == (True, False, True, True, False)
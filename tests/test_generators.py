@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*- #
+#
+# tests/test_generators.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Test Included Generators.
+
+"""
+
+# -------------- Standard Library -------------- #
+
+from itertools import islice
+
+# -------------- External Library -------------- #
+
+import pytest
+import sympy
+
+# ---------------- oeis Library ---------------- #
+
+from oeis.generators import g27, i27, g40, i40
+from oeis.generators.primes import *
+from oeis.sequence import Sequence
+from oeis.util import Box
+
+
+def test_naturals():
+    assert list(islice(g27(), 5)) == [1, 2, 3, 4, 5]
+    assert i27(10) == 10
+
+
+def test_sieve():
+    assert sieve(1).tolist() == []
+    assert sieve(30).tolist() == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+    assert len(sieve(10 ** 6)) == 78498
+
+
+@pytest.mark.parametrize("low", [0, 2, 3, 13, 14, 99991, 10 ** 9 - 5000])
+def test_primes_between(low):
+    for width in (1, 2, 7, 5000):
+        expected = list(sympy.primerange(low, low + width))
+        assert primes_between(low, low + width).tolist() == expected
+
+
+def test_primes():
+    assert list(islice(primes(), 10)) == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+    count = sympy.primepi(3 * SEGMENT_SIZE)
+    assert list(islice(primes(), count)) == list(sympy.primerange(2, 3 * SEGMENT_SIZE))
+    assert next(primes(10 ** 6)) == 1000003
+
+
+def test_prime_pi():
+    for x in (0, 1, 2, 3, 10, 100, 12345, 10 ** 6):
+        assert prime_pi(x) == sympy.primepi(x)
+    assert prime_pi(10 ** 9) == 50847534
+    assert prime_pi(10 ** 10) == 455052511
+
+
+def test_nth_prime():
+    for n in (1, 2, 6, 100, 10 ** 5, 1234567):
+        assert nth_prime(n) == sympy.prime(n)
+    assert nth_prime(10 ** 9) == 22801763489
+    with pytest.raises(ValueError):
+        nth_prime(0)
+
+
+def test_primes_sequence():
+    assert list(g40(0, 5)) == [2, 3, 5, 7, 11]
+    assert list(g40(5, 20, 3)) == [13, 23, 37, 47, 61]
+    assert i40(10 ** 6) == 15485863
+    sequence = Sequence(40, g40, meta=Box(offset="1,1", data="2,3,5,7,11"))
+    assert sequence[6] == 13
+    assert sequence[10 ** 7] == 179424673
+    assert list(sequence[10 ** 6 : 10 ** 6 + 3]) == [15485863, 15485867, 15485917]
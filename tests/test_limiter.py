@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*- #
+#
+# tests/test_limiter.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+"""
+Test Rate Limiting and Retry Scheduling.
+
+"""
+
+# -------------- Standard Library -------------- #
+
+import asyncio
+
+# -------------- External Library -------------- #
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+# ---------------- oeis Library ---------------- #
+
+from oeis.limiter import *
+
+
+def test_burst_is_free():
+    limiter = RateLimiter(rate=1, burst=3)
+    assert [limiter.reserve() for _ in range(3)] == [0, 0, 0]
+    assert limiter.reserve() > 0
+
+
+def test_async_acquire():
+    limiter = RateLimiter(rate=1000)
+    asyncio.run(limiter.aacquire())
+
+
+def test_adaptive_rate():
+    limiter = RateLimiter(rate=10, min_rate=1, max_rate=11, increase=2, decrease=0.5)
+    limiter.throttled()
+    assert limiter.rate == 5
+    for _ in range(10):
+        limiter.success()
+    assert limiter.rate == 11
+    for _ in range(10):
+        limiter.throttled()
+    assert limiter.rate == 1
+
+
+def test_retry_after_pauses_tokens():
+    limiter = RateLimiter(rate=1000)
+    assert limiter.throttled(retry_after=5) == 5
+    assert limiter.reserve() > 4
+
+
+@given(st.integers(min_value=0, max_value=50))
+def test_backoff(attempt):
+    assert 0 <= backoff(attempt, base=0.5, cap=30) <= min(30, 0.5 * 2 ** attempt)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    ((None, None), ("7", 7), ("1.5", 1.5), ("Wed, 21 Oct 2015 07:28:00 GMT", 0)),
+)
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*- #
+#
+# tests/test_memo.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Test Term Memo.
+
+"""
+
+# -------------- Standard Library -------------- #
+
+import gc
+import os
+from fractions import Fraction
+
+# ---------------- oeis Library ---------------- #
+
+from oeis.memo import TermMemo
+
+
+def test_memo_get_put():
+    memo = TermMemo()
+    assert memo.get(27, 5) is None
+    assert memo.get(27, 5, default=-1) == -1
+    memo.put(27, 5, 6)
+    memo.put(27, 5000, 5001)
+    assert memo.get(27, 5) == 6
+    assert memo.get(27, 5000) == 5001
+    assert memo.get(27, 6) is None
+    assert memo.get(40, 5) is None
+
+
+def test_memo_widens_big_terms():
+    memo = TermMemo()
+    memo.put(79, 0, 1)
+    memo.put(79, 100, 2 ** 100)
+    memo.put(79, 200, -(3 ** 90))
+    assert memo.get(79, 0) == 1
+    assert memo.get(79, 100) == 2 ** 100
+    assert memo.get(79, 200) == -(3 ** 90)
+
+
+def test_memo_widens_non_integer_terms():
+    memo = TermMemo()
+    memo.put(1, 0, 7)
+    memo.put(1, 1, 2.7)
+    memo.put(1, 2, Fraction(1, 2))
+    memo.put(2, 0, True)
+    assert memo.get(1, 0) == 7
+    assert memo.get(1, 1) == 2.7
+    assert memo.get(1, 2) == Fraction(1, 2)
+    assert memo.get(2, 0) is True
+
+
+def test_memo_spills_to_disk(tmp_path):
+    memo = TermMemo(4 * 1024, chunk_size=64, spill_directory=str(tmp_path))
+    for position in range(4096):
+        memo.put(27, position, position + 1)
+    assert memo.nbytes <= 4 * 1024
+    assert os.listdir(str(tmp_path))
+    assert all(memo.get(27, p) == p + 1 for p in range(0, 4096, 7))
+    assert memo.nbytes <= 4 * 1024
+
+
+def test_memo_discard_clear(tmp_path):
+    memo = TermMemo(2 * 1024, chunk_size=32, spill_directory=str(tmp_path))
+    for position in range(1024):
+        memo.put(27, position, position)
+        memo.put(40, position, 2 * position)
+    memo.discard(27)
+    assert memo.get(27, 10) is None
+    assert memo.get(40, 10) == 20
+    assert all(name.startswith("40-") for name in os.listdir(str(tmp_path)))
+    memo.clear()
+    assert memo.get(40, 10) is None
+    assert memo.nbytes == 0
+    assert not os.listdir(str(tmp_path))
+
+
+def test_memo_removes_temporary_spill_directory():
+    memo = TermMemo(1024, chunk_size=32)
+    for position in range(1024):
+        memo.put(27, position, position)
+    directory = memo.spill_directory
+    assert os.listdir(directory)
+    memo.close()
+    assert not os.path.exists(directory)
+    assert memo.get(27, 10) is None
+    for position in range(1024):
+        memo.put(40, position, position)
+    directory = memo.spill_directory
+    assert os.listdir(directory)
+    del memo
+    gc.collect()
+    assert not os.path.exists(directory)
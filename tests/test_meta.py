@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*- #
+#
+# tests/test_meta.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Test Sequence Metadata Record.
+
+"""
+
+# -------------- Standard Library -------------- #
+
+import pickle
+
+# -------------- External Library -------------- #
+
+import pytest
+
+# ---------------- oeis Library ---------------- #
+
+from oeis.meta import Keyword, SequenceMeta
+from oeis.mirror import MirrorEntry
+from oeis.sequence import Sequence
+from oeis.util import Box, BoxObject
+
+
+def fibonacci():
+    return Box(
+        number=45,
+        name="Fibonacci numbers.",
+        data="0,1,1,2,3,5,8",
+        offset="0,4",
+        keyword="nonn,core",
+        comment=["First comment.", "Second comment."],
+        revision="12",
+        raw={"count": 1},
+    )
+
+
+def test_meta_fields():
+    meta = SequenceMeta.from_mapping(fibonacci())
+    assert meta.number == 45
+    assert meta.revision == 12
+    assert meta.comment == ("First comment.", "Second comment.")
+    assert meta.raw == {"count": 1}
+    assert meta.formula is None
+    assert meta.unknown is None
+    assert meta["offset"] == "0,4"
+    assert "formula" not in meta
+    with pytest.raises(KeyError):
+        meta["formula"]
+    with pytest.raises(AttributeError):
+        meta.name = "changed"
+
+
+def test_meta_mapping():
+    fields = fibonacci()
+    meta = SequenceMeta.from_mapping(fields)
+    assert meta == fields
+    assert fields == meta
+    assert meta != Box(number=45)
+    assert SequenceMeta() == Box()
+    assert not SequenceMeta()
+    assert set(meta) == set(fields)
+    assert SequenceMeta.from_mapping(meta) is meta
+    assert pickle.loads(pickle.dumps(meta)) == meta
+
+
+def test_meta_unknown_none_fields():
+    meta = SequenceMeta.from_mapping(Box(number=45, extra=None, __test__=None))
+    assert set(meta) == {"number"}
+    assert meta == {"number": 45, "extra": None}
+    assert meta != {"number": 45, "extra": 1}
+    with pytest.raises(KeyError):
+        meta["extra"]
+
+
+def test_meta_box():
+    meta = SequenceMeta.from_mapping(fibonacci())
+    assert isinstance(meta.box, Box)
+    assert meta.box is meta.box
+    assert meta.box.keyword == "nonn,core"
+    assert meta.box.missing is None
+
+
+def test_keyword_parse():
+    flags = Keyword.parse("nonn,core,unknown,fini".split(","))
+    assert flags == Keyword.NONN | Keyword.CORE | Keyword.FINI
+    assert Keyword.CORE in flags
+    assert Keyword.parse(()) == 0
+
+
+def test_meta_mirror_fallback():
+    calls = []
+
+    def fallback():
+        calls.append(None)
+        return Box(offset="0,2", name="ignored")
+
+    entry = MirrorEntry.with_fallback({"number": 79, "name": "Powers of 2."}, fallback)
+    sequence = Sequence.from_dict(entry)
+    assert sequence.description == "Powers of 2."
+    assert not calls
+    assert sequence.offset == 0
+    assert sequence.meta.offset == "0,2"
+    assert sequence.meta.name == "Powers of 2."
+    assert len(calls) == 1
+
+
+def test_meta_missing_entry():
+    assert SequenceMeta.from_mapping(BoxObject(None)) == SequenceMeta()
+    assert SequenceMeta.from_mapping(None) == SequenceMeta()
+    sequence = Sequence(0, meta=BoxObject(None))
+    assert sequence.meta.name is None
+    assert not sequence.meta
+
+
+def test_meta_fallback_failure():
+    calls = []
+
+    def fallback():
+        calls.append(None)
+        if len(calls) == 1:
+            raise ConnectionError
+        return Box(offset="1,2")
+
+    entry = MirrorEntry.with_fallback({"number": 27, "name": "Naturals."}, fallback)
+    meta = SequenceMeta.from_mapping(entry)
+    with pytest.raises(ConnectionError):
+        meta.offset
+    assert meta.offset == "1,2"
+    assert len(calls) == 2
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*- #
+#
+# tests/test_mirror.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+"""
+Test Offline Mirror.
+
+"""
+
+# -------------- Standard Library -------------- #
+
+import gzip
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# -------------- External Library -------------- #
+
+import pytest
+
+# ---------------- oeis Library ---------------- #
+
+import oeis
+from oeis.mirror import Mirror, MirrorEntry
+
+
+STRIPPED = (
+    "# OEIS Sequence Data (http://oeis.org/stripped.gz)\n"
+    "A000027 ,1,2,3,4,5,6,7,8,9,10,\n"
+    "A000045 ,0,1,1,2,3,5,8,13,21,34,55,89,\n"
+    "A000079 ,1,2,4,8,16,32,64,128,256,\n"
+)
+
+
+NAMES = (
+    "# OEIS Sequence Names (http://oeis.org/names.gz)\n"
+    "A000027 The positive integers.\n"
+    "A000045 Fibonacci numbers: F(n) = F(n-1) + F(n-2) with F(0) = 0 and F(1) = 1.\n"
+    "A000079 Powers of 2: a(n) = 2^n.\n"
+)
+
+
+@pytest.fixture()
+def mirror(tmp_path):
+    stripped, names = tmp_path / "stripped.gz", tmp_path / "names.gz"
+    with gzip.open(stripped, "wt") as f:
+        f.write(STRIPPED)
+    with gzip.open(names, "wt") as f:
+        f.write(NAMES)
+    return Mirror.from_dumps(tmp_path / "mirror.db", stripped=stripped, names=names)
+
+
+def test_mirror_contents(mirror):
+    assert len(mirror) == 3
+    assert mirror.numbers() == [27, 45, 79]
+    assert "A000045" in mirror
+    assert 1 not in mirror
+    assert "not an id" not in mirror
+    assert mirror.terms(79) == [1, 2, 4, 8, 16, 32, 64, 128, 256]
+    assert mirror.terms(1) is None
+    assert dict(mirror.items())[27] == list(range(1, 11))
+
+
+def test_mirror_entry(mirror):
+    entry = mirror.entry("A000079")
+    assert isinstance(entry, MirrorEntry)
+    assert entry.number == 79
+    assert entry.name == "Powers of 2: a(n) = 2^n."
+    assert entry.data == "1,2,4,8,16,32,64,128,256"
+    assert entry.offset is None
+    assert mirror.entry(1) is None
+
+
+def test_mirror_entry_fallback(mirror):
+    calls = []
+
+    def fallback():
+        calls.append(None)
+        return {"offset": "0,2", "name": "ignored"}
+
+    entry = mirror.entry(79, fallback=fallback)
+    assert entry.name == "Powers of 2: a(n) = 2^n."
+    assert not calls
+    assert entry.offset == "0,2"
+    assert entry["offset"] == "0,2"
+    assert len(calls) == 1
+
+
+def test_mirror_refresh(mirror, tmp_path):
+    names = tmp_path / "names.txt"
+    names.write_text("A000079 Powers of two.\nA000001 Groups.\n")
+    mirror.ingest(names=names)
+    assert mirror.entry(79).name == "Powers of two."
+    assert mirror.entry(79).data == "1,2,4,8,16,32,64,128,256"
+    assert mirror.terms(1) is None
+    assert 1 in mirror
+
+
+def test_offline_client(mirror):
+    assert oeis.exists(45, mirror=mirror)
+    assert not oeis.exists(1, mirror=mirror)
+    assert oeis.entry(27, mirror=mirror).name == "The positive integers."
+    assert not oeis.entry(1, mirror=mirror)
+    assert [e and e.number for e in oeis.entries([79, 2], mirror=mirror)] == [79, None]
+
+
+def test_offline_factory(mirror):
+    factory = oeis.SequenceFactory(mirror=mirror)
+    assert factory.load(45).sample[:5] == [0, 1, 1, 2, 3]
+    assert factory.safe_load(1) is None
+
+
+class SlowFactory(oeis.SequenceFactory):
+
+    __slots__ = ("calls",)
+
+    def load_meta(self, key, *, check_name=False):
+        self.calls.append(key)
+        time.sleep(0.1)
+        return super().load_meta(key, check_name=check_name)
+
+
+def test_concurrent_factory_load(mirror):
+    factory = SlowFactory(mirror=mirror)
+    factory.calls = []
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        sequences = list(executor.map(lambda _: factory.load(45), range(8)))
+    assert len(factory.calls) == 1
+    assert all(sequence is sequences[0] for sequence in sequences)
+    assert sequences[0].sample[:5] == [0, 1, 1, 2, 3]
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*- #
+#
+# tests/test_recurrence.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Test Linear Recurrences.
+
+"""
+
+# -------------- Standard Library -------------- #
+
+from fractions import Fraction
+
+# -------------- External Library -------------- #
+
+import pytest
+
+# ---------------- oeis Library ---------------- #
+
+from oeis.recurrence import LinearRecurrence, berlekamp_massey, find_recurrence
+
+
+FIBONACCI = [0, 1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377, 610, 987, 1597]
+
+
+def test_berlekamp_massey():
+    assert berlekamp_massey(FIBONACCI) == [1, 1]
+    assert berlekamp_massey([2 ** n + 3 ** n for n in range(12)]) == [5, -6]
+    assert berlekamp_massey([n * n for n in range(12)]) == [3, -3, 1]
+    assert berlekamp_massey([0] * 10) == []
+    halves = [Fraction(1, 2 ** n) for n in range(10)]
+    assert berlekamp_massey(halves) == [Fraction(1, 2)]
+
+
+def test_find_recurrence():
+    assert find_recurrence(FIBONACCI) == LinearRecurrence([1, 1], [0, 1])
+    shifted = find_recurrence([7, 0] + FIBONACCI[1:])
+    assert shifted.order == 3
+    assert find_recurrence(FIBONACCI[:8]) is None
+    partitions = [1, 1, 2, 3, 5, 7, 11, 15, 22, 30, 42, 56, 77, 101, 135, 176, 231]
+    assert find_recurrence(partitions, max_order=4) is None
+
+
+def test_linear_recurrence_terms():
+    fibonacci = LinearRecurrence([1, 1], [0, 1])
+    assert fibonacci.term(100) == 354224848179261915075
+    assert [fibonacci.term(n) for n in range(18)] == FIBONACCI
+    assert list(fibonacci.between(5, 10, None)) == FIBONACCI[5:10]
+    assert list(fibonacci.between(1, 16, 5)) == FIBONACCI[1:16:5]
+    assert next(fibonacci.between(1000, None, None)) == fibonacci.term(1000)
+    with pytest.raises(ValueError):
+        LinearRecurrence([1, 1], [0])
+
+
+def test_zero_recurrence():
+    zeros = find_recurrence([0] * 10)
+    assert zeros.order == 0
+    assert zeros.term(0) == zeros.term(1000) == 0
+    assert list(zeros.between(3, 6, None)) == [0, 0, 0]
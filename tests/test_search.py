@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*- #
+#
+# tests/test_search.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Test Local Search Engine.
+
+"""
+
+# -------------- Standard Library -------------- #
+
+import json
+
+# -------------- External Library -------------- #
+
+import pytest
+
+# ---------------- oeis Library ---------------- #
+
+import oeis
+from oeis.search import SearchIndex, parse_terms
+
+
+RECORDS = (
+    (27, "The positive integers.", "1,2,3,4,5,6,7,8,9,10"),
+    (45, "Fibonacci numbers.", "0,1,1,2,3,5,8,13,21,34,55,89"),
+    (79, "Powers of 2.", "1,2,4,8,16,32,64,128,256"),
+    (33999, "a(n) = (-1)^n.", "1,-1,1,-1,1,-1,1,-1"),
+)
+
+
+@pytest.fixture()
+def index():
+    return SearchIndex.build(RECORDS)
+
+
+def test_parse_terms():
+    assert parse_terms("1, 2, 3") == ["1", "2", "3"]
+    assert parse_terms("1 -02 3") == ["1", "-2", "3"]
+    assert parse_terms("fibonacci") is None
+    assert parse_terms(",") is None
+
+
+def test_search_index_find(index):
+    assert len(index) == 4
+    assert index.find([1, 2, 3]) == [27, 45]
+    assert index.find([8, 16, 32, 64]) == [79]
+    assert index.find([1, -1, 1, -1]) == [33999]
+    assert index.find([1, 2, 3, 5, 8]) == [45]
+    assert index.find([2, 3, 5, 7]) == []
+    assert index.find([13]) == [45]
+    assert index.find([1, 2]) == [27, 45, 79]
+
+
+def test_search_index_search(index):
+    result = index.search("1, 2, 4", limit=1)
+    assert result["count"] == 1
+    assert result["results"] == [
+        {"number": 79, "name": "Powers of 2.", "data": "1,2,4,8,16,32,64,128,256"}
+    ]
+    assert index.search("1 2", start=2)["results"][0]["number"] == 79
+    assert index.search("A000045") is None
+    assert [r.number for r in index.iter_results("1, 2", limit=2)] == [27, 45]
+    with pytest.raises(ValueError):
+        list(index.iter_results("fibonacci"))
+
+
+def test_search_index_round_trip(index, tmp_path):
+    index.save(tmp_path / "index.npz")
+    loaded = SearchIndex.load(tmp_path / "index.npz")
+    assert len(loaded) == len(index)
+    assert loaded.find([3, 5, 8]) == [45]
+    assert loaded.search("1,-1,1")["results"][0]["name"] == "a(n) = (-1)^n."
+
+
+def test_search_index_query(index):
+    result = json.loads(oeis.query("1, 2, 3", index=index))
+    assert result["count"] == 2
+    assert [r["number"] for r in result["results"]] == [27, 45]
+    assert [r.number for r in oeis.query_iter("8, 16", index=index)] == [79]
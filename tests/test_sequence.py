@@ -35,9 +35,11 @@ Test OEIS Sequences.
 
 from datetime import datetime
 from functools import partial
+from itertools import count, islice
 
 # -------------- External Library -------------- #
 
+import numpy
 import pytest
 from hypothesis import given
 from hypothesis import strategies as st
@@ -45,7 +47,10 @@ from hypothesis import strategies as st
 # ---------------- oeis Library ---------------- #
 
 import oeis
+from oeis.meta import Keyword
 from oeis.sequence import _slice_details, Sequence, SequenceFactory, Registry
+from oeis.sequence import DerivedSequence
+from oeis.terms import BigIntArray, TermArray
 from oeis.util import Box, BoxObject
 from .core import random_ids, random_sequences, SESSION
 
@@ -162,6 +167,178 @@ def test_finite():
     assert True
 
 
+def square(index):
+    return index * index
+
+
+SQUARES = Box(number=290, data="0,1,4,9,16", offset="0,3", keyword="nonn,easy")
+
+
+FINITE = Box(number=1, data="1,1,1,2,1,2", offset="1,4", keyword="nonn,fini,full")
+
+
+def test_derived_properties():
+    sequence = Sequence(290, square, meta=SQUARES)
+    assert sequence.offset == 0
+    assert sequence.keywords == ["nonn", "easy"]
+    sequence.keywords.append("fini")
+    assert sequence.keywords == ["nonn", "easy"]
+    assert sequence.keyword_flags == Keyword.NONN | Keyword.EASY
+    assert sequence.has_keywords(Keyword.NONN | Keyword.EASY)
+    assert not sequence.has_keywords(Keyword.NONN | Keyword.FINI)
+    assert not sequence.recycled
+    assert sequence[3] == 9
+    sequence.meta = Box(number=290, data="0,1", offset="1,2", keyword="recycled")
+    assert sequence.offset == 1
+    assert sequence.keywords == ["recycled"]
+    assert sequence.recycled
+    assert sequence.sample == [0, 1]
+    assert sequence[1] == 0
+
+
+def test_array():
+    sequence = Sequence(290, square, meta=SQUARES)
+    array = sequence.array
+    assert array.dtype == numpy.int64
+    assert array.tolist() == [0, 1, 4, 9, 16]
+    assert array.offset == 0
+    assert not array.flags.writeable
+    assert sequence.array is array
+    sequence.sample_append(25)
+    assert sequence.array.tolist() == [0, 1, 4, 9, 16, 25]
+    sequence.sample_attach(BigIntArray([1, 2 ** 70], offset=0))
+    assert sequence.array.dtype == object
+    assert sequence.array[1] == 2 ** 70
+    stored = TermArray(range(5))
+    sequence.sample_attach(stored)
+    assert sequence.array is stored
+
+
+def test_registry_stack():
+    registry = Registry()
+    registry.register(290, square, meta=SQUARES)
+    registry.register(1, meta=FINITE)
+    registry.register(27, oeis.generators.g27, meta=Box(number=27, offset="1,2"))
+    stacked = registry.stack([290, 27], 8)
+    assert stacked.dtype == numpy.int64
+    assert stacked.tolist() == [[0, 1, 4, 9, 16, 25, 36, 49], list(range(1, 9))]
+    assert registry.stack([1], 6).tolist() == [[1, 1, 1, 2, 1, 2]]
+    assert registry.stack([], 3).shape == (0, 3)
+    with pytest.raises(ValueError):
+        registry.stack([1], 7)
+
+
+def test_derived_sequences():
+    naturals = Sequence(27, oeis.generators.g27, meta=Box(offset="1,2"))
+    sums = naturals.partial_sums()
+    assert isinstance(sums, DerivedSequence)
+    assert sums.name == "partial_sums(A000027)"
+    assert sums.offset == 1
+    assert sums[4] == 10
+    assert list(sums[1:6]) == [1, 3, 6, 10, 15]
+    assert list(islice(sums[2000:], 2)) == [2001000, 2003001]
+    assert list(sums.differences()[1:5]) == [2, 3, 4, 5]
+    assert list((2 * naturals + 1)[1:4]) == [3, 5, 7]
+    assert list((10 - naturals)[1:4]) == [9, 8, 7]
+    assert list((naturals * naturals)[1:4]) == [1, 4, 9]
+    assert list(naturals.convolve(naturals)[1:4]) == [1, 4, 10]
+    assert list(naturals.mobius_transform()[1:7]) == [1, 1, 2, 2, 4, 2]
+    finite = Sequence(1, meta=FINITE).partial_sums()
+    assert list(finite[1:]) == [1, 2, 3, 5, 6, 8]
+    assert len(finite.terms(100)) == 6
+
+
+def test_extend():
+    meta = Box(offset="0,4", data="0,1,1,2,3,5,8,13,21,34,55,89")
+    fibonacci = Sequence(45, meta=meta)
+    assert fibonacci.find_recurrence().coefficients == (1, 1)
+    assert fibonacci.extend(15).tolist()[-3:] == [144, 233, 377]
+    assert fibonacci[100] == 354224848179261915075
+    assert list(fibonacci[12:15]) == [144, 233, 377]
+    with pytest.raises(ValueError):
+        Sequence(1, meta=Box(data="1,1,1,2,1,2,1,5,2,2,1,5")).extend(20)
+
+
+def test_get_term():
+    sequence = Sequence(290, square, meta=SQUARES)
+    assert sequence[3] == 9
+    assert sequence.get(50) == 2500
+    assert sequence.get(2, ignore_sample=True) == 4
+    positions = Sequence(27, oeis.generators.g27, meta=Box(offset="1,2"))
+    assert positions[1] == 1
+    assert positions[100] == 100
+    assert positions.get(0, ignore_offset=True) == 1
+    with pytest.raises(IndexError):
+        positions[0]
+    with pytest.raises(IndexError):
+        sequence[-1]
+    with pytest.raises(IndexError):
+        Sequence(1, meta=SQUARES)[5]
+    with pytest.raises(TypeError):
+        sequence["1"]
+
+
+def test_get_slice():
+    sequence = Sequence(290, square, meta=SQUARES)
+    assert list(sequence[2:8]) == [4, 9, 16, 25, 36, 49]
+    assert list(sequence[1:12:4]) == [1, 25, 81]
+    assert list(islice(sequence[3:], 4)) == [9, 16, 25, 36]
+    generated = Sequence(27, oeis.generators.g27, meta=Box(offset="1,2"))
+    assert list(generated[0:4]) == [1, 2, 3]
+    assert list(islice(generated[5::5], 3)) == [5, 10, 15]
+    with pytest.raises(ValueError):
+        list(sequence[::-1])
+
+
+def test_get_negative():
+    sequence = Sequence(1, meta=FINITE)
+    assert sequence.finite
+    assert sequence[-1] == 2
+    assert sequence[6] == 2
+    assert list(sequence[-3:]) == [2, 1, 2]
+    assert list(sequence[::-2]) == [2, 2, 1]
+    with pytest.raises(IndexError):
+        sequence[7]
+    with pytest.raises(IndexError):
+        sequence[-7]
+
+
+def test_get_resumes_generator():
+    starts = []
+
+    def naturals():
+        starts.append(True)
+        yield from count(1)
+
+    sequence = Sequence(27, naturals, meta=Box(offset="1,2"))
+    assert [sequence[n] for n in range(1, 1001)] == list(range(1, 1001))
+    assert list(sequence[1001:1004]) == [1001, 1002, 1003]
+    assert sequence[990] == 990
+    assert len(starts) == 1
+
+
+def test_get_cache_result():
+    calls = []
+
+    def counted(n):
+        calls.append(n)
+        return n * n
+
+    sequence = Sequence(290, counted, meta=SQUARES)
+    assert sequence.get(10, cache_result=True) == 100
+    assert sequence.get(10, cache_result=True) == 100
+    assert calls == [10]
+    assert list(sequence.get(slice(8, 12), cache_result=True)) == [64, 81, 100, 121]
+    assert calls == [10, 8, 9, 11]
+    assert sequence.memo.get(290, 11) == 121
+    generated = Sequence(27, oeis.generators.g27, meta=Box(offset="1,2"))
+    assert list(generated.get(slice(1, 6), cache_result=True)) == [1, 2, 3, 4, 5]
+    assert generated.get(3, cache_result=True) == 3
+    cubes = Sequence.from_sequence(sequence, lambda n: n ** 3)
+    assert cubes.get(5, cache_result=True) == 125
+    assert sequence.get(5, cache_result=True) == 25
+
+
 @given(st.lists(random_sequences(), max_size=5))
 def test_factory_from_cache(sequences):
     session = SESSION
@@ -212,6 +389,17 @@ def test_sequence_loading(factory, names):
             assert entry == Sequence.from_dict(meta)
 
 
+@given(st.lists(random_ids(), max_size=15))
+def test_factory_load_many(indices):
+    factory = SequenceFactory(session=SESSION)
+    sequences = factory.load_many(indices)
+    assert len(sequences) == len(indices)
+    for index, sequence in zip(indices, sequences):
+        assert sequence == factory.safe_load(index)
+        if sequence is not None:
+            assert sequence.name in factory
+
+
 def test_bfile_loading(factory):
     for key, sequence in factory.cache.items():
         assert not sequence.with_bfile
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*- #
+#
+# tests/test_store.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Test Term Store.
+
+"""
+
+# -------------- External Library -------------- #
+
+import numpy
+import pytest
+
+# ---------------- oeis Library ---------------- #
+
+import oeis
+from oeis.sequence import Sequence
+from oeis.util import Box
+from oeis.store import TermStore
+from oeis.terms import BigIntArray, TermArray
+
+
+@pytest.fixture()
+def store(tmp_path):
+    return TermStore(tmp_path / "terms")
+
+
+def test_store_fixed_width(store):
+    store.put("A000027", range(1, 101), offset=1)
+    terms = store.get(27)
+    assert isinstance(terms, TermArray)
+    assert terms.dtype == numpy.int64
+    assert terms.offset == 1
+    assert not terms.flags.writeable
+    assert terms[10:20].base is not None
+    assert terms.tolist() == list(range(1, 101))
+
+
+def test_store_variable_width(store):
+    values = [0, 1, -1, 255, -256, 2 ** 63, -(2 ** 100), 10 ** 50]
+    store.put(45, values)
+    terms = store.get("A000045")
+    assert isinstance(terms, BigIntArray)
+    assert len(terms) == len(values)
+    assert terms.tolist() == values
+    assert terms[-1] == 10 ** 50
+    assert terms[2:6].tolist() == values[2:6]
+    assert terms[::3] == values[::3]
+    with pytest.raises(IndexError):
+        terms[len(values)]
+
+
+def test_store_contents(store):
+    assert store.get(1) is None
+    assert 1 not in store
+    store.put(1, [1, 1, 1])
+    assert 1 in store
+    store.put(1, [2, 2])
+    assert store.get(1).tolist() == [2, 2]
+    store.delete(1)
+    assert 1 not in store
+
+
+def test_store_factory(store):
+    factory = oeis.SequenceFactory(store=store)
+    sequence = factory.load("A000045", with_bfile=True)
+    assert sequence.with_bfile
+    assert "A000045" in store
+    assert sequence.sample[:5] == [0, 1, 1, 2, 3]
+    reloaded = oeis.SequenceFactory(store=store).load("A000045", with_bfile=True)
+    assert reloaded.sample == sequence.sample
+    reloaded.sample_append(0)
+    assert reloaded.sample[-1] == 0
+    assert store.get(45).tolist() == sequence.sample
+
+
+def test_store_backed_terms(store):
+    values = [2 ** 62 + n for n in range(10)]
+    store.put(1, values)
+    sequence = Sequence(1, meta=Box(number=1, offset="0,1", keyword="fini,full"))
+    sequence.sample_attach(store.get(1))
+    assert type(sequence[3]) is int
+    assert sequence[3] * 4 == values[3] * 4
+    assert all(type(term) is int for term in sequence[2:6])
+    assert list(sequence[2:6]) == values[2:6]
+    assert type(sequence.sample) is list
+    assert sequence.sample is sequence.sample
+    assert sequence.sample == values
+    sequence.sample_append(0)
+    assert sequence.sample == values + [0]
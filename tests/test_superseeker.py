@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*- #
+#
+# tests/test_superseeker.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Test Local Superseeker.
+
+"""
+
+# -------------- External Library -------------- #
+
+import pytest
+
+# ---------------- oeis Library ---------------- #
+
+from oeis.search import SearchIndex
+from oeis.superseeker import Superseeker, superseek
+
+
+RECORDS = (
+    (27, "The positive integers.", "1,2,3,4,5,6,7,8,9,10,11,12"),
+    (41, "Partition numbers.", "1,1,2,3,5,7,11,15,22,30,42,56"),
+    (45, "Fibonacci numbers.", "0,1,1,2,3,5,8,13,21,34,55,89"),
+    (79, "Powers of 2.", "1,2,4,8,16,32,64,128,256"),
+)
+
+
+@pytest.fixture()
+def path(tmp_path):
+    path = tmp_path / "index.npz"
+    SearchIndex.build(RECORDS).save(path)
+    return path
+
+
+def test_superseeker_chains(path):
+    seeker = Superseeker(path, bank={"a": None, "b": None}, depth=2)
+    chains = seeker.chains()
+    assert chains[:3] == [(), ("a",), ("b",)]
+    assert chains[3:] == [("a", "a"), ("a", "b"), ("b", "a"), ("b", "b")]
+
+
+def test_superseeker_seek(path):
+    with Superseeker(path, processes=0) as seeker:
+        exact = seeker.seek("3,5,8,13,21")
+        assert exact[0].number == 45
+        assert exact[0].transforms == ()
+        assert seeker.seek([6, 10, 16, 26, 42])[0].transforms == ("divide_gcd",)
+        triangular = seeker.seek([1, 3, 6, 10, 15, 21, 28])
+        assert (27, ("differences",)) in {(m.number, m.transforms) for m in triangular}
+        ones = seeker.seek([1] * 10, limit=3)
+        assert (41, ("euler_transform",)) in [(m.number, m.transforms) for m in ones]
+        assert seeker.seek([1, 2]) == []
+
+
+def test_superseeker_pool(path):
+    matches = superseek([-1, -2, -4, -8, -16], path, processes=2)
+    assert [(m.number, m.transforms) for m in matches][0] == (79, ("negate",))
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*- #
+#
+# tests/test_terms.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Test Term Arrays.
+
+"""
+
+# -------------- Standard Library -------------- #
+
+import pickle
+
+# -------------- External Library -------------- #
+
+import numpy
+import pytest
+
+# ---------------- oeis Library ---------------- #
+
+from oeis.terms import BigIntArray, TermArray, load_terms, parse_int
+
+
+def test_term_array_dtype():
+    assert TermArray([1, 2, 3]).dtype == numpy.int64
+    assert TermArray([1, 2 ** 64]).dtype == object
+    assert TermArray([1, 2 ** 64])[1] == 2 ** 64
+    assert TermArray.from_tokens(["-5", "999999999999999999"]).dtype == numpy.int64
+    assert TermArray.from_tokens(["1", "18446744073709551616"]).tolist() == [1, 2 ** 64]
+
+
+def test_term_array_offset():
+    array = TermArray(range(10), offset=3)
+    assert array.offset == 3
+    assert array.at(3) == 0
+    assert array.at(12) == 9
+    assert array.at(slice(5, 8)).tolist() == [2, 3, 4]
+    assert array.at(slice(10, None, 2)).tolist() == [7, 9]
+    with pytest.raises(IndexError):
+        array.at(2)
+    assert array[2:].offset == 3
+    assert (array + 1).offset == 3
+    loaded = pickle.loads(pickle.dumps(array))
+    assert isinstance(loaded, TermArray)
+    assert loaded.offset == 3
+    assert loaded.tolist() == list(range(10))
+
+
+def test_load_terms():
+    lines = ["# comment", "1 5", "2 -6 # inline", "", "3 7"]
+    assert load_terms(lines).tolist() == [5, -6, 7]
+    assert load_terms(lines).dtype == numpy.int64
+    big = load_terms(["0 1", "1 {}".format(10 ** 30)], offset=2)
+    assert big.dtype == object
+    assert big.tolist() == [1, 10 ** 30]
+    assert big.offset == 2
+    assert len(load_terms([])) == 0
+
+
+def test_parse_int():
+    assert parse_int("-42") == -42
+    assert parse_int("9" * 10000) == 10 ** 10000 - 1
+    assert parse_int("-" + "1" * 9999) == -(10 ** 9999 - 1) // 9
+
+
+def test_big_int_array():
+    values = [0, -1, 255, -(2 ** 70), 3 ** 500, 10 ** 10000 - 1]
+    array = BigIntArray(values, offset=2)
+    assert len(array) == len(values)
+    assert array.tolist() == values
+    assert array[-2] == 3 ** 500
+    assert array[1:4].tolist() == values[1:4]
+    assert array[1:4].offset == 2
+    assert array[::2] == values[::2]
+    assert array.nbytes < 10000
+    assert numpy.asarray(array[:3]).tolist() == values[:3]
+    with pytest.raises(IndexError):
+        array[len(values)]
+    assert BigIntArray.from_tokens(["1", "-2", "3" * 5000]).tolist() == [
+        1,
+        -2,
+        parse_int("3" * 5000),
+    ]
+
+
+def test_big_int_array_pickle():
+    array = BigIntArray([2 ** k for k in range(0, 2000, 7)])
+    for view in (array, array[100:200]):
+        loaded = pickle.loads(pickle.dumps(view))
+        assert isinstance(loaded, BigIntArray)
+        assert loaded.tolist() == view.tolist()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*- #
+#
+# tests/test_transforms.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Test Sequence Transforms.
+
+"""
+
+# -------------- External Library -------------- #
+
+import numpy
+
+# ---------------- oeis Library ---------------- #
+
+from oeis.terms import TermArray
+from oeis.transforms import *
+
+
+NATURALS = TermArray(range(1, 13))
+
+
+ONES = TermArray([1] * 12)
+
+
+def test_partial_sums_differences():
+    assert partial_sums(NATURALS).tolist()[:5] == [1, 3, 6, 10, 15]
+    assert differences(partial_sums(NATURALS)).tolist() == NATURALS.tolist()[1:]
+    assert partial_sums(TermArray([2 ** 62, 2 ** 62])).tolist() == [2 ** 62, 2 ** 63]
+
+
+def test_binomial_transform():
+    assert binomial_transform(ONES).tolist() == [2 ** n for n in range(12)]
+    big = binomial_transform(TermArray([1] * 100))
+    assert big.dtype == object
+    assert big[-1] == 2 ** 99
+
+
+def test_euler_transform():
+    partitions = [1, 2, 3, 5, 7, 11, 15, 22, 30, 42, 56, 77]
+    assert euler_transform(ONES).tolist() == partitions
+    assert euler_transform(NATURALS).tolist()[:7] == [1, 3, 6, 13, 24, 48, 86]
+
+
+def test_mobius_transform():
+    assert mobius_transform(ONES).tolist() == [1] + [0] * 11
+    totients = [1, 1, 2, 2, 4, 2, 6, 4, 6, 4, 10, 4]
+    assert mobius_transform(NATURALS).tolist() == totients
+
+
+def test_convolve():
+    assert convolve(NATURALS, NATURALS).tolist()[:4] == [1, 4, 10, 20]
+    assert len(convolve(NATURALS, ONES[:5])) == 5
+    assert len(convolve(NATURALS, TermArray())) == 0
+    assert len(convolve([], [])) == 0
+
+
+def test_plain_lists():
+    naturals = NATURALS.tolist()
+    assert partial_sums(naturals).tolist() == partial_sums(NATURALS).tolist()
+    assert differences(naturals).tolist() == [1] * 11
+    assert binomial_transform([1, 1, 1]).tolist() == [1, 2, 4]
+    assert mobius_transform(naturals).tolist() == mobius_transform(NATURALS).tolist()
+    assert convolve([1, 1], [1, 1]).tolist() == [1, 2]
+    assert add(naturals, [1] * 12).tolist() == list(range(2, 14))
+    assert multiply([2 ** 70], numpy.int64(2))[0] == 2 ** 71
+
+
+def test_elementwise():
+    assert add(NATURALS, ONES).tolist() == list(range(2, 14))
+    assert subtract(NATURALS, 1).tolist() == list(range(12))
+    assert multiply(NATURALS[:3], NATURALS[:2]).tolist() == [1, 4]
+    product = multiply(TermArray([2 ** 40]), TermArray([2 ** 40]))
+    assert product.dtype == object
+    assert product[0] == 2 ** 80
+    assert add(ONES, 2 ** 70)[0] == 2 ** 70 + 1
+    assert multiply(ONES, 3).dtype == numpy.int64
@@ -31,6 +31,12 @@ Test OEIS Utilities.
 
 """
 
+# -------------- Standard Library -------------- #
+
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 # -------------- External Library -------------- #
 
 import pytest
@@ -148,3 +154,80 @@ def test_boxobject():
 
 def test_subset_box():
     assert True
+
+
+def test_single_flight():
+    flight, calls = SingleFlight(), []
+
+    def slow(x):
+        calls.append(x)
+        time.sleep(0.1)
+        return x
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: flight.do("key", slow, 1), range(8)))
+    assert results == [1] * 8
+    assert calls == [1]
+    assert flight.do("key", slow, 2) == 2
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: flight.do("key", slow, [3]), range(4)))
+    assert results == [[3]] * 4
+    assert len({id(r) for r in results}) == 1
+    flight = SingleFlight(copy=True)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: flight.do("key", slow, [3]), range(4)))
+    assert results == [[3]] * 4
+    assert len({id(r) for r in results}) == 4
+
+
+def test_single_flight_exception():
+    with pytest.raises(KeyError):
+        SingleFlight().do("key", loud_key_error)
+
+
+def loud_key_error():
+    raise KeyError
+
+
+def test_async_single_flight():
+    flight, calls = AsyncSingleFlight(), []
+
+    async def slow(x):
+        calls.append(x)
+        await asyncio.sleep(0.05)
+        return x
+
+    async def run():
+        return await asyncio.gather(*(flight.do("key", slow, 1) for _ in range(8)))
+
+    assert asyncio.run(run()) == [1] * 8
+    assert calls == [1]
+
+
+def test_generator_cursor():
+    produced, starts = [], []
+
+    def naturals():
+        starts.append(len(produced))
+        n = 0
+        while True:
+            produced.append(n)
+            yield n
+            n += 1
+
+    cursor = GeneratorCursor(naturals, window=8)
+    assert [cursor.term(p) for p in range(20)] == list(range(20))
+    assert len(produced) == 20
+    assert cursor.term(15) == 15
+    assert list(cursor(18, 24, 2)) == [18, 20, 22]
+    assert len(starts) == 1
+    assert cursor.term(2) == 2
+    assert len(starts) == 2
+
+
+def test_generator_cursor_exhausted():
+    cursor = GeneratorCursor(lambda: iter(range(5)))
+    assert list(cursor(3)) == [3, 4]
+    assert list(cursor(0, 10, 3)) == [0, 3]
+    with pytest.raises(IndexError):
+        cursor.term(5)